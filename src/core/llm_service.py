@@ -284,6 +284,16 @@ def infer_problem_category(
 # CONTEXT BUILDER FUNCTION
 # ============================================================================
 
+# Context sentence for each normalized quantum experience category
+EXPERIENCE_CONTEXT = {
+    "active": "Tiene experiencia activa en proyectos cuánticos",
+    "exploration": "Está en etapa de exploración o piloto",
+    "academic": "Solo interés académico o general",
+    "interested": "Interesado en iniciar",
+    "industry_interest": "Interesado en aplicaciones industriales",
+}
+
+
 def build_contextual_text(
     event_expectations: Optional[str] = None,
     quantum_experience: Optional[str] = None,
@@ -322,14 +332,7 @@ def build_contextual_text(
     
     # Add quantum experience context
     if quantum_experience:
-        experience_map = {
-            "active": "Tiene experiencia activa en proyectos cuánticos",
-            "exploration": "Está en etapa de exploración o piloto",
-            "academic": "Solo interés académico o general",
-            "interested": "Interesado en iniciar",
-            "industry_interest": "Interesado en aplicaciones industriales",
-        }
-        exp_text = experience_map.get(quantum_experience, f"Experiencia: {quantum_experience}")
+        exp_text = EXPERIENCE_CONTEXT.get(quantum_experience, f"Experiencia: {quantum_experience}")
         context_parts.append(exp_text)
     
     # Add interests context
@@ -0,0 +1,98 @@
+"""
+Arrow-backed CSV reading for the extract step.
+
+pd.read_csv parses every column of the survey export with the C parser and
+stores the Spanish free-text answers as object columns (one Python string
+per cell). read_csv_columns parses the file with pyarrow's multi-threaded
+CSV reader instead:
+
+- Only the requested columns are converted; the others ("Preferencia de
+  comida", "Column 12", ...) are skipped by the parser and never
+  materialized
+- Every column is read as a string, without type inference (pd.read_csv
+  infers numbers and pandas' pyarrow engine would parse timestamps), and
+  becomes a string[pyarrow] column backed by the Arrow buffers
+- Cells matching pd.read_csv's default NA values are missing, as with
+  pd.read_csv
+
+pd.read_csv(engine='pyarrow', dtype='string[pyarrow]') gives the same
+frame but round-trips the strings through Python objects, which makes it
+slower than the C parser.
+
+Requires pyarrow (a project dependency, installed by `uv sync`).
+
+Usage:
+    df = read_csv_columns(csv_file, ['Nombre completo', 'Correo electrónico'])
+"""
+
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+from src.core.logger import get_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+    pa_csv = None
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Default na_values of pd.read_csv
+NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+
+def require_pyarrow() -> None:
+    """
+    Check that pyarrow is installed.
+
+    Raises:
+        ImportError: If pyarrow is not available
+    """
+    if pa is None:
+        raise ImportError(
+            "The Arrow CSV reader and the staging cache require pyarrow. Install the project dependencies with: uv sync"
+        )
+
+
+def read_csv_columns(csv_file: Path, columns: List[str]) -> pd.DataFrame:
+    """
+    Read some columns of a CSV file as Arrow-backed strings.
+
+    Args:
+        csv_file: Path to the CSV file
+        columns: Columns to read; those missing from the file are ignored
+
+    Returns:
+        DataFrame with the requested columns present in the file, in file
+        order, all of dtype string[pyarrow]
+
+    Raises:
+        ValueError: If the file has none of the columns
+    """
+    require_pyarrow()
+    header = pd.read_csv(csv_file, nrows=0).columns
+    wanted = set(columns)
+    present = [col for col in header if col in wanted]
+    if not present:
+        raise ValueError(f"{csv_file} has none of the expected columns")
+    logger.debug(f"Reading {len(present)} of {len(header)} CSV columns")
+
+    table = pa_csv.read_csv(
+        csv_file,
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=present,
+            column_types={col: pa.string() for col in present},
+            null_values=NULL_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+    string_dtype = pd.StringDtype('pyarrow')
+    return table.to_pandas(types_mapper={pa.string(): string_dtype}.get)
@@ -0,0 +1,362 @@
+"""
+Asyncio loader for the Quantum Network Knowledge Graph.
+
+The synchronous loaders get concurrency from threads ('parallel' mode).
+This loader uses the async Neo4j driver instead: a single event loop keeps
+up to `concurrency` batch transactions in flight over one connection pool,
+so the client never waits for one round trip before sending the next
+batch, without a thread per session.
+
+- Batches use the same UNWIND $rows query as the 'batched' mode
+- Each batch runs in a managed write transaction on its own session; the
+  driver retries transient errors such as deadlocks, and errors that are
+  still retryable get the exponential backoff of execute_write_with_retry
+- A failing batch is bisected to isolate the bad rows, like the sync path
+- A semaphore bounds the number of batches in flight, and new batches are
+  only prepared when a slot is free
+
+Usage (through the pipeline, which keeps one AsyncLoader per run):
+    run_etl_pipeline(load_mode='async', batch_size=100, workers=8)
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+from neo4j import AsyncDriver, AsyncGraphDatabase
+from neo4j.exceptions import DriverError, Neo4jError
+
+from src.core.logger import get_logger
+from src.pipeline.etl_to_graph import (
+    DEADLOCK_ERROR_CODE,
+    WRITE_BACKOFF_MULTIPLIER,
+    WRITE_INITIAL_BACKOFF_SECONDS,
+    WRITE_MAX_RETRIES,
+    BatchBisection,
+    accumulate_counters,
+    count_write_attempts,
+    generate_cypher_query,
+    is_row_error,
+    iter_batches,
+    prepare_row_for_neo4j,
+    record_row_errors,
+    summary_counters,
+    write_retry_delay,
+)
+from src.pipeline.load_metrics import record_write
+from src.pipeline.validation import QuarantineFile
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Default number of batch transactions in flight
+DEFAULT_ASYNC_CONCURRENCY = 4
+
+
+# ============================================================================
+# WRITES
+# ============================================================================
+
+async def _async_write_transaction(
+    tx: Any,
+    query: str,
+    params: Dict[str, Any],
+    attempts: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Async counterpart of the sync transaction function (counts retries and timings)."""
+    attempts['calls'] += 1
+    try:
+        result = await tx.run(query, **params)
+        summary = await result.consume()
+    except Neo4jError as e:
+        if e.code == DEADLOCK_ERROR_CODE:
+            attempts['deadlocks'] += 1
+        raise
+    attempts['available_after'] = summary.result_available_after
+    attempts['consumed_after'] = summary.result_consumed_after
+    return summary_counters(summary)
+
+
+async def async_insert_batch(
+    driver: AsyncDriver,
+    rows: List[Dict[str, Any]],
+    stats: Dict[str, Any],
+    derived_edges: bool = True,
+    max_retries: int = WRITE_MAX_RETRIES,
+    initial_backoff: float = WRITE_INITIAL_BACKOFF_SECONDS,
+    backoff_multiplier: float = WRITE_BACKOFF_MULTIPLIER
+) -> Dict[str, Any]:
+    """
+    Write one batch in a managed write transaction on its own session.
+
+    Async counterpart of execute_write_with_retry: errors that are still
+    retryable after the driver gave up are retried after a backoff (see
+    write_retry_delay), and the same retry counters are kept in stats.
+
+    Args:
+        driver: Neo4j AsyncDriver
+        rows: List of dictionaries with normalized row data
+        stats: Pipeline statistics dictionary (retry counters and load metrics)
+        derived_edges: If False, steps 8-9 of the template are skipped
+        max_retries: Maximum number of retries after a retryable error
+        initial_backoff: Seconds to wait before the first retry
+        backoff_multiplier: Factor applied to the wait after every retry
+
+    Returns:
+        Execution result with counters
+    """
+    query = generate_cypher_query(batched=True, derived_edges=derived_edges)
+    started = time.perf_counter()
+    retry = 0
+    while True:
+        attempts = {'calls': 0, 'deadlocks': 0}
+        try:
+            async with driver.session() as session:
+                counters = await session.execute_write(
+                    _async_write_transaction, query, {'rows': rows}, attempts
+                )
+            record_write(
+                stats, len(rows), time.perf_counter() - started,
+                attempts.get('available_after'), attempts.get('consumed_after')
+            )
+            return counters
+        except (Neo4jError, DriverError) as e:
+            delay = write_retry_delay(
+                e, retry, stats, max_retries, initial_backoff, backoff_multiplier
+            )
+            if delay is None:
+                record_write(stats, len(rows), time.perf_counter() - started, failed=True)
+                raise
+            retry += 1
+            await asyncio.sleep(delay)
+        except Exception:
+            record_write(stats, len(rows), time.perf_counter() - started, failed=True)
+            raise
+        finally:
+            count_write_attempts(stats, attempts)
+
+
+async def async_write_with_bisection(
+    write_batch: Callable[[List[Dict[str, Any]]], Awaitable[Dict[str, Any]]],
+    indexed_rows: List[Tuple[Any, Dict[str, Any]]],
+    stats: Dict[str, Any]
+) -> Tuple[Dict[str, int], List[Tuple[Any, Dict[str, Any], str]]]:
+    """
+    Async counterpart of write_with_bisection (only row errors are bisected,
+    see is_row_error).
+
+    Args:
+        write_batch: Coroutine function that writes a list of rows and returns counters
+        indexed_rows: Pairs of (source row index, row data)
+        stats: Statistics dictionary (updated in place)
+
+    Returns:
+        Tuple of (aggregated counters of successful writes,
+                  list of (row_index, row_data, error) for rows that failed)
+
+    Raises:
+        DriverError, Neo4jError: If the database is unavailable
+    """
+    bisection = BatchBisection(indexed_rows, stats)
+    while bisection.pending:
+        rows = bisection.next_rows()
+        try:
+            bisection.succeeded(await write_batch(rows))
+        except Exception as e:
+            if not is_row_error(e):
+                raise
+            bisection.split(e)
+
+    return bisection.counters, bisection.failed
+
+
+# ============================================================================
+# LOADER
+# ============================================================================
+
+async def load_records_async(
+    driver: AsyncDriver,
+    records: Iterable[Tuple[Any, Dict[str, Any]]],
+    batch_size: int,
+    concurrency: int,
+    stats: Dict[str, Any],
+    derived_edges: bool = True,
+    quarantine: Optional[QuarantineFile] = None
+) -> None:
+    """
+    Load prepared rows with up to `concurrency` batches in flight.
+
+    Statistics have the same layout as load_batches_to_neo4j (rows_processed,
+    batches_processed, batches_with_errors, load_counters, errors). A
+    database outage (see is_row_error) stops new batches from starting and
+    is raised once the batches in flight have finished.
+
+    Args:
+        driver: Neo4j AsyncDriver
+        records: Pairs of (source row index, output of prepare_row_for_neo4j)
+        batch_size: Number of rows per batch
+        concurrency: Maximum number of batch transactions in flight
+        stats: Pipeline statistics dictionary (updated in place)
+        derived_edges: If False, steps 8-9 of the template are skipped
+        quarantine: Quarantine file the failed rows are written to (see
+                    record_row_errors)
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+    load_counters = stats.setdefault('load_counters', {})
+    semaphore = asyncio.Semaphore(concurrency)
+    # Set when the database is unavailable: no further batch is started
+    outage: List[Exception] = []
+
+    async def write(batch: List[Tuple[Any, Dict[str, Any]]]) -> None:
+        try:
+            counters, failed = await async_write_with_bisection(
+                lambda rows: async_insert_batch(driver, rows, stats, derived_edges),
+                batch, stats
+            )
+        except Exception as e:
+            outage.append(e)
+            raise
+        finally:
+            semaphore.release()
+
+        # Runs on the event loop thread, so no locking is needed
+        accumulate_counters(load_counters, counters)
+        stats['rows_processed'] += len(batch) - len(failed)
+        if len(failed) < len(batch):
+            stats['batches_processed'] = stats.get('batches_processed', 0) + 1
+        if failed:
+            stats['batches_with_errors'] = stats.get('batches_with_errors', 0) + 1
+            stats['rows_with_errors'] += len(failed)
+            record_row_errors(stats, failed, quarantine)
+
+    tasks = []
+    for batch in iter_batches(records, batch_size):
+        # Wait for a free slot before preparing the next batch
+        await semaphore.acquire()
+        if outage:
+            semaphore.release()
+            break
+        tasks.append(asyncio.create_task(write(batch)))
+    # Every batch in flight finishes (and is counted) before an outage is raised
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if outage:
+        raise outage[0]
+
+    logger.info(
+        f"Async load finished: {len(tasks)} batches, "
+        f"{stats['rows_processed']} rows total (concurrency {concurrency})"
+    )
+
+
+class AsyncLoader:
+    """
+    Async driver and event loop shared by every load of a pipeline run.
+
+    The driver (one connection pool) is created on the loop when the loader
+    is entered and closed on exit, so a chunked load does not open a new
+    pool and event loop per chunk.
+
+    Usage:
+        with AsyncLoader(uri, user, password) as loader:
+            for df_chunk in chunks:
+                loader.load(df_chunk, batch_size, concurrency, stats)
+    """
+
+    def __init__(self, neo4j_uri: str, neo4j_user: str, neo4j_password: str) -> None:
+        """
+        Args:
+            neo4j_uri: Neo4j connection URI
+            neo4j_user: Neo4j username
+            neo4j_password: Neo4j password
+        """
+        self.neo4j_uri = neo4j_uri
+        self.auth = (neo4j_user, neo4j_password)
+        self.driver: Optional[AsyncDriver] = None
+        self._runner: Optional[asyncio.Runner] = None
+
+    def __enter__(self) -> 'AsyncLoader':
+        self._runner = asyncio.Runner()
+
+        async def open_driver() -> AsyncDriver:
+            return AsyncGraphDatabase.driver(self.neo4j_uri, auth=self.auth)
+
+        try:
+            self.driver = self._runner.run(open_driver())
+        except Exception:
+            self._runner.close()
+            raise
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        try:
+            self._runner.run(self.driver.close())
+        finally:
+            self._runner.close()
+            self.driver = None
+            self._runner = None
+
+    def load(
+        self,
+        df_transformed: pd.DataFrame,
+        batch_size: int,
+        concurrency: int,
+        stats: Dict[str, Any],
+        derived_edges: bool = True,
+        quarantine: Optional[QuarantineFile] = None
+    ) -> None:
+        """
+        Load a transformed DataFrame with load_records_async (blocks until done).
+
+        Args:
+            df_transformed: Transformed DataFrame (output of transform_dataframe)
+            batch_size: Number of rows per batch
+            concurrency: Maximum number of batch transactions in flight
+            stats: Pipeline statistics dictionary (updated in place)
+            derived_edges: If False, steps 8-9 of the template are skipped
+            quarantine: Quarantine file the failed rows are written to
+        """
+        if self._runner is None:
+            raise RuntimeError("AsyncLoader must be entered before loading")
+        records = (
+            (idx, prepare_row_for_neo4j(row)) for idx, row in df_transformed.iterrows()
+        )
+        self._runner.run(load_records_async(
+            self.driver, records, batch_size, concurrency, stats, derived_edges, quarantine
+        ))
+
+
+def load_async_to_neo4j(
+    neo4j_uri: str,
+    neo4j_user: str,
+    neo4j_password: str,
+    df_transformed: pd.DataFrame,
+    batch_size: int,
+    concurrency: int,
+    stats: Dict[str, Any],
+    derived_edges: bool = True,
+    quarantine: Optional[QuarantineFile] = None
+) -> None:
+    """
+    Load a transformed DataFrame with the async driver (blocking entry point).
+
+    Opens an AsyncLoader for the duration of the call. The pipeline keeps
+    one AsyncLoader for the whole run instead.
+
+    Args:
+        neo4j_uri: Neo4j connection URI
+        neo4j_user: Neo4j username
+        neo4j_password: Neo4j password
+        df_transformed: Transformed DataFrame (output of transform_dataframe)
+        batch_size: Number of rows per batch
+        concurrency: Maximum number of batch transactions in flight
+        stats: Pipeline statistics dictionary (updated in place)
+        derived_edges: If False, steps 8-9 of the template are skipped
+        quarantine: Quarantine file the failed rows are written to
+    """
+    with AsyncLoader(neo4j_uri, neo4j_user, neo4j_password) as loader:
+        loader.load(
+            df_transformed, batch_size, concurrency, stats, derived_edges, quarantine
+        )
@@ -0,0 +1,145 @@
+"""
+Benchmark of the sync batched loader against the asyncio loader.
+
+Both loaders write the same prepared rows, taken from a load recording
+(see load_recording), so the benchmark measures only Neo4j write time: no
+transform and no LLM calls. Every configuration runs `repeat` times; the
+table reports the best wall-clock rows/sec and the p95 batch latency of
+that run.
+
+WARNING: rows are MERGEd into the configured database. Run it against a
+test or staging database. The first run creates the nodes; later runs
+measure the update path.
+
+Usage:
+    python src/pipeline/benchmark_load_modes.py data/load_params.jsonl.gz \\
+        [--batch-size 100] [--concurrency 1 4 8] [--repeat 3] [--output report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from neo4j import AsyncGraphDatabase
+
+from src.config.conf import settings
+from src.core.logger import get_logger
+from src.pipeline.async_loader import load_records_async
+from src.pipeline.etl_to_graph import (
+    close_driver,
+    create_driver,
+    get_session,
+    load_records_in_batches,
+)
+from src.pipeline.load_metrics import summarize_load_metrics
+from src.pipeline.load_recording import read_load_recording
+
+# Initialize logger
+logger = get_logger(__name__)
+
+
+def _new_stats() -> Dict[str, Any]:
+    return {'rows_processed': 0, 'rows_with_errors': 0, 'errors': []}
+
+
+def _result(mode: str, concurrency: int, seconds: float, stats: Dict[str, Any]) -> Dict[str, Any]:
+    metrics = summarize_load_metrics(stats.get('load_metrics', {}))
+    return {
+        'mode': mode,
+        'concurrency': concurrency,
+        'seconds': seconds,
+        'rows': stats['rows_processed'],
+        'rows_with_errors': stats['rows_with_errors'],
+        'rows_per_second': stats['rows_processed'] / seconds if seconds > 0 else None,
+        'p95_latency_ms': metrics['latency_ms']['p95'],
+        'deadlock_retries': stats.get('deadlock_retries', 0),
+    }
+
+
+def run_sync(records: List[Tuple[Any, Dict[str, Any]]], batch_size: int) -> Dict[str, Any]:
+    """Load the records with the sync batched loader."""
+    driver = create_driver(
+        settings.NEO4J_URI, settings.NEO4J_USER, settings.NEO4J_QUANTUM_NETWORK_AURA
+    )
+    stats = _new_stats()
+    try:
+        with get_session(driver) as session:
+            started = time.perf_counter()
+            load_records_in_batches(session, records, batch_size, stats)
+            seconds = time.perf_counter() - started
+    finally:
+        close_driver(driver)
+    return _result('batched', 1, seconds, stats)
+
+
+def run_async(
+    records: List[Tuple[Any, Dict[str, Any]]],
+    batch_size: int,
+    concurrency: int
+) -> Dict[str, Any]:
+    """Load the records with the asyncio loader."""
+    stats = _new_stats()
+
+    async def run() -> float:
+        driver = AsyncGraphDatabase.driver(
+            settings.NEO4J_URI,
+            auth=(settings.NEO4J_USER, settings.NEO4J_QUANTUM_NETWORK_AURA)
+        )
+        try:
+            started = time.perf_counter()
+            await load_records_async(driver, records, batch_size, concurrency, stats)
+            return time.perf_counter() - started
+        finally:
+            await driver.close()
+
+    seconds = asyncio.run(run())
+    return _result('async', concurrency, seconds, stats)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('recording', help="Load recording (gzip JSONL) to write")
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="Optional JSON file for the results")
+    args = parser.parse_args()
+
+    records = list(read_load_recording(Path(args.recording)))
+    logger.info(f"Benchmarking with {len(records)} recorded rows, batch size {args.batch_size}")
+
+    configurations = [('batched', 1)] + [('async', level) for level in args.concurrency]
+    results = []
+    for mode, concurrency in configurations:
+        runs = []
+        for _ in range(args.repeat):
+            if mode == 'batched':
+                runs.append(run_sync(records, args.batch_size))
+            else:
+                runs.append(run_async(records, args.batch_size, concurrency))
+        results.append(max(runs, key=lambda run: run['rows_per_second'] or 0))
+
+    logger.info(f"{'mode':<8} {'conc.':>5} {'rows/s':>10} {'p95 ms':>8} {'errors':>7}")
+    for result in results:
+        logger.info(
+            f"{result['mode']:<8} {result['concurrency']:>5} "
+            f"{result['rows_per_second'] or 0:>10.1f} {result['p95_latency_ms'] or 0:>8.1f} "
+            f"{result['rows_with_errors']:>7}"
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark of the vectorized transform engine against the per-cell functions.
+
+Writes a synthetic survey CSV (default 1,000,000 rows) built from the
+shapes of real answers, reads it back and times normalize_dataframe with
+both engines (steps 1-8, without the LLM inference). With --workers, the
+vectorized engine is also timed across a process pool (see
+parallel_transform). The outputs are compared with
+pandas.testing.assert_frame_equal before the timings are reported.
+
+Usage:
+    python src/pipeline/benchmark_transform.py [--rows 1000000] [--csv data/synthetic.csv] \\
+        [--repeat 1] [--workers 4] [--output report.json]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.core.logger import get_logger
+from src.pipeline.etl_to_graph import TRANSFORM_ENGINES, normalize_dataframe
+from src.pipeline.parallel_transform import ParallelTransformer
+
+# Initialize logger
+logger = get_logger(__name__)
+
+_INTERESTS = [
+    'Investigación académica', 'Casos de uso en Finanzas', 'Desarrollo de software / algoritmos',
+    'Hardware cuántico', 'Quantum Machine Learning', 'Criptografía post-cuántica',
+]
+_EXPERIENCE = [
+    'Sí, actualmente en proyectos activos', 'Sí, en etapa de exploración / piloto',
+    'No, solo como interés académico / general', 'No, pero me interesa iniciar',
+    'No, pero me interesa entender su aplicación potencial en la industria', '',
+]
+_EXPECTATIONS = [
+    'Conocer más sobre aplicaciones', 'Networking y contactos clave', 'Ideas para implementar',
+    'Entender la madurez de la tecnología', '', 'Actualización',
+]
+_SECTORS = ['Tecnología', 'Finanzas', 'Academia', 'Gobierno', ' Salud ', '']
+_FOOD = ['Sin restricciones', 'Vegetariano', 'Vegano', 'Sin TACC', '']
+
+
+def write_synthetic_csv(path: Path, rows: int, seed: int = 7) -> None:
+    """
+    Write a synthetic survey CSV with the original column names.
+
+    Args:
+        path: Target CSV file
+        rows: Number of rows
+        seed: Random seed (the file is reproducible)
+    """
+    rng = random.Random(seed)
+
+    def linkedin(i: int) -> str:
+        return rng.choice([
+            f'https://www.linkedin.com/in/user{i}/', f'linkedin.com/in/user{i}',
+            f'user{i}', '', f'http://linkedin.com/in/user{i}?trk=x',
+        ])
+
+    df = pd.DataFrame({
+        'Timestamp': ['2024-01-01 10:00:00'] * rows,
+        'Nombre completo': [f' Person {i} ' for i in range(rows)],
+        'Correo electrónico': [f'user{i}@example.com' for i in range(rows)],
+        'Organización / Empresa': [rng.choice(['Tech Corp', ' Quantum Inc ', 'Uni', '']) for _ in range(rows)],
+        'Cargo / Rol': [rng.choice(['CTO', 'Researcher', 'Student', '']) for _ in range(rows)],
+        'Sector al que pertenece su organización': [rng.choice(_SECTORS) for _ in range(rows)],
+        'Interés principal en Computación Cuántica - (Seleccionar una o más)': [
+            ', '.join(rng.sample(_INTERESTS, rng.randint(0, 3))) for _ in range(rows)
+        ],
+        '¿Ha trabajado previamente con tecnologías cuánticas?': [
+            rng.choice(_EXPERIENCE) for _ in range(rows)
+        ],
+        '¿Qué espera obtener de este evento?': [rng.choice(_EXPECTATIONS) for _ in range(rows)],
+        'LinkedIn': [linkedin(i) for i in range(rows)],
+        # Columns the pipeline does not use
+        'Preferencia de comida (para el lunch de cortesía)': [
+            rng.choice(_FOOD) for _ in range(rows)
+        ],
+        '¿Desea recibir novedades e invitaciones a futuros eventos de IBM y QNOW?': [
+            rng.choice(['Sí', 'No', '']) for _ in range(rows)
+        ],
+        'Email confirmación': [f'user{i}@example.com' for i in range(rows)],
+        'Column 12': [''] * rows,
+    })
+    df.to_csv(path, index=False)
+
+
+def time_engine(
+    df: pd.DataFrame,
+    engine: str,
+    repeat: int,
+    normalize: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+) -> Dict[str, Any]:
+    """Time normalize_dataframe with one engine (best of `repeat` runs)."""
+    normalize = normalize or (lambda frame: normalize_dataframe(frame, engine=engine))
+    best = None
+    output = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = normalize(df)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return {'engine': engine, 'seconds': best, 'rows_per_second': len(df) / best, 'output': output}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--csv', help="CSV to use; written with --rows synthetic rows if missing")
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Also time the vectorized engine across this many processes")
+    parser.add_argument('--output', help="Optional JSON file for the results")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_file = Path(args.csv) if args.csv else Path(tmp_dir) / 'synthetic.csv'
+        if not csv_file.exists():
+            logger.info(f"Writing {args.rows} synthetic rows to {csv_file}")
+            write_synthetic_csv(csv_file, args.rows)
+        df = pd.read_csv(csv_file)
+
+    results = [time_engine(df, engine, args.repeat) for engine in TRANSFORM_ENGINES]
+    if args.workers > 1:
+        with ParallelTransformer(args.workers) as transformer:
+            results.append(time_engine(
+                df, f'vectorized x{args.workers} processes', args.repeat, transformer.normalize
+            ))
+    for result in results[1:]:
+        pd.testing.assert_frame_equal(results[0]['output'], result['output'])
+    for result in results:
+        del result['output']
+
+    baseline = next(r for r in results if r['engine'] == 'python')
+    for result in results:
+        result['speedup'] = baseline['seconds'] / result['seconds']
+        logger.info(
+            f"{result['engine']:<26} {result['seconds']:>8.2f}s "
+            f"{result['rows_per_second']:>12.0f} rows/s  x{result['speedup']:.1f}"
+        )
+    logger.info(f"Outputs identical for {len(df)} rows")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'rows': len(df), 'results': results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
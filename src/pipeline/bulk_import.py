@@ -0,0 +1,243 @@
+"""
+Offline bulk-import artifacts for the Quantum Network Knowledge Graph.
+
+For first-time loads and disaster-recovery rebuilds, Neo4j's offline
+importer (`neo4j-admin database import full`) is much faster than
+MERGE-based Cypher. This module turns the output of transform_dataframe
+into node and relationship CSV files in the importer's header format:
+
+    nodes:          name:ID(Domain),created_at:datetime,:LABEL
+    relationships:  :START_ID(Person),:END_ID(Domain),created_at:datetime,:TYPE
+
+Each label has its own ID space, so an Organization and a Domain with the
+same name never collide. Node IDs are deduplicated and relationship rows
+are distinct, so the import needs no --skip-duplicate-nodes flag.
+
+Usage:
+    python src/pipeline/bulk_import.py [output_dir] [staging_cache_dir]
+
+With a staging cache directory, the transformed frame cached by a previous
+ETL run on the same CSV is reused instead of transforming again.
+
+The target database must be empty (or will be replaced); the offline
+importer does not merge into an existing graph.
+"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.core.logger import get_logger
+from src.pipeline.etl_to_graph import build_load_records, build_phase_frames
+
+# Initialize logger
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# FILE LAYOUT
+# ============================================================================
+
+# Node files: phase frame -> (file name, label, ID column, property columns)
+NODE_FILES = {
+    'persons': ('persons.csv', 'Person', 'email', [
+        'name', 'role', 'linkedin_url', 'quantum_experience', 'event_expectations',
+    ]),
+    'organizations': ('organizations.csv', 'Organization', 'name', ['industry_sector']),
+    'domains': ('domains.csv', 'Domain', 'name', []),
+    'problems': ('problems.csv', 'Problem', 'name', []),
+}
+
+# Relationship files: phase frame -> (file name, type,
+#                                     (start column, start ID space),
+#                                     (end column, end ID space), property columns,
+#                                     optionally typed as "column:type")
+RELATIONSHIP_FILES = {
+    'works_at': ('works_at.csv', 'WORKS_AT',
+                 ('email', 'Person'), ('organization', 'Organization'), []),
+    'has_interest': ('has_interest.csv', 'HAS_INTEREST',
+                     ('email', 'Person'), ('domain', 'Domain'), []),
+    'has_experience_in': ('has_experience_in.csv', 'HAS_EXPERIENCE_IN',
+                          ('email', 'Person'), ('domain', 'Domain'), ['experience_level']),
+    'person_has_problem': ('person_has_problem.csv', 'HAS_PROBLEM',
+                           ('email', 'Person'), ('problem', 'Problem'), []),
+    'organization_has_problem': ('organization_has_problem.csv', 'HAS_PROBLEM',
+                                 ('organization', 'Organization'), ('problem', 'Problem'),
+                                 ['support:int']),
+    'can_be_solved_by': ('can_be_solved_by.csv', 'CAN_BE_SOLVED_BY',
+                         ('problem', 'Problem'), ('domain', 'Domain'), ['support:int']),
+}
+
+
+# ============================================================================
+# DEDUPLICATION
+# ============================================================================
+
+def deduplicate_persons(persons: pd.DataFrame) -> pd.DataFrame:
+    """
+    Collapse repeated registrations into one row per email.
+
+    Mirrors what the MERGE-based load ends up storing: the first registration
+    creates the node (including event_expectations) and later registrations
+    overwrite name, role, linkedin_url and quantum_experience when they have
+    a value (ON MATCH SET ... COALESCE).
+
+    Args:
+        persons: 'persons' phase frame (one row per registration)
+
+    Returns:
+        DataFrame with one row per email
+    """
+    first = persons.drop_duplicates('email', keep='first').set_index('email')
+    overridable = ['name', 'role', 'linkedin_url', 'quantum_experience']
+    latest = persons.groupby('email', sort=False)[overridable].last()
+    first.update(latest)
+    return first.reset_index()
+
+
+# ============================================================================
+# FILE GENERATION
+# ============================================================================
+
+def _write_csv(frame: pd.DataFrame, path: Path) -> None:
+    frame.to_csv(path, index=False, encoding='utf-8')
+
+
+def build_import_command(
+    output_dir: Path,
+    files: Dict[str, Dict[str, Dict[str, Any]]],
+    database: str = 'neo4j'
+) -> str:
+    """
+    Build the neo4j-admin command line that imports the generated files.
+
+    Args:
+        output_dir: Directory with the generated files
+        files: 'nodes' and 'relationships' entries returned by write_bulk_import_files
+        database: Target database name
+
+    Returns:
+        Command line string
+    """
+    parts = ['neo4j-admin database import full', database, '--overwrite-destination']
+    for label, info in files['nodes'].items():
+        parts.append(f"--nodes={label}={output_dir / info['file']}")
+    for info in files['relationships'].values():
+        parts.append(f"--relationships={info['type']}={output_dir / info['file']}")
+    # Free-text answers (event_expectations) may span several lines
+    parts.append('--multiline-fields=true')
+    return ' '.join(parts)
+
+
+def write_bulk_import_files(
+    df_transformed: pd.DataFrame,
+    output_dir: str,
+    database: str = 'neo4j',
+    created_at: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Write node and relationship CSV files for neo4j-admin database import.
+
+    Args:
+        df_transformed: Transformed DataFrame (output of transform_dataframe)
+        output_dir: Directory for the generated files (created if missing)
+        database: Database name used in the generated command
+        created_at: Value of the created_at property (default: now, UTC)
+
+    Returns:
+        Dictionary with:
+        - nodes: {label: {'file', 'rows'}}
+        - relationships: {phase: {'file', 'type', 'rows'}}
+        - skipped_rows: Rows without email (no Person ID)
+        - command: neo4j-admin command line to run the import
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    timestamp = (created_at or datetime.now(timezone.utc)).isoformat()
+
+    records = build_load_records(df_transformed)
+    frames = build_phase_frames(records)
+    frames['persons'] = deduplicate_persons(frames['persons'])
+
+    files: Dict[str, Any] = {'nodes': {}, 'relationships': {}}
+
+    for phase, (file_name, label, id_column, properties) in NODE_FILES.items():
+        frame = frames[phase].drop_duplicates(id_column)
+        nodes = frame[[id_column] + properties].rename(
+            columns={id_column: f"{id_column}:ID({label})"}
+        )
+        nodes['created_at:datetime'] = timestamp
+        nodes[':LABEL'] = label
+        _write_csv(nodes, output_path / file_name)
+        files['nodes'][label] = {'file': file_name, 'rows': len(nodes)}
+
+    for phase, (file_name, rel_type, start, end, properties) in RELATIONSHIP_FILES.items():
+        (start_column, start_space), (end_column, end_space) = start, end
+        frame = frames[phase].drop_duplicates([start_column, end_column])
+        relationships = pd.DataFrame({
+            f":START_ID({start_space})": frame[start_column].values,
+            f":END_ID({end_space})": frame[end_column].values,
+        })
+        for prop in properties:
+            # 'name:type' entries keep the type in the CSV header
+            relationships[prop] = frame[prop.split(':')[0]].values
+        relationships['created_at:datetime'] = timestamp
+        relationships[':TYPE'] = rel_type
+        _write_csv(relationships, output_path / file_name)
+        files['relationships'][phase] = {
+            'file': file_name, 'type': rel_type, 'rows': len(relationships)
+        }
+
+    files['skipped_rows'] = int(records['email'].isna().sum())
+    files['command'] = build_import_command(output_path, files, database)
+
+    logger.info(f"Bulk import files written to {output_path}")
+    for label, info in files['nodes'].items():
+        logger.info(f"  - {label}: {info['rows']} nodes")
+    for info in files['relationships'].values():
+        logger.info(f"  - {info['type']} ({info['file']}): {info['rows']} relationships")
+    if files['skipped_rows']:
+        logger.warning(f"{files['skipped_rows']} rows without email were skipped")
+    logger.info(f"Import command: {files['command']}")
+
+    return files
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    from src.config.conf import settings
+    from src.pipeline.etl_to_graph import TRANSFORM_VERSION, transform_dataframe
+    from src.pipeline.staging_cache import (
+        load_staged_frame,
+        staging_cache_path,
+        write_staged_frame,
+    )
+
+    output = sys.argv[1] if len(sys.argv) > 1 else "data/bulk_import"
+    cache_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    csv_file = Path(settings.CSV_PATH)
+    if not csv_file.is_absolute():
+        csv_file = project_root / csv_file
+
+    df_transformed = None
+    if cache_dir is not None:
+        cache_file = staging_cache_path(cache_dir, csv_file, TRANSFORM_VERSION)
+        df_transformed = load_staged_frame(cache_file)
+    if df_transformed is None:
+        df_transformed = transform_dataframe(pd.read_csv(csv_file))
+        if cache_dir is not None:
+            write_staged_frame(df_transformed, cache_file)
+
+    write_bulk_import_files(df_transformed, output)
@@ -0,0 +1,485 @@
+"""
+Entity resolution of organization names.
+
+normalize_organization_name only trims whitespace, so 'IBM', 'IBM Research'
+and 'ibm ' become three Organization nodes. OrganizationResolver maps the
+variants of a name to one canonical name before the load:
+
+- Every name gets a match key: folded (accents removed, lowercased),
+  punctuation removed and legal forms ('Inc.', 'S.A.', 'Ltda') dropped.
+  Trailing unit qualifiers ('Research', 'Labs') are only dropped when the
+  key without them is already the key of a spelling of its own: 'IBM
+  Research' takes the key of 'IBM', but 'Quantum Group' and 'Quantum Labs'
+  stay apart when no 'Quantum' was seen. Names with the same key belong to
+  the same organization
+- Keys are indexed by their character trigrams (the blocking index). A new
+  key only looks up the blocks of its rarest trigrams: a key reaching the
+  Jaccard threshold shares at least ceil(threshold * |grams|) of them, so
+  it is in one of the first |grams| - ceil(threshold * |grams|) + 1 blocks
+  (prefix filtering). Length and overlap-count filters run in numpy over
+  the block contents and blocks larger than max_block_size are skipped.
+  Of the surviving candidates only the max_candidates sharing the most
+  searched trigrams are scored, so a name costs a bounded number of
+  comparisons however many names are known
+- A new key joins the cluster of its most similar candidate if its trigram
+  Jaccard similarity reaches the threshold against every key of that
+  cluster (complete linkage), so typos such as 'Universidad de Chle' join
+  their cluster, but a chain of close pairs ('Chle' ~ 'Chile' ~ 'Chiloé')
+  does not merge names that are not similar themselves
+- The canonical name of a cluster is its most frequent spelling. Once
+  assigned it never changes, so the later chunks of a streamed load map to
+  the names already written
+- alias_table() lists every variant with its canonical name, similarity
+  and row count for review. Written with write_alias_table and read back
+  with read_alias_table, it pins its mappings on the next run (edit the
+  'canonical' column to correct a mapping)
+
+Usage:
+    path = default_alias_table_path(csv_file)
+    resolver = OrganizationResolver(aliases=read_alias_table(path))
+    df['organization'] = resolver.resolve_series(df['organization'])
+    write_alias_table(path, resolver.alias_table())
+"""
+
+import math
+import os
+import re
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from src.core.logger import get_logger
+from src.pipeline.keyword_classifier import fold_text
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Minimum trigram Jaccard similarity of two keys to merge them
+DEFAULT_SIMILARITY_THRESHOLD = 0.75
+
+# Blocks (keys sharing a trigram) larger than this are not searched
+DEFAULT_MAX_BLOCK_SIZE = 500
+
+# Candidates scored per new key (those sharing the most searched trigrams)
+DEFAULT_MAX_CANDIDATES = 20
+
+# Blocks searched beyond the prefix-filter minimum: they are cheap to read
+# (numpy), and every extra block lets the count filter reject more
+# candidates before the exact Jaccard check
+PREFIX_EXTENSION = 3
+
+# Legal-form tokens dropped from match keys (folded, punctuation removed)
+LEGAL_FORM_TOKENS = {
+    'inc', 'incorporated', 'corp', 'corporation', 'co', 'company', 'ltd',
+    'limited', 'llc', 'plc', 'gmbh', 'ag', 'sa', 'sas', 'sac', 'spa', 'srl',
+    'ltda', 'cia', 'eirl',
+}
+
+# Unit qualifiers at the end of match keys ('IBM Research' -> 'ibm', see strip_qualifiers)
+QUALIFIER_TOKENS = {
+    'research', 'labs', 'lab', 'laboratory', 'laboratories', 'group', 'grupo',
+}
+
+# Columns of the alias table
+ALIAS_TABLE_COLUMNS = ['organization', 'canonical', 'key', 'similarity', 'rows']
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+# Dotted legal forms ('S.A.', 'S. de R.L.') lose their dots before tokenizing
+_DOTTED_INITIALS = re.compile(r'\b(?:[a-z]\.\s?){2,}')
+
+
+def organization_key(name: str) -> str:
+    """
+    Return the match key of an organization name.
+
+    Args:
+        name: Organization name
+
+    Returns:
+        Folded name without punctuation and legal forms (the folded name
+        itself if nothing else is left)
+    """
+    folded = fold_text(name)
+    folded = _DOTTED_INITIALS.sub(lambda match: re.sub(r'[.\s]', '', match.group(0)) + ' ', folded)
+    tokens = _NON_ALNUM.sub(' ', folded).split()
+
+    kept = [token for token in tokens if token not in LEGAL_FORM_TOKENS]
+    return ' '.join(kept or tokens) or folded.strip()
+
+
+def strip_qualifiers(key: str) -> str:
+    """
+    Drop the trailing unit qualifiers of a match key.
+
+    Args:
+        key: Match key (output of organization_key)
+
+    Returns:
+        Key without trailing QUALIFIER_TOKENS (at least one token is kept)
+    """
+    tokens = key.split(' ')
+    while len(tokens) > 1 and tokens[-1] in QUALIFIER_TOKENS:
+        tokens.pop()
+    return ' '.join(tokens)
+
+
+def key_trigrams(key: str) -> Set[str]:
+    """
+    Return the character trigrams of a match key (padded with one space).
+
+    Args:
+        key: Match key
+
+    Returns:
+        Set of trigrams (a single padded gram for keys shorter than two characters)
+    """
+    padded = f" {key} "
+    return {padded[i:i + 3] for i in range(max(len(padded) - 2, 1))}
+
+
+class OrganizationResolver:
+    """
+    Incremental resolver of organization name variants.
+
+    Args:
+        threshold: Minimum trigram Jaccard similarity of two keys to merge them
+        max_block_size: Blocks with more keys than this are not searched
+        max_candidates: Maximum number of known keys scored per new key
+        aliases: Pinned mappings of organization name -> canonical name
+                 (e.g. a reviewed alias table, see read_alias_table). New
+                 names similar to a pinned name resolve to its canonical
+                 name (to the first one if pinned names with the same match
+                 key have different canonical names)
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+        max_candidates: int = DEFAULT_MAX_CANDIDATES,
+        aliases: Optional[Dict[str, str]] = None
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        if max_block_size < 1:
+            raise ValueError(f"max_block_size must be >= 1, got {max_block_size}")
+        if max_candidates < 1:
+            raise ValueError(f"max_candidates must be >= 1, got {max_candidates}")
+        self.threshold = threshold
+        self.max_block_size = max_block_size
+        self.max_candidates = max_candidates
+        self.aliases: Dict[str, str] = dict(aliases or {})
+        # A pinned canonical name is its own canonical name
+        for canonical in list(self.aliases.values()):
+            self.aliases.setdefault(canonical, canonical)
+
+        # Names seen, in order of first appearance, with their row counts
+        self._rows: Dict[str, int] = {}
+        self._key_of: Dict[str, str] = {}
+        # Match keys: trigrams, union-find parent, cluster members
+        self._grams: Dict[str, Set[str]] = {}
+        self._parent: Dict[str, str] = {}
+        self._members: Dict[str, List[str]] = {}
+        self._names_of_key: Dict[str, List[str]] = {}
+        # Blocking index: trigram -> ids of the keys containing it
+        self._blocks: Dict[str, array] = {}
+        self._keys: List[str] = []
+        self._sizes = np.zeros(1024, dtype=np.int64)
+        # Root key -> canonical name (fixed once assigned)
+        self._canonical: Dict[str, str] = {}
+        self._new_keys: List[str] = []
+        self._comparisons = 0
+
+        # Every pinned key is a cluster of its own, named by its pinned
+        # canonical name, so new names similar to a pinned name resolve to it
+        for alias, canonical in self.aliases.items():
+            self._add_name(alias, 0, link=False)
+            self._canonical.setdefault(self._find(self._key_of[alias]), canonical)
+        self._assign_canonicals()
+
+    def resolve(self, name: Any) -> Any:
+        """
+        Resolve one organization name (missing values are returned as they are).
+
+        Args:
+            name: Organization name
+
+        Returns:
+            Canonical name
+        """
+        return self.resolve_series(pd.Series([name], dtype=object)).iloc[0]
+
+    def resolve_series(self, series: pd.Series) -> pd.Series:
+        """
+        Resolve a column of organization names.
+
+        Every distinct name is keyed and matched once; new names join the
+        clusters of the previous calls or form new ones.
+
+        Args:
+            series: Organization names (missing values stay missing)
+
+        Returns:
+            Object Series with the canonical name of every row
+        """
+        values = series.to_numpy(dtype=object)
+        codes, distinct = pd.factorize(values)
+        counts = np.bincount(codes[codes >= 0], minlength=len(distinct))
+
+        names = [
+            (name, int(count)) for name, count in zip(distinct, counts) if isinstance(name, str)
+        ]
+        # New names without a unit qualifier first, so that 'IBM Research'
+        # finds the key of 'IBM' in the same call (see _add_name)
+        names.sort(key=lambda item: item[0] not in self._rows and self._is_qualified(item[0]))
+        for name, count in names:
+            self._add_name(name, count)
+        self._assign_canonicals()
+
+        canonical = np.array(
+            [self._canonical_name(name) if isinstance(name, str) else name for name in distinct] + [None],
+            dtype=object
+        )
+        result = canonical[codes]
+        missing = codes < 0
+        result[missing] = values[missing]
+        return pd.Series(result, index=series.index, dtype=object)
+
+    def alias_table(self) -> pd.DataFrame:
+        """
+        Return the reviewable alias table.
+
+        Returns:
+            DataFrame with one row per name seen (ALIAS_TABLE_COLUMNS):
+            organization, its canonical name, its match key, the trigram
+            similarity of its key to the canonical's key and its row count,
+            grouped by canonical name (largest clusters first)
+        """
+        rows = []
+        for name, count in self._rows.items():
+            canonical = self._canonical_name(name)
+            key = self._key_of[name]
+            rows.append({
+                'organization': name,
+                'canonical': canonical,
+                'key': key,
+                'similarity': round(self._similarity(key, self._key_of[canonical]), 4),
+                'rows': count,
+            })
+        table = pd.DataFrame(rows, columns=ALIAS_TABLE_COLUMNS)
+        cluster_rows = table.groupby('canonical')['rows'].transform('sum')
+        order = np.lexsort((
+            -table['rows'].to_numpy(), table['canonical'].to_numpy(), -cluster_rows.to_numpy()
+        ))
+        return table.iloc[order].reset_index(drop=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return counters of the names resolved so far.
+
+        - names: Distinct organization names
+        - keys: Distinct match keys
+        - clusters: Canonical organizations
+        - names_merged: Names mapped to a different canonical name
+        - comparisons: Candidate pairs scored
+        """
+        names_merged = sum(name != self._canonical_name(name) for name in self._rows)
+        return {
+            'names': len(self._rows),
+            'keys': len(self._grams),
+            'clusters': len({self._find(key) for key in self._grams}),
+            'names_merged': names_merged,
+            'comparisons': self._comparisons,
+        }
+
+    def _canonical_name(self, name: str) -> str:
+        pinned = self.aliases.get(name)
+        if pinned is not None:
+            return pinned
+        return self._canonical[self._find(self._key_of[name])]
+
+    def _add_name(self, name: str, count: int, link: bool = True) -> None:
+        if name not in self._rows:
+            self._rows[name] = 0
+            key = organization_key(name)
+            # A qualified name only takes the key of an existing spelling
+            base = strip_qualifiers(key)
+            if base in self._grams:
+                key = base
+            self._key_of[name] = key
+            if key not in self._grams:
+                self._add_key(key, link)
+            self._names_of_key[key].append(name)
+        self._rows[name] += count
+
+    @staticmethod
+    def _is_qualified(name: str) -> bool:
+        key = organization_key(name)
+        return strip_qualifiers(key) != key
+
+    def _add_key(self, key: str, link: bool = True) -> None:
+        grams = key_trigrams(key)
+        self._grams[key] = grams
+        self._parent[key] = key
+        self._members[key] = [key]
+        self._names_of_key[key] = []
+        self._new_keys.append(key)
+        if link:
+            self._link(key)
+
+        key_id = len(self._keys)
+        self._keys.append(key)
+        if key_id == len(self._sizes):
+            self._sizes = np.concatenate([self._sizes, np.zeros_like(self._sizes)])
+        self._sizes[key_id] = len(grams)
+        for gram in grams:
+            block = self._blocks.get(gram)
+            if block is None:
+                block = self._blocks[gram] = array('q')
+            block.append(key_id)
+
+    def _link(self, key: str) -> None:
+        # Join the cluster of the most similar key, if the new key is similar
+        # to every key of that cluster (complete linkage): a chain of close
+        # pairs must not merge names that are not similar themselves
+        candidates = self._candidates(self._grams[key])
+        self._comparisons += len(candidates)
+        matches = sorted(
+            ((self._similarity(key, other), other) for other in candidates),
+            key=lambda match: -match[0]
+        )
+        tried = set()
+        for score, other in matches:
+            if score < self.threshold:
+                break
+            root = self._find(other)
+            if root in tried:
+                continue
+            tried.add(root)
+            if all(
+                self._similarity(key, member) >= self.threshold
+                for member in self._members[root]
+            ):
+                self._parent[key] = root
+                self._members[root].append(key)
+                break
+
+    def _candidates(self, grams: Set[str]) -> List[str]:
+        blocks = self._blocks
+        empty = array('q')
+        threshold, size = self.threshold, len(grams)
+        # Rarest trigrams first (smallest blocks), the gram itself on ties
+        prefix = sorted(grams, key=lambda gram: (len(blocks.get(gram, empty)), gram))
+        prefix_size = min(size - math.ceil(threshold * size) + 1 + PREFIX_EXTENSION, size)
+        searched = [blocks.get(gram, empty) for gram in prefix[:prefix_size]]
+        # Keys in skipped blocks may still share those grams
+        skipped = sum(len(block) > self.max_block_size for block in searched)
+        searched = [block for block in searched if 0 < len(block) <= self.max_block_size]
+        if not searched:
+            return []
+
+        ids, shared = np.unique(
+            np.concatenate([np.frombuffer(block, dtype=np.int64) for block in searched]),
+            return_counts=True
+        )
+        other_sizes = self._sizes[ids]
+        # Length filter: Jaccard >= t needs t|a| <= |b| <= |a|/t
+        keep = (threshold * size <= other_sizes) & (other_sizes <= size / threshold)
+        # Count filter: the grams outside the prefix add at most
+        # size - prefix_size to the overlap, which must reach t(|a|+|b|)/(1+t)
+        required = np.ceil(threshold * (size + other_sizes) / (1 + threshold) - 1e-9)
+        keep &= shared + skipped + size - prefix_size >= required
+        ids, shared = ids[keep], shared[keep]
+        if len(ids) > self.max_candidates:
+            # Most shared trigrams first (first indexed on ties), back in index order
+            top = np.argsort(-shared, kind='stable')[:self.max_candidates]
+            ids = ids[np.sort(top)]
+        return [self._keys[key_id] for key_id in ids]
+
+    def _similarity(self, key: str, other: str) -> float:
+        grams, other_grams = self._grams[key], self._grams[other]
+        shared = len(grams & other_grams)
+        return shared / (len(grams) + len(other_grams) - shared)
+
+    def _find(self, key: str) -> str:
+        parent = self._parent
+        root = key
+        while parent[root] != root:
+            root = parent[root]
+        while parent[key] != root:
+            parent[key], key = root, parent[key]
+        return root
+
+    def _assign_canonicals(self) -> None:
+        # Most frequent spelling of every new cluster (first seen on ties)
+        roots = dict.fromkeys(self._find(key) for key in self._new_keys)
+        self._new_keys = []
+        for root in roots:
+            if root in self._canonical:
+                continue
+            best = None
+            for key in self._members[root]:
+                for name in self._names_of_key[key]:
+                    if best is None or self._rows[name] > self._rows[best]:
+                        best = name
+            if best is not None:
+                self._canonical[root] = best
+
+
+def default_alias_table_path(csv_file: Path) -> Path:
+    """
+    Get the default alias table location for a CSV file (next to the CSV).
+
+    Args:
+        csv_file: Path to the CSV file
+
+    Returns:
+        Path of the alias table CSV
+    """
+    return csv_file.with_name(f"{csv_file.name}.organization_aliases.csv")
+
+
+def read_alias_table(path: Path) -> Dict[str, str]:
+    """
+    Read the pinned mappings of an alias table.
+
+    A missing file is treated as empty.
+
+    Args:
+        path: Path of the alias table CSV
+
+    Returns:
+        Dictionary mapping organization name to canonical name
+    """
+    if not path.exists():
+        return {}
+
+    table = pd.read_csv(path, usecols=['organization', 'canonical'], dtype=str, keep_default_na=False)
+    table = table[(table['organization'] != '') & (table['canonical'] != '')]
+    return dict(zip(table['organization'], table['canonical']))
+
+
+def write_alias_table(path: Path, table: pd.DataFrame) -> None:
+    """
+    Write an alias table atomically (temporary file + rename).
+
+    Args:
+        path: Path of the alias table CSV
+        table: Output of OrganizationResolver.alias_table
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            table.to_csv(f, index=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    logger.info(f"Alias table written: {path} ({len(table)} names)")
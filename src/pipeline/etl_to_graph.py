@@ -12,13 +12,19 @@ PIPELINE STEPS:
 
 import logging
 import re
-from contextlib import contextmanager
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 from neo4j import Driver, GraphDatabase
+from neo4j.exceptions import DriverError, Neo4jError
 
 from src.config.conf import settings
 from src.core.logger import get_logger
@@ -27,15 +33,76 @@ from src.core.llm_service import (
     build_contextual_text,
     PROBLEM_CATEGORIES
 )
+from src.pipeline.arrow_csv import read_csv_columns
+from src.pipeline.entity_resolution import (
+    OrganizationResolver,
+    default_alias_table_path,
+    read_alias_table,
+    write_alias_table,
+)
+from src.pipeline.incremental import (
+    default_manifest_path,
+    load_manifest,
+    save_manifest,
+    select_changed_rows,
+)
+from src.pipeline.load_metrics import (
+    build_run_report,
+    record_load_seconds,
+    record_write,
+    summarize_load_metrics,
+    write_run_report,
+)
+from src.pipeline.keyword_classifier import KeywordClassifier
+from src.pipeline.load_recording import LoadRecording, read_load_recording
+from src.pipeline.registrant_consolidation import consolidate_registrants
+from src.pipeline.schema_migrations import apply_schema_migrations
+from src.pipeline.staging_cache import (
+    load_staged_frame,
+    require_pyarrow,
+    staging_cache_path,
+    write_staged_frame,
+)
+from src.pipeline.staged_pipeline import DEFAULT_QUEUE_SIZE, run_staged_pipeline
+from src.pipeline.validation import (
+    LOAD_ERROR,
+    QuarantineFile,
+    failure_reasons,
+    validate_dataframe,
+)
+from src.pipeline.vocabulary import (
+    CODE_COLUMNS,
+    Vocabulary,
+    compact_dataframe,
+    decode_dataframe,
+    flatten_code_lists,
+)
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Error code Neo4j uses when it aborts a transaction to break a deadlock
+DEADLOCK_ERROR_CODE = 'Neo.TransientError.Transaction.DeadlockDetected'
+
 
 # ============================================================================
 # STEP 1: COLUMN NAME NORMALIZATION
 # ============================================================================
 
+# Original CSV column -> normalized column name
+COLUMN_MAPPING = {
+    'Nombre completo': 'name',
+    'Correo electrónico': 'email',
+    'Organización / Empresa': 'organization',
+    'Cargo / Rol': 'role',
+    'Sector al que pertenece su organización': 'industry_sector',
+    'Interés principal en Computación Cuántica - (Seleccionar una o más)': 'interests',
+    '¿Ha trabajado previamente con tecnologías cuánticas?': 'quantum_experience',
+    '¿Qué espera obtener de este evento?': 'event_expectations',
+    'LinkedIn': 'linkedin_url',
+    'Timestamp': 'timestamp'  # Keep timestamp for reference
+}
+
 def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Normalize CSV column names to more manageable names.
@@ -57,25 +124,12 @@ def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with normalized column names
     """
-    column_mapping = {
-        'Nombre completo': 'name',
-        'Correo electrónico': 'email',
-        'Organización / Empresa': 'organization',
-        'Cargo / Rol': 'role',
-        'Sector al que pertenece su organización': 'industry_sector',
-        'Interés principal en Computación Cuántica - (Seleccionar una o más)': 'interests',
-        '¿Ha trabajado previamente con tecnologías cuánticas?': 'quantum_experience',
-        '¿Qué espera obtener de este evento?': 'event_expectations',
-        'LinkedIn': 'linkedin_url',
-        'Timestamp': 'timestamp'  # Keep timestamp for reference
-    }
-    
     # Rename only columns that exist
     df_normalized = df.rename(
-        columns={k: v for k, v in column_mapping.items() if k in df.columns}
+        columns={k: v for k, v in COLUMN_MAPPING.items() if k in df.columns}
     )
     
-    logger.debug(f"Normalized {len(column_mapping)} column names")
+    logger.debug(f"Normalized {len(COLUMN_MAPPING)} column names")
     
     return df_normalized
 
@@ -171,6 +225,17 @@ def normalize_linkedin_url(url: Any) -> Optional[str]:
     return None
 
 
+# Quantum experience categories and the keywords that identify them,
+# checked in order (the first category with a matching keyword wins)
+QUANTUM_EXPERIENCE_KEYWORDS = [
+    ('active', ['actualmente en proyectos activos', 'proyectos activos']),
+    ('exploration', ['exploración', 'piloto', 'exploracion']),
+    ('academic', ['interés académico', 'interes academico', 'académico']),
+    ('interested', ['me interesa iniciar', 'interesa iniciar']),
+    ('industry_interest', ['aplicación potencial', 'aplicacion potencial', 'industria']),
+]
+
+
 def normalize_quantum_experience(experience: Any) -> Optional[str]:
     """
     Normalize quantum experience values to standard categories.
@@ -193,16 +258,9 @@ def normalize_quantum_experience(experience: Any) -> Optional[str]:
     
     exp_str = str(experience).strip().lower()
     
-    if 'actualmente en proyectos activos' in exp_str or 'proyectos activos' in exp_str:
-        return 'active'
-    elif 'exploración' in exp_str or 'piloto' in exp_str or 'exploracion' in exp_str:
-        return 'exploration'
-    elif 'interés académico' in exp_str or 'interes academico' in exp_str or 'académico' in exp_str:
-        return 'academic'
-    elif 'me interesa iniciar' in exp_str or 'interesa iniciar' in exp_str:
-        return 'interested'
-    elif 'aplicación potencial' in exp_str or 'aplicacion potencial' in exp_str or 'industria' in exp_str:
-        return 'industry_interest'
+    for category, keywords in QUANTUM_EXPERIENCE_KEYWORDS:
+        if any(keyword in exp_str for keyword in keywords):
+            return category
     
     return None
 
@@ -280,6 +338,44 @@ def normalize_industry_sector(sector: Any) -> Optional[str]:
     return sector_str
 
 
+GENERAL_KNOWLEDGE_PROBLEM = "Falta de conocimiento general"
+INDUSTRIAL_APPLICATIONS_PROBLEM = "Falta de información sobre aplicaciones industriales"
+
+# Ordered (problem category, keywords) pairs of the rule-based inference.
+# Keywords are matched accent- and case-insensitively (see keyword_classifier)
+PROBLEM_KEYWORDS = [
+    (GENERAL_KNOWLEDGE_PROBLEM, [
+        'conocer', 'conocimiento', 'información', 'más información', 'incrementar conocimiento'
+    ]),
+    ("Falta de actualización", ['actualización']),
+    ("Falta de networking", [
+        'networking', 'contactos', 'contactos clave', 'colaborar', 'colaboración', 'colegas'
+    ]),
+    ("Falta de información sobre aplicaciones", [
+        'aplicaciones', 'aplicacionws', 'casos de uso', 'estado de esta tecnologia y sus aplicaciones'
+    ]),
+    ("Falta de información sobre madurez tecnológica", [
+        'madurez', 'estado actual', 'estado de la tecnología', 'desarrollo del cómputo cuántico'
+    ]),
+    ("Falta de información sobre viabilidad", [
+        'posible', 'futuro', 'qué tan posible', 'viabilidad', 'viable', 'comprender qué tan posible'
+    ]),
+    (INDUSTRIAL_APPLICATIONS_PROBLEM, ['aplicación potencial en la industria']),
+    ("Falta de oportunidades de colaboración", [
+        'oportunidades de colaboración', 'colaborar', 'colaboración',
+        'oportunidad de comenzar colaborando'
+    ]),
+    ("Falta de información sobre demanda laboral", [
+        'demanda', 'trabajar en', 'trabajo', 'demanda para trabajar'
+    ]),
+    ("Falta de información sobre productos", ['productos', 'producto']),
+    ("Falta de ideas para implementación", ['ideas', 'implementar', 'implementación']),
+    ("Gap entre negocio y tecnología", ['gap', 'business', 'negocio', 'busness', 'quantum gaps']),
+]
+
+PROBLEM_CLASSIFIER = KeywordClassifier(PROBLEM_KEYWORDS)
+
+
 def infer_problems_from_expectations(
     event_expectations: Any,
     quantum_experience: Optional[str] = None
@@ -309,115 +405,109 @@ def infer_problems_from_expectations(
         quantum_experience: Level of quantum experience (optional, for additional context)
         
     Returns:
-        List of problem category names (normalized)
+        List of problem category names (normalized), in PROBLEM_KEYWORDS order
     """
     if pd.isna(event_expectations) or event_expectations == '':
         # If no expectations but has industry_interest experience, infer industrial application problem
         if quantum_experience == 'industry_interest':
-            return ["Falta de información sobre aplicaciones industriales"]
+            return [INDUSTRIAL_APPLICATIONS_PROBLEM]
         return []
     
-    expectations_str = str(event_expectations).strip().lower()
-    problems = []
-    
-    # Falta de conocimiento general
-    if any(keyword in expectations_str for keyword in [
-        'conocer', 'conocimiento', 'información', 'informacion', 
-        'más información', 'mas informacion', 'incrementar conocimiento'
-    ]):
-        problems.append("Falta de conocimiento general")
-    
-    # Falta de actualización
-    if 'actualización' in expectations_str or 'actualizacion' in expectations_str:
-        problems.append("Falta de actualización")
-    
-    # Falta de networking
-    if any(keyword in expectations_str for keyword in [
-        'networking', 'contactos', 'contactos clave', 'colaborar', 
-        'colaboración', 'colaboracion', 'colegas'
-    ]):
-        problems.append("Falta de networking")
-    
-    # Falta de información sobre aplicaciones
-    if any(keyword in expectations_str for keyword in [
-        'aplicaciones', 'aplicacionws', 'casos de uso', 'casos de uso',
-        'estado de esta tecnologia y sus aplicaciones'
-    ]):
-        problems.append("Falta de información sobre aplicaciones")
-    
-    # Falta de información sobre madurez tecnológica
-    if any(keyword in expectations_str for keyword in [
-        'madurez', 'estado actual', 'estado de la tecnología', 
-        'desarrollo del cómputo cuántico', 'desarrollo del computo cuantico'
-    ]):
-        problems.append("Falta de información sobre madurez tecnológica")
-    
-    # Falta de información sobre viabilidad
-    if any(keyword in expectations_str for keyword in [
-        'posible', 'futuro', 'qué tan posible', 'que tan posible',
-        'viabilidad', 'viable', 'comprender qué tan posible'
-    ]):
-        problems.append("Falta de información sobre viabilidad")
-    
-    # Falta de información sobre aplicaciones industriales
-    if quantum_experience == 'industry_interest' or 'aplicación potencial en la industria' in expectations_str:
-        problems.append("Falta de información sobre aplicaciones industriales")
-    
-    # Falta de oportunidades de colaboración
-    if any(keyword in expectations_str for keyword in [
-        'oportunidades de colaboración', 'oportunidades de colaboracion',
-        'colaborar', 'colaboración', 'colaboracion', 'oportunidad de comenzar colaborando'
-    ]):
-        problems.append("Falta de oportunidades de colaboración")
-    
-    # Falta de información sobre demanda laboral
-    if any(keyword in expectations_str for keyword in [
-        'demanda', 'trabajar en', 'trabajo', 'demanda para trabajar'
-    ]):
-        problems.append("Falta de información sobre demanda laboral")
-    
-    # Falta de información sobre productos
-    if 'productos' in expectations_str or 'producto' in expectations_str:
-        problems.append("Falta de información sobre productos")
-    
-    # Falta de ideas para implementación
-    if any(keyword in expectations_str for keyword in [
-        'ideas', 'implementar', 'implementación', 'implementacion'
-    ]):
-        problems.append("Falta de ideas para implementación")
+    expectations_str = str(event_expectations).strip()
+    problems = PROBLEM_CLASSIFIER.classify(expectations_str)
     
-    # Gap entre negocio y tecnología
-    if any(keyword in expectations_str for keyword in [
-        'gap', 'business', 'negocio', 'busness', 'quantum gaps'
-    ]):
-        problems.append("Gap entre negocio y tecnología")
+    # The experience answer asked about industrial applications
+    if quantum_experience == 'industry_interest' and INDUSTRIAL_APPLICATIONS_PROBLEM not in problems:
+        problems.append(INDUSTRIAL_APPLICATIONS_PROBLEM)
     
     # If no specific problems found but has expectations, infer general knowledge problem
     if not problems and expectations_str:
-        problems.append("Falta de conocimiento general")
+        problems.append(GENERAL_KNOWLEDGE_PROBLEM)
     
-    return list(set(problems))  # Remove duplicates
+    return problems
 
 
 # ============================================================================
 # STEP 3: COMPLETE DATAFRAME TRANSFORMATION
 # ============================================================================
 
-def transform_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+# Bump when the output of transform_dataframe changes, so staging cache
+# entries produced by an older transform are not reused
+TRANSFORM_VERSION = 1
+
+# Implementations of steps 2-8: 'vectorized' (column-wise, see
+# vectorized_transform) and 'python' (the per-cell functions above, kept as
+# the reference the vectorized engine is tested against)
+TRANSFORM_ENGINES = ('vectorized', 'python')
+DEFAULT_TRANSFORM_ENGINE = 'vectorized'
+
+
+def transform_dataframe(
+    df: pd.DataFrame,
+    engine: str = DEFAULT_TRANSFORM_ENGINE,
+    linkedin_normalizer: Optional[Any] = None
+) -> pd.DataFrame:
     """
     Apply all normalization and cleaning transformations to the DataFrame.
     
+    Runs normalize_dataframe (steps 1-8) followed by infer_problems
+    (steps 9-10). The pipelined mode runs the two halves as separate stages.
+    
     Args:
         df: Original DataFrame from CSV
+        engine: Normalization engine (one of TRANSFORM_ENGINES)
+        linkedin_normalizer: LinkedInNormalizer of the 'python' engine (see
+                             normalize_dataframe)
         
     Returns:
         Transformed and normalized DataFrame
     """
+    return infer_problems(normalize_dataframe(df, engine, linkedin_normalizer))
+
+
+def normalize_dataframe(
+    df: pd.DataFrame,
+    engine: str = DEFAULT_TRANSFORM_ENGINE,
+    linkedin_normalizer: Optional[Any] = None
+) -> pd.DataFrame:
+    """
+    Normalize and clean the DataFrame and build the LLM context (steps 1-8).
+    
+    Both engines produce identical output; 'vectorized' is much faster on
+    large files.
+    
+    Args:
+        df: Original DataFrame from CSV
+        engine: Normalization engine (one of TRANSFORM_ENGINES)
+        linkedin_normalizer: LinkedInNormalizer the 'python' engine normalizes
+                             the LinkedIn URLs with (step 3). Pass the same one
+                             for every chunk of a run so its memo and stats()
+                             cover the whole run; a new one is used when None.
+                             The 'vectorized' engine parses the URLs column-wise
+                             and does not use it
+        
+    Returns:
+        Normalized DataFrame with a 'contextual_text' column
+        
+    Raises:
+        ValueError: If engine is not one of TRANSFORM_ENGINES
+    """
+    if engine not in TRANSFORM_ENGINES:
+        raise ValueError(
+            f"Invalid transform engine '{engine}'. Expected one of {TRANSFORM_ENGINES}"
+        )
+    
     logger.info("Starting DataFrame transformation")
     
     # Step 1: Normalize column names
     df_transformed = normalize_column_names(df.copy())
     
+    # Empty frames keep the dtypes the per-cell functions give them
+    if engine == 'vectorized' and len(df_transformed) > 0:
+        # Imported here: the vectorized engine builds on this module
+        from src.pipeline.vectorized_transform import normalize_values_vectorized
+        return normalize_values_vectorized(df_transformed)
+    
     # Step 2: Clean basic text values
     text_columns = ['name', 'email', 'role', 'organization', 'industry_sector', 
                    'event_expectations']
@@ -426,10 +516,15 @@ def transform_dataframe(df: pd.DataFrame) -> pd.DataFrame:
         if col in df_transformed.columns:
             df_transformed[col] = df_transformed[col].apply(clean_text)
     
-    # Step 3: Normalize LinkedIn URLs
+    # Step 3: Normalize LinkedIn URLs (canonical fast path, then memoized
+    # normalize_linkedin_url once per distinct value)
     if 'linkedin_url' in df_transformed.columns:
-        df_transformed['linkedin_url'] = df_transformed['linkedin_url'].apply(
-            normalize_linkedin_url
+        if linkedin_normalizer is None:
+            # Imported here: the normalizer builds on this module
+            from src.pipeline.linkedin_normalizer import LinkedInNormalizer
+            linkedin_normalizer = LinkedInNormalizer()
+        df_transformed['linkedin_url'] = linkedin_normalizer.normalize_series(
+            df_transformed['linkedin_url']
         )
     
     # Step 4: Normalize quantum experience
@@ -469,6 +564,19 @@ def transform_dataframe(df: pd.DataFrame) -> pd.DataFrame:
         axis=1
     )
     
+    return df_transformed
+
+
+def infer_problems(df_transformed: pd.DataFrame) -> pd.DataFrame:
+    """
+    Infer problem categories with the LLM (steps 9-10).
+    
+    Args:
+        df_transformed: Output of normalize_dataframe (modified in place)
+        
+    Returns:
+        DataFrame with 'llm_problem_inference' and 'problems_list' columns
+    """
     # Step 9: Infer problems using LLM ReAct agent
     # This uses the new LLM service with ReAct pattern for better inference
     logger.info("Inferring problems using LLM ReAct agent...")
@@ -531,7 +639,8 @@ def prepare_row_for_neo4j(row: pd.Series) -> Dict[str, Any]:
     Prepare a DataFrame row for insertion into Neo4j.
     
     Converts the row into a dictionary with normalized data
-    ready to use in Cypher queries.
+    ready to use in Cypher queries. Missing scalar values are None, also
+    for categorical columns (see compact_dataframe), whose rows hold NaN.
     
     Args:
         row: Pandas Series (one row from DataFrame)
@@ -540,26 +649,25 @@ def prepare_row_for_neo4j(row: pd.Series) -> Dict[str, Any]:
         Dictionary with normalized data
     """
     data = {
-        'name': row.get('name'),
-        'email': row.get('email'),
-        'role': row.get('role'),
-        'linkedin_url': row.get('linkedin_url'),
-        'quantum_experience': row.get('quantum_experience'),
-        'event_expectations': row.get('event_expectations'),
-        'organization': row.get('organization'),
-        'industry_sector': row.get('industry_sector'),
-        'interests': row.get('interests_list', []),  # List of interests
-        'problems': row.get('problems_list', []),  # List of inferred problems
+        field: (None if _is_missing(row.get(field)) else row.get(field))
+        for field in RECORD_SCALAR_FIELDS
     }
+    data['interests'] = row.get('interests_list', [])  # List of interests
+    data['problems'] = row.get('problems_list', [])  # List of inferred problems
     
     return data
 
 
+def _is_missing(value: Any) -> bool:
+    # pd.isna is element-wise on lists, so only scalars are tested
+    return value is None or (not isinstance(value, (list, tuple, dict)) and bool(pd.isna(value)))
+
+
 # ============================================================================
 # STEP 5: CYPHER QUERY GENERATION
 # ============================================================================
 
-def generate_cypher_query() -> str:
+def generate_cypher_query(batched: bool = False, derived_edges: bool = True) -> str:
     """
     Generate the Cypher query to insert data into Neo4j.
     
@@ -578,15 +686,46 @@ def generate_cypher_query() -> str:
     with common interests (same Domains) to initiate dialogues, and
     matching problems with potential solutions (Domains).
     
+    Args:
+        batched: If True, the query expects a $rows list and processes a whole
+                 batch in one round trip. If False, it expects a single $row.
+        derived_edges: If False, steps 8 and 9 are left out: the derived
+                       Organization-Problem and Problem-Domain edges are then
+                       written separately, once per distinct pair
+                       (see load_derived_edges_to_neo4j)
+    
     Returns:
         String with the Cypher query
     """
+    unwind_clause = "UNWIND $rows AS row" if batched else "UNWIND [$row] AS row"
+    
+    derived_edges_clauses = """
+    // 8. Create HAS_PROBLEM relationship between Organization and Problem
+    // Organizations inherit problems from their employees
+    WITH p, o, pr, row
+    WHERE row.organization IS NOT NULL
+    MERGE (o)-[op:HAS_PROBLEM]->(pr)
+    ON CREATE SET
+        op.created_at = datetime()
+    
+    // 9. Create CAN_BE_SOLVED_BY relationship between Problem and Domain
+    // If a person has both a problem and an interest in a domain,
+    // we infer that domain might help solve that problem
+    WITH p, pr, row
+    UNWIND [interest IN row.interests WHERE interest IS NOT NULL AND interest <> ''] AS interest
+    MATCH (d:Domain {name: trim(interest)})
+    MERGE (pr)-[csb:CAN_BE_SOLVED_BY]->(d)
+    ON CREATE SET
+        csb.created_at = datetime()
+    """ if derived_edges else ""
+    
     query = """
-    // Query to insert a complete row into the graph
+    // Query to insert complete rows into the graph
     // Expected parameters: $row (dictionary with normalized data)
+    //                      or $rows (list of those dictionaries) in batched mode
     // Purpose: Facilitate conversations by connecting people with common interests and problems
     
-    UNWIND [$row] AS row
+    """ + unwind_clause + """
     
     // 1. Create or update Person node
     MERGE (p:Person {email: row.email})
@@ -659,25 +798,7 @@ def generate_cypher_query() -> str:
     MERGE (p)-[hp:HAS_PROBLEM]->(pr)
     ON CREATE SET
         hp.created_at = datetime()
-    
-    // 8. Create HAS_PROBLEM relationship between Organization and Problem
-    // Organizations inherit problems from their employees
-    WITH p, o, pr, row
-    WHERE row.organization IS NOT NULL
-    MERGE (o)-[op:HAS_PROBLEM]->(pr)
-    ON CREATE SET
-        op.created_at = datetime()
-    
-    // 9. Create CAN_BE_SOLVED_BY relationship between Problem and Domain
-    // If a person has both a problem and an interest in a domain,
-    // we infer that domain might help solve that problem
-    WITH p, pr, row
-    UNWIND [interest IN row.interests WHERE interest IS NOT NULL AND interest <> ''] AS interest
-    MATCH (d:Domain {name: trim(interest)})
-    MERGE (pr)-[csb:CAN_BE_SOLVED_BY]->(d)
-    ON CREATE SET
-        csb.created_at = datetime()
-    
+    """ + derived_edges_clauses + """
     RETURN count(p) AS persons_processed
     """
     
@@ -741,33 +862,99 @@ def get_session(driver: Driver):
 # STEP 7: GRAPH CLEANUP FUNCTION
 # ============================================================================
 
-def clear_graph(session: Any, confirm: bool = False) -> Dict[str, Any]:
+# Default number of relationships/nodes deleted per transaction in chunked mode
+DEFAULT_CLEAR_CHUNK_SIZE = 10000
+
+
+def _quote_label(label: str) -> str:
+    """Quote a label for safe interpolation into Cypher (labels cannot be parameters)."""
+    return "`" + label.replace("`", "``") + "`"
+
+
+def _delete_in_chunks(
+    session: Any,
+    query: str,
+    chunk_size: int,
+    what: str
+) -> Tuple[Dict[str, int], int]:
+    """
+    Run a `... LIMIT $limit ... DELETE ...` query until it deletes nothing.
+    
+    Every run is its own auto-commit transaction, so transaction memory is
+    bounded by chunk_size regardless of the graph size.
+    
+    Returns:
+        Tuple of (deleted counters, number of chunks run)
+    """
+    deleted = {'nodes_deleted': 0, 'relationships_deleted': 0}
+    chunks = 0
+    while True:
+        counters = summary_counters(session.run(query, limit=chunk_size).consume())
+        if counters['nodes_deleted'] == 0 and counters['relationships_deleted'] == 0:
+            return deleted, chunks
+        chunks += 1
+        deleted['nodes_deleted'] += counters['nodes_deleted']
+        deleted['relationships_deleted'] += counters['relationships_deleted']
+        logger.info(
+            f"Clearing {what}: chunk {chunks} done "
+            f"({deleted['relationships_deleted']} relationships, "
+            f"{deleted['nodes_deleted']} nodes deleted so far)"
+        )
+
+
+def clear_graph(
+    session: Any,
+    confirm: bool = False,
+    chunk_size: Optional[int] = None,
+    labels: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Clear all nodes and relationships from the Neo4j graph.
     
     This function deletes all data from the graph to avoid duplicates
     when reloading data. It's useful for testing and full reloads.
     
-    WARNING: This will delete ALL data in the graph. Use with caution!
+    By default everything is deleted with two statements (relationships,
+    then nodes), each one a single transaction. On a large graph that can
+    exceed the transaction memory limit (e.g. on Aura), so a chunked mode
+    is available: relationships and then nodes are deleted in transactions
+    of at most chunk_size entities, with progress logged after every chunk.
+    A client-side loop is used instead of CALL {...} IN TRANSACTIONS so that
+    progress can be reported and the same code runs on every Neo4j version.
+    
+    WARNING: This will delete ALL data in the graph (or all nodes with the
+    given labels). Use with caution!
     
     Args:
         session: Neo4j session
         confirm: If False, raises ValueError to prevent accidental deletion.
                  Set to True to actually execute the deletion.
+        chunk_size: Maximum entities deleted per transaction. If None and no
+                    labels are given, the graph is cleared in two statements.
+        labels: Only delete nodes with these labels (and their relationships).
+                Implies chunked mode (DEFAULT_CLEAR_CHUNK_SIZE if chunk_size is None).
         
     Returns:
         Dictionary with deletion statistics:
         - nodes_deleted: Number of nodes deleted
         - relationships_deleted: Number of relationships deleted
+        - chunks: Number of delete transactions run (chunked mode only)
         
     Raises:
-        ValueError: If confirm is False (safety check)
+        ValueError: If confirm is False (safety check) or the options are invalid
     """
     if not confirm:
         raise ValueError(
             "clear_graph requires confirm=True to prevent accidental deletion. "
             "This will delete ALL nodes and relationships in the graph!"
         )
+    if labels is not None and not labels:
+        raise ValueError("labels must contain at least one label (use None for all nodes)")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    
+    if chunk_size is not None or labels is not None:
+        return _clear_graph_in_chunks(session, chunk_size or DEFAULT_CLEAR_CHUNK_SIZE, labels)
     
     logger.warning("Clearing all nodes and relationships from Neo4j graph...")
     
@@ -800,28 +987,72 @@ def clear_graph(session: Any, confirm: bool = False) -> Dict[str, Any]:
     }
 
 
+def _clear_graph_in_chunks(
+    session: Any,
+    chunk_size: int,
+    labels: Optional[List[str]]
+) -> Dict[str, Any]:
+    """
+    Delete relationships, then nodes, in transactions of chunk_size entities.
+    
+    See clear_graph for the arguments and return value.
+    """
+    scope = f"nodes labeled {', '.join(labels)}" if labels else "the whole graph"
+    logger.warning(f"Clearing {scope} in chunks of {chunk_size}...")
+    
+    if labels:
+        steps = []
+        for label in labels:
+            quoted = _quote_label(label)
+            steps.append((
+                f"MATCH (n:{quoted})-[r]-() WITH DISTINCT r LIMIT $limit DELETE r",
+                f"{label} relationships"
+            ))
+            steps.append((
+                f"MATCH (n:{quoted}) WITH n LIMIT $limit DETACH DELETE n",
+                f"{label} nodes"
+            ))
+    else:
+        steps = [
+            ("MATCH ()-[r]->() WITH r LIMIT $limit DELETE r", "relationships"),
+            ("MATCH (n) WITH n LIMIT $limit DETACH DELETE n", "nodes"),
+        ]
+    
+    totals = {'nodes_deleted': 0, 'relationships_deleted': 0, 'chunks': 0}
+    for query, what in steps:
+        deleted, chunks = _delete_in_chunks(session, query, chunk_size, what)
+        totals['nodes_deleted'] += deleted['nodes_deleted']
+        totals['relationships_deleted'] += deleted['relationships_deleted']
+        totals['chunks'] += chunks
+    
+    logger.info(
+        f"Cleared {scope}: {totals['nodes_deleted']} nodes, "
+        f"{totals['relationships_deleted']} relationships in {totals['chunks']} chunks"
+    )
+    
+    return totals
+
+
 # ============================================================================
 # STEP 8: NEO4J INSERTION FUNCTION
 # ============================================================================
 
-def insert_row_to_neo4j(session: Any, row_data: Dict[str, Any]) -> Dict[str, Any]:
+# Retry policy for write transactions (on top of the driver's own retries)
+WRITE_MAX_RETRIES = 3
+WRITE_INITIAL_BACKOFF_SECONDS = 0.5
+WRITE_BACKOFF_MULTIPLIER = 2.0
+
+
+def summary_counters(summary: Any) -> Dict[str, Any]:
     """
-    Insert a row of data into Neo4j using the Cypher query.
+    Extract the write counters of a Neo4j result summary.
     
     Args:
-        session: Neo4j session
-        row_data: Dictionary with normalized row data
+        summary: Neo4j ResultSummary
         
     Returns:
-        Execution result with counters
+        Dictionary with nodes/relationships created and deleted
     """
-    query = generate_cypher_query()
-    
-    result = session.run(query, row=row_data)
-    
-    # Get the result
-    summary = result.consume()
-    
     return {
         'nodes_created': summary.counters.nodes_created,
         'nodes_deleted': summary.counters.nodes_deleted,
@@ -830,140 +1061,2053 @@ def insert_row_to_neo4j(session: Any, row_data: Dict[str, Any]) -> Dict[str, Any
     }
 
 
-# ============================================================================
-# STEP 9: COMPLETE ETL PIPELINE
-# ============================================================================
-
-def run_etl_pipeline(
-    csv_path: Optional[str] = None,
-    neo4j_uri: Optional[str] = None,
-    neo4j_user: Optional[str] = None,
-    neo4j_password: Optional[str] = None,
-    batch_size: int = 10,
-    clear_before_load: bool = False
+def _write_transaction(
+    tx: Any,
+    query: str,
+    params: Dict[str, Any],
+    attempts: Dict[str, int]
 ) -> Dict[str, Any]:
     """
-    Execute the complete ETL pipeline.
+    Transaction function for execute_write.
     
-    Neo4j credentials and CSV path can be provided as arguments or will be
-    loaded from environment variables via Settings:
-    - NEO4J_URI: Neo4j connection URI (e.g., "bolt://localhost:7687")
-    - NEO4J_USER: Neo4j username
-    - NEO4J_QUANTUM_NETWORK_AURA: Neo4j password
-    - CSV_PATH: Path to CSV file (optional, default: "data/quantum_network.csv")
+    The driver may call it several times (it retries transient errors such
+    as deadlocks), so every call is counted in attempts. The server-side
+    timings of the successful call are stored in attempts as well.
+    """
+    attempts['calls'] += 1
+    try:
+        summary = tx.run(query, **params).consume()
+    except Neo4jError as e:
+        if e.code == DEADLOCK_ERROR_CODE:
+            attempts['deadlocks'] += 1
+        raise
+    attempts['available_after'] = summary.result_available_after
+    attempts['consumed_after'] = summary.result_consumed_after
+    return summary_counters(summary)
+
+
+def count_write_attempts(stats: Dict[str, Any], attempts: Dict[str, Any]) -> None:
+    """
+    Add the driver retries of one execute_write call to stats.
     
     Args:
-        csv_path: Path to CSV file (optional, uses Settings.CSV_PATH or default)
-        neo4j_uri: Neo4j connection URI (optional, uses Settings.NEO4J_URI)
-        neo4j_user: Neo4j username (optional, uses Settings.NEO4J_USER)
-        neo4j_password: Neo4j password (optional, uses Settings.NEO4J_QUANTUM_NETWORK_AURA)
-        batch_size: Batch size for processing (optional, for future optimizations)
-        clear_before_load: If True, clears all existing nodes and relationships before loading.
-                          WARNING: This will delete ALL data in the graph!
+        stats: Statistics dictionary (updated in place)
+        attempts: Attempt counters filled in by the transaction function
+    """
+    stats['transaction_retries'] = (
+        stats.get('transaction_retries', 0) + max(attempts['calls'] - 1, 0)
+    )
+    stats['deadlock_retries'] = stats.get('deadlock_retries', 0) + attempts['deadlocks']
+
+
+def write_retry_delay(
+    error: Union[Neo4jError, DriverError],
+    retry: int,
+    stats: Optional[Dict[str, Any]] = None,
+    max_retries: int = WRITE_MAX_RETRIES,
+    initial_backoff: float = WRITE_INITIAL_BACKOFF_SECONDS,
+    backoff_multiplier: float = WRITE_BACKOFF_MULTIPLIER
+) -> Optional[float]:
+    """
+    Decide whether a failed write transaction is retried, and after how long.
+    
+    Shared by the sync and async write paths. A retry is counted in
+    stats['transient_retries'] and logged.
+    
+    Args:
+        error: Error raised by execute_write
+        retry: Number of retries already done for this write
+        stats: Statistics dictionary (optional, updated in place)
+        max_retries: Maximum number of retries after a retryable error
+        initial_backoff: Seconds to wait before the first retry
+        backoff_multiplier: Factor applied to the wait after every retry
         
     Returns:
-        Dictionary with process statistics
+        Seconds to wait before the next attempt, or None if the error must
+        be raised (not retryable, or max_retries reached)
+    """
+    if not error.is_retryable() or retry >= max_retries:
+        return None
+    delay = initial_backoff * backoff_multiplier ** retry
+    if stats is not None:
+        stats['transient_retries'] = stats.get('transient_retries', 0) + 1
+    logger.warning(
+        f"Retryable error in write transaction ({error}), "
+        f"retry {retry + 1}/{max_retries} in {delay:.2f}s"
+    )
+    return delay
+
+
+def execute_write_with_retry(
+    session: Any,
+    query: str,
+    params: Dict[str, Any],
+    stats: Optional[Dict[str, Any]] = None,
+    max_retries: int = WRITE_MAX_RETRIES,
+    initial_backoff: float = WRITE_INITIAL_BACKOFF_SECONDS,
+    backoff_multiplier: float = WRITE_BACKOFF_MULTIPLIER
+) -> Dict[str, Any]:
+    """
+    Run a write query in a managed transaction with exponential backoff.
+    
+    The query runs inside session.execute_write, so the driver already
+    retries transient errors (deadlocks, leader switches) within its own
+    time budget. If the error is still retryable after that (for example
+    an Aura connection drop), the whole transaction is retried here up to
+    max_retries times, waiting initial_backoff * backoff_multiplier**n
+    seconds between attempts. Non-retryable errors are raised immediately.
+    
+    Retries are counted in stats (if given):
+    - transaction_retries: re-runs of the transaction function by the driver
+    - deadlock_retries: attempts aborted by Neo4j deadlock detection
+    - transient_retries: retries done by this function after a backoff
+    
+    The latency and server timings of the write are recorded in
+    stats['load_metrics'] (see load_metrics.record_write).
+    
+    Args:
+        session: Neo4j session
+        query: Cypher write query
+        params: Query parameters
+        stats: Statistics dictionary for retry counters (optional, updated in place)
+        max_retries: Maximum number of retries after a retryable error
+        initial_backoff: Seconds to wait before the first retry
+        backoff_multiplier: Factor applied to the wait after every retry
         
-    Raises:
-        ValueError: If required credentials are not provided
-        FileNotFoundError: If CSV file is not found
+    Returns:
+        Execution result with counters
     """
-    # Get values from Settings if not provided as arguments
-    csv_path = csv_path or settings.CSV_PATH
-    neo4j_uri = neo4j_uri or settings.NEO4J_URI
-    neo4j_user = neo4j_user or settings.NEO4J_USER
-    neo4j_password = neo4j_password or settings.NEO4J_QUANTUM_NETWORK_AURA
+    rows = len(params['rows']) if 'rows' in params else 1
+    started = time.perf_counter()
+    retry = 0
+    while True:
+        attempts = {'calls': 0, 'deadlocks': 0}
+        try:
+            counters = session.execute_write(_write_transaction, query, params, attempts)
+            if stats is not None:
+                record_write(
+                    stats, rows, time.perf_counter() - started,
+                    attempts.get('available_after'), attempts.get('consumed_after')
+                )
+            return counters
+        except (Neo4jError, DriverError) as e:
+            delay = write_retry_delay(
+                e, retry, stats, max_retries, initial_backoff, backoff_multiplier
+            )
+            if delay is None:
+                if stats is not None:
+                    record_write(stats, rows, time.perf_counter() - started, failed=True)
+                raise
+            retry += 1
+            time.sleep(delay)
+        finally:
+            if stats is not None:
+                count_write_attempts(stats, attempts)
+
+
+def is_row_error(error: Exception) -> bool:
+    """
+    Tell whether a failed write was caused by its rows or by the database.
     
-    # Validate that we have the necessary credentials
-    if not neo4j_uri:
-        raise ValueError(
-            "NEO4J_URI is not defined. Provide it as an argument or in environment variables."
-        )
-    if not neo4j_user:
-        raise ValueError(
-            "NEO4J_USER is not defined. Provide it as an argument or in environment variables."
-        )
-    if not neo4j_password:
-        raise ValueError(
-            "NEO4J_QUANTUM_NETWORK_AURA is not defined. "
-            "Provide it as an argument or in environment variables."
-        )
+    Non-retryable Neo4j errors (constraint violations, invalid property
+    values, ...) and errors raised before the query is sent (such as the
+    TypeError of an unsupported parameter value) are row errors: writing
+    the rows in smaller batches isolates them. Driver errors (connection
+    lost, service unavailable) and Neo4j errors that are still retryable
+    after execute_write_with_retry gave up mean the database is unavailable:
+    every smaller batch would run the whole retry cycle again.
     
-    stats = {
-        'rows_processed': 0,
-        'rows_with_errors': 0,
-        'errors': []
-    }
+    Args:
+        error: Exception raised by a write
+        
+    Returns:
+        True for row errors, False for database outages
+    """
+    if isinstance(error, DriverError):
+        return False
+    if isinstance(error, Neo4jError):
+        return not error.is_retryable()
+    return True
+
+
+class BatchBisection:
+    """
+    Bookkeeping of a bisected batch write, shared by the sync and async loaders.
     
-    # EXTRACT: Load CSV
-    logger.info("EXTRACT: Loading CSV file")
-    logger.info(f"CSV path: {csv_path}")
+    The caller writes the rows returned by next_rows while pending is true,
+    and reports the outcome with succeeded or split. A failed chunk is split
+    in halves until the failing rows are isolated as single-row chunks.
     
-    # Resolve path relative to project root
-    csv_file = Path(csv_path)
-    if not csv_file.is_absolute():
-        # If relative path, resolve from project root
-        project_root = Path(__file__).parent.parent.parent
-        csv_file = project_root / csv_file
+    Attributes:
+        counters: Aggregated counters of the successful writes
+        failed: (row_index, row_data, error) of the rows that failed
+    """
     
-    if not csv_file.exists():
-        raise FileNotFoundError(f"CSV file not found: {csv_file}")
+    def __init__(
+        self,
+        indexed_rows: List[Tuple[Any, Dict[str, Any]]],
+        stats: Dict[str, Any]
+    ) -> None:
+        """
+        Args:
+            indexed_rows: Pairs of (source row index, row data)
+            stats: Statistics dictionary (bisections, updated in place)
+        """
+        self.stats = stats
+        self.counters: Dict[str, int] = {}
+        self.failed: List[Tuple[Any, Dict[str, Any], str]] = []
+        self._pending = [indexed_rows]
+        self._chunk: List[Tuple[Any, Dict[str, Any]]] = []
+    
+    @property
+    def pending(self) -> bool:
+        """True while some chunk is still to be written."""
+        return bool(self._pending)
+    
+    def next_rows(self) -> List[Dict[str, Any]]:
+        """Take the next chunk to write and return its rows."""
+        self._chunk = self._pending.pop()
+        return [row for _, row in self._chunk]
+    
+    def succeeded(self, counters: Dict[str, Any]) -> None:
+        """Record the counters of the chunk returned by next_rows."""
+        accumulate_counters(self.counters, counters)
+    
+    def split(self, error: Exception) -> None:
+        """
+        Record a row error of the chunk returned by next_rows.
+        
+        A single-row chunk is recorded as failed; a larger one is split in
+        halves (counted in stats['bisections']).
+        
+        Args:
+            error: Row error raised by the write (see is_row_error)
+        """
+        chunk = self._chunk
+        if len(chunk) == 1:
+            idx, row_data = chunk[0]
+            self.failed.append((idx, row_data, str(error)))
+            logger.error(f"Error writing row {idx}: {str(error)}")
+            return
+        self.stats['bisections'] = self.stats.get('bisections', 0) + 1
+        middle = len(chunk) // 2
+        # Pushed in reverse so the first half is written first
+        self._pending.append(chunk[middle:])
+        self._pending.append(chunk[:middle])
+
+
+def write_with_bisection(
+    write_batch: Callable[[List[Dict[str, Any]]], Dict[str, Any]],
+    indexed_rows: List[Tuple[Any, Dict[str, Any]]],
+    stats: Dict[str, Any]
+) -> Tuple[Dict[str, int], List[Tuple[Any, Dict[str, Any], str]]]:
+    """
+    Write a batch; if it fails, split it in halves to isolate the bad rows.
     
-    df = pd.read_csv(csv_file)
-    logger.info(f"Loaded {len(df)} rows from CSV")
+    A failed transaction is rolled back as a whole, so without bisection one
+    bad row would drop every other row of its batch. Here a failing batch is
+    retried as two halves, recursively, until the failing rows are isolated
+    as single-row batches. Good rows still get written in (smaller) batches.
+    Every split is counted in stats['bisections'].
     
-    # TRANSFORM: Normalize and clean
-    logger.info("TRANSFORM: Normalizing and cleaning data")
-    df_transformed = transform_dataframe(df)
-    logger.info(f"DataFrame transformed: {len(df_transformed)} rows")
-    logger.debug(f"Columns: {list(df_transformed.columns)}")
+    Only row errors are bisected (see is_row_error). A database outage is
+    raised at once, which aborts the load instead of retrying every half.
     
-    # LOAD: Insert into Neo4j
-    logger.info("LOAD: Inserting data into Neo4j")
-    logger.info(f"Neo4j URI: {neo4j_uri}")
-    logger.info(f"Neo4j User: {neo4j_user}")
+    Args:
+        write_batch: Function that writes a list of rows and returns counters
+        indexed_rows: Pairs of (source row index, row data)
+        stats: Statistics dictionary (updated in place)
+        
+    Returns:
+        Tuple of (aggregated counters of successful writes,
+                  list of (row_index, row_data, error) for rows that failed)
+        
+    Raises:
+        DriverError, Neo4jError: If the database is unavailable
+    """
+    bisection = BatchBisection(indexed_rows, stats)
+    while bisection.pending:
+        rows = bisection.next_rows()
+        try:
+            bisection.succeeded(write_batch(rows))
+        except Exception as e:
+            if not is_row_error(e):
+                raise
+            bisection.split(e)
     
-    # Create driver and execute pipeline
-    driver = create_driver(neo4j_uri, neo4j_user, neo4j_password)
+    return bisection.counters, bisection.failed
+
+
+def record_row_errors(
+    stats: Dict[str, Any],
+    failed: List[Tuple[Any, Optional[Dict[str, Any]], str]],
+    quarantine: Optional[QuarantineFile] = None,
+    **fields: Any
+) -> None:
+    """
+    Record failed rows in stats['errors'].
     
-    try:
-        with get_session(driver) as session:
-            # Clear graph if requested (before loading new data)
-            if clear_before_load:
-                logger.warning("Clearing graph before loading new data...")
-                clear_stats = clear_graph(session, confirm=True)
-                stats['graph_cleared'] = clear_stats
-                logger.info(
-                    f"Graph cleared: {clear_stats['nodes_deleted']} nodes, "
-                    f"{clear_stats['relationships_deleted']} relationships deleted"
-                )
-            for idx, row in df_transformed.iterrows():
-                try:
-                    # Prepare row data
-                    row_data = prepare_row_for_neo4j(row)
-                    
-                    # Insert into Neo4j
-                    result = insert_row_to_neo4j(session, row_data)
-                    
-                    stats['rows_processed'] += 1
-                    
-                    if stats['rows_processed'] % 10 == 0:
-                        logger.info(f"Processed {stats['rows_processed']} rows...")
-                        
-                except Exception as e:
-                    stats['rows_with_errors'] += 1
-                    stats['errors'].append({
-                        'row_index': idx,
-                        'error': str(e),
-                        'row_data': row_data if 'row_data' in locals() else None
-                    })
-                    logger.error(f"Error processing row {idx}: {str(e)}", exc_info=True)
-    finally:
-        close_driver(driver)
+    Without a quarantine each error keeps the row in 'row_data'. With one,
+    the rows are written to the quarantine file at once (reason LOAD_ERROR)
+    and the errors only keep their row index and message, so a whole-file
+    load does not hold its failed rows in memory.
     
-    logger.info("Pipeline completed successfully")
+    Args:
+        stats: Statistics dictionary (updated in place)
+        failed: (row_index, row_data, error) of the failed rows
+        quarantine: Open quarantine file (optional)
+        **fields: Extra fields of every error (such as its phase)
+    """
+    if quarantine is not None:
+        quarantine.write_rows(
+            (idx, [LOAD_ERROR], error, row_data) for idx, row_data, error in failed
+        )
+    for idx, row_data, error in failed:
+        entry = {'row_index': idx, **fields, 'error': error}
+        if quarantine is None:
+            entry['row_data'] = row_data
+        stats['errors'].append(entry)
+
+
+def insert_row_to_neo4j(
+    session: Any,
+    row_data: Dict[str, Any],
+    stats: Optional[Dict[str, Any]] = None,
+    derived_edges: bool = True
+) -> Dict[str, Any]:
+    """
+    Insert a row of data into Neo4j using the Cypher query.
+    
+    The query runs in a managed write transaction with retries
+    (see execute_write_with_retry).
+    
+    Args:
+        session: Neo4j session
+        row_data: Dictionary with normalized row data
+        stats: Statistics dictionary for retry counters and load metrics (optional)
+        derived_edges: If False, steps 8-9 of the template are skipped
+                       (see generate_cypher_query)
+        
+    Returns:
+        Execution result with counters
+    """
+    query = generate_cypher_query(derived_edges=derived_edges)
+    
+    return execute_write_with_retry(session, query, {'row': row_data}, stats)
+
+
+def load_rows_to_neo4j(
+    session: Any,
+    df_transformed: pd.DataFrame,
+    stats: Dict[str, Any],
+    derived_edges: bool = True,
+    quarantine: Optional[QuarantineFile] = None
+) -> None:
+    """
+    Load a transformed DataFrame into Neo4j one row (one query) at a time.
+    
+    Counters from every row are aggregated into stats['load_counters'].
+    
+    Args:
+        session: Neo4j session
+        df_transformed: Transformed DataFrame (output of transform_dataframe)
+        stats: Pipeline statistics dictionary (updated in place)
+        derived_edges: If False, steps 8-9 of the template are skipped
+        quarantine: Quarantine file the failed rows are written to (see
+                    record_row_errors)
+    """
+    load_counters = stats.setdefault('load_counters', {})
+    
+    for idx, row in df_transformed.iterrows():
+        row_data = None
+        try:
+            # Prepare row data
+            row_data = prepare_row_for_neo4j(row)
+            
+            # Insert into Neo4j
+            result = insert_row_to_neo4j(
+                session, row_data, stats, derived_edges=derived_edges
+            )
+            accumulate_counters(load_counters, result)
+            
+            stats['rows_processed'] += 1
+            
+            if stats['rows_processed'] % 10 == 0:
+                logger.info(f"Processed {stats['rows_processed']} rows...")
+                
+        except Exception as e:
+            if not is_row_error(e):
+                # The database is unavailable: the next rows would fail too
+                raise
+            stats['rows_with_errors'] += 1
+            record_row_errors(stats, [(idx, row_data, str(e))], quarantine)
+            logger.error(f"Error processing row {idx}: {str(e)}", exc_info=True)
+
+
+def insert_batch_to_neo4j(
+    session: Any,
+    rows: List[Dict[str, Any]],
+    stats: Optional[Dict[str, Any]] = None,
+    derived_edges: bool = True
+) -> Dict[str, Any]:
+    """
+    Insert a batch of rows into Neo4j with a single round trip.
+    
+    Uses the batched variant of the Cypher query (UNWIND $rows), so the
+    whole batch is written by one statement in one managed write
+    transaction (see execute_write_with_retry).
+    
+    Args:
+        session: Neo4j session
+        rows: List of dictionaries with normalized row data
+        stats: Statistics dictionary for retry counters (optional)
+        derived_edges: If False, steps 8-9 of the template are skipped
+                       (see generate_cypher_query)
+        
+    Returns:
+        Execution result with counters
+    """
+    query = generate_cypher_query(batched=True, derived_edges=derived_edges)
+    
+    return execute_write_with_retry(session, query, {'rows': rows}, stats)
+
+
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into consecutive lists of at most batch_size items.
+    
+    Args:
+        items: Items to split
+        batch_size: Maximum number of items per batch (must be >= 1)
+        
+    Yields:
+        Lists of items
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def accumulate_counters(totals: Dict[str, int], counters: Dict[str, Any]) -> None:
+    """
+    Add the counters of one write (row or batch) to running totals in place.
+    
+    Args:
+        totals: Running totals dictionary (updated in place)
+        counters: Counters returned by insert_row_to_neo4j / insert_batch_to_neo4j
+    """
+    for key, value in counters.items():
+        if isinstance(value, (int, float)):
+            totals[key] = totals.get(key, 0) + value
+
+
+def load_batches_to_neo4j(
+    session: Any,
+    df_transformed: pd.DataFrame,
+    batch_size: int,
+    stats: Dict[str, Any],
+    derived_edges: bool = True,
+    quarantine: Optional[QuarantineFile] = None
+) -> None:
+    """
+    Load a transformed DataFrame into Neo4j in batches of batch_size rows.
+    
+    Each batch is sent as a $rows list through one query. Counters from every
+    batch are aggregated into stats['load_counters']. If a batch fails, it is
+    bisected (see write_with_bisection) and only the offending rows are
+    recorded as errors.
+    
+    Args:
+        session: Neo4j session
+        df_transformed: Transformed DataFrame (output of transform_dataframe)
+        batch_size: Number of rows per batch
+        stats: Pipeline statistics dictionary (updated in place)
+        derived_edges: If False, steps 8-9 of the template are skipped
+        quarantine: Quarantine file the failed rows are written to (see
+                    record_row_errors)
+    """
+    records = (
+        (idx, prepare_row_for_neo4j(row)) for idx, row in df_transformed.iterrows()
+    )
+    load_records_in_batches(session, records, batch_size, stats, derived_edges, quarantine)
+
+
+def load_records_in_batches(
+    session: Any,
+    records: Iterable[Tuple[Any, Dict[str, Any]]],
+    batch_size: int,
+    stats: Dict[str, Any],
+    derived_edges: bool = True,
+    quarantine: Optional[QuarantineFile] = None
+) -> None:
+    """
+    Load prepared rows into Neo4j in batches of batch_size rows.
+    
+    Shared by the batched mode and the replay of load recordings.
+    
+    Args:
+        session: Neo4j session
+        records: Pairs of (source row index, output of prepare_row_for_neo4j)
+        batch_size: Number of rows per batch
+        stats: Pipeline statistics dictionary (updated in place)
+        derived_edges: If False, steps 8-9 of the template are skipped
+        quarantine: Quarantine file the failed rows are written to (see
+                    record_row_errors)
+    """
+    load_counters = stats.setdefault('load_counters', {})
+    
+    for batch in iter_batches(records, batch_size):
+        counters, failed = write_with_bisection(
+            lambda rows: insert_batch_to_neo4j(
+                session, rows, stats, derived_edges=derived_edges
+            ),
+            batch, stats
+        )
+        accumulate_counters(load_counters, counters)
+        
+        stats['rows_processed'] += len(batch) - len(failed)
+        if len(failed) < len(batch):
+            stats['batches_processed'] = stats.get('batches_processed', 0) + 1
+        if failed:
+            stats['batches_with_errors'] = stats.get('batches_with_errors', 0) + 1
+            stats['rows_with_errors'] += len(failed)
+            record_row_errors(stats, failed, quarantine)
+        
+        logger.info(
+            f"Batch of {len(batch)} rows loaded with {len(failed)} errors "
+            f"({stats['rows_processed']} rows total)"
+        )
+
+
+# ============================================================================
+# STEP 8B: PHASE-SPLIT LOADING (NODES FIRST, RELATIONSHIPS SECOND)
+# ============================================================================
+
+# Scalar fields of the load records (same keys as prepare_row_for_neo4j)
+RECORD_SCALAR_FIELDS = [
+    'name', 'email', 'role', 'linkedin_url', 'quantum_experience',
+    'event_expectations', 'organization', 'industry_sector',
+]
+
+# Vocabulary code columns carried by the records of a compacted frame
+RECORD_CODE_FIELDS = {
+    'interests': CODE_COLUMNS['interests_list'],
+    'problems': CODE_COLUMNS['problems_list'],
+}
+
+# Support of the derived edges, recounted from the graph (also used by the
+# graph_statistics refresh): the employees of Organization o with Problem
+# pr, and the persons with Problem pr and an interest in Domain d
+ORGANIZATION_PROBLEM_SUPPORT = """COUNT {
+        MATCH (p:Person)-[:WORKS_AT]->(o)
+        WHERE EXISTS { (p)-[:HAS_PROBLEM]->(pr) }
+    }"""
+PROBLEM_DOMAIN_SUPPORT = """COUNT {
+        MATCH (p:Person)-[:HAS_PROBLEM]->(pr)
+        WHERE EXISTS { (p)-[:HAS_INTEREST]->(d) }
+    }"""
+
+# One simple, plan-cacheable statement per phase. Phases run in this order:
+# all node upserts first, then one pass per relationship type.
+PHASE_QUERIES = {
+    'persons': """
+    UNWIND $rows AS row
+    MERGE (p:Person {email: row.email})
+    ON CREATE SET
+        p.name = row.name,
+        p.role = row.role,
+        p.linkedin_url = row.linkedin_url,
+        p.quantum_experience = row.quantum_experience,
+        p.event_expectations = row.event_expectations,
+        p.created_at = datetime()
+    ON MATCH SET
+        p.name = COALESCE(row.name, p.name),
+        p.role = COALESCE(row.role, p.role),
+        p.linkedin_url = COALESCE(row.linkedin_url, p.linkedin_url),
+        p.quantum_experience = COALESCE(row.quantum_experience, p.quantum_experience),
+        p.updated_at = datetime()
+    """,
+    'organizations': """
+    UNWIND $rows AS row
+    MERGE (o:Organization {name: row.name})
+    ON CREATE SET
+        o.industry_sector = row.industry_sector,
+        o.created_at = datetime()
+    ON MATCH SET
+        o.industry_sector = COALESCE(row.industry_sector, o.industry_sector),
+        o.updated_at = datetime()
+    """,
+    'domains': """
+    UNWIND $rows AS row
+    MERGE (d:Domain {name: row.name})
+    ON CREATE SET
+        d.created_at = datetime()
+    """,
+    'problems': """
+    UNWIND $rows AS row
+    MERGE (pr:Problem {name: row.name})
+    ON CREATE SET
+        pr.created_at = datetime()
+    """,
+    'works_at': """
+    UNWIND $rows AS row
+    MATCH (p:Person {email: row.email})
+    MATCH (o:Organization {name: row.organization})
+    MERGE (p)-[w:WORKS_AT]->(o)
+    ON CREATE SET
+        w.created_at = datetime()
+    """,
+    'has_interest': """
+    UNWIND $rows AS row
+    MATCH (p:Person {email: row.email})
+    MATCH (d:Domain {name: row.domain})
+    MERGE (p)-[hi:HAS_INTEREST]->(d)
+    ON CREATE SET
+        hi.created_at = datetime()
+    """,
+    'has_experience_in': """
+    UNWIND $rows AS row
+    MATCH (p:Person {email: row.email})
+    MATCH (d:Domain {name: row.domain})
+    MERGE (p)-[e:HAS_EXPERIENCE_IN]->(d)
+    ON CREATE SET
+        e.experience_level = row.experience_level,
+        e.created_at = datetime()
+    """,
+    'person_has_problem': """
+    UNWIND $rows AS row
+    MATCH (p:Person {email: row.email})
+    MATCH (pr:Problem {name: row.problem})
+    MERGE (p)-[hp:HAS_PROBLEM]->(pr)
+    ON CREATE SET
+        hp.created_at = datetime()
+    """,
+    'organization_has_problem': """
+    UNWIND $rows AS row
+    MATCH (o:Organization {name: row.organization})
+    MATCH (pr:Problem {name: row.problem})
+    MERGE (o)-[op:HAS_PROBLEM]->(pr)
+    ON CREATE SET
+        op.created_at = datetime()
+    SET op.support = """ + ORGANIZATION_PROBLEM_SUPPORT + """
+    """,
+    'can_be_solved_by': """
+    UNWIND $rows AS row
+    MATCH (pr:Problem {name: row.problem})
+    MATCH (d:Domain {name: row.domain})
+    MERGE (pr)-[csb:CAN_BE_SOLVED_BY]->(d)
+    ON CREATE SET
+        csb.created_at = datetime()
+    SET csb.support = """ + PROBLEM_DOMAIN_SUPPORT + """
+    """,
+}
+
+# Phases holding the edges derived from person data (steps 8-9 of the template).
+# Their support is recounted from the graph when the pair is written, not
+# taken from row.support: a streamed chunk or an incremental delta only
+# holds some of the persons behind a pair. Person edges are only ever
+# added, so the pairs of the rows being loaded are the only ones whose
+# support can change.
+DERIVED_EDGE_PHASES = ['organization_has_problem', 'can_be_solved_by']
+
+
+def build_load_records(
+    df_transformed: pd.DataFrame,
+    vocabulary: Optional[Vocabulary] = None
+) -> pd.DataFrame:
+    """
+    Build the load records for a whole DataFrame at once.
+    
+    Column-wise equivalent of calling prepare_row_for_neo4j on every row:
+    missing scalar values are None and 'interests'/'problems' are lists.
+    The names of a compacted frame (see compact_dataframe) are decoded from
+    its vocabulary codes, which are kept as 'interests_codes'/'problems_codes'.
+    
+    Args:
+        df_transformed: Transformed DataFrame (output of transform_dataframe)
+        vocabulary: Vocabulary that compacted df_transformed
+        
+    Returns:
+        DataFrame with one record per row, indexed like df_transformed
+        
+    Raises:
+        ValueError: If df_transformed is compacted and no vocabulary is given
+    """
+    records = pd.DataFrame(index=df_transformed.index)
+    
+    for field in RECORD_SCALAR_FIELDS:
+        if field in df_transformed.columns:
+            column = df_transformed[field].astype(object)
+            records[field] = column.where(column.notna(), None)
+        else:
+            records[field] = None
+    
+    for field, source in (('interests', 'interests_list'), ('problems', 'problems_list')):
+        code_column = RECORD_CODE_FIELDS[field]
+        if source in df_transformed.columns:
+            records[field] = df_transformed[source].apply(
+                lambda values: list(values) if isinstance(values, (list, tuple)) else []
+            )
+        elif code_column in df_transformed.columns:
+            if vocabulary is None:
+                raise ValueError(f"'{code_column}' can only be decoded with its vocabulary")
+            records[field] = vocabulary.decode_lists(df_transformed[code_column])
+        else:
+            records[field] = [[] for _ in range(len(df_transformed))]
+    
+    for code_column in RECORD_CODE_FIELDS.values():
+        if code_column in df_transformed.columns:
+            records[code_column] = df_transformed[code_column]
+    
+    return records
+
+
+def _explode_names(
+    records: pd.DataFrame,
+    list_column: str,
+    name_column: str,
+    vocabulary: Optional[Vocabulary] = None
+) -> pd.DataFrame:
+    """
+    Explode a list column into one (email, name) row per element.
+    
+    Names are trimmed and empty values dropped, mirroring the
+    `trim(x)` / `x <> ''` filters of the single-query template. Each
+    distinct name is trimmed once: the stored codes of the run's
+    vocabulary are used when the records have them, otherwise the
+    elements are factorized.
+    """
+    code_column = RECORD_CODE_FIELDS[list_column]
+    if vocabulary is not None and code_column in records.columns:
+        codes, positions = flatten_code_lists(records[code_column])
+        distinct = vocabulary.names
+    else:
+        lists = records[list_column]
+        lengths = np.fromiter((len(values) for values in lists), dtype=np.int64, count=len(lists))
+        positions = np.repeat(np.arange(len(lists), dtype=np.int64), lengths)
+        flat = np.fromiter(chain.from_iterable(lists), dtype=object, count=int(lengths.sum()))
+        # Missing names get code -1, i.e. the trailing '' below
+        codes, distinct = pd.factorize(flat)
+    distinct_names = np.array(
+        ['' if _is_missing(name) else str(name).strip() for name in distinct] + [''], dtype=object
+    )
+    exploded = pd.DataFrame(
+        {'email': records['email'].to_numpy(dtype=object)[positions], name_column: distinct_names[codes]},
+        index=records.index[positions]
+    )
+    return exploded[exploded[name_column] != '']
+
+
+def build_phase_frames(
+    records: pd.DataFrame,
+    vocabulary: Optional[Vocabulary] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Compute the distinct node and relationship rows for each load phase.
+    
+    Everything is deduplicated in pandas, so each phase touches each node or
+    relationship once per load instead of once per person. Records without
+    an email (the Person MERGE key) are ignored here and must be reported by
+    the caller.
+    
+    Unlike the single-query template, where the chained `WITH ... WHERE`
+    filters drop the rest of a row, a person without organization or without
+    interests still gets all of their other relationships.
+    
+    Args:
+        records: Load records (output of build_load_records)
+        vocabulary: Vocabulary that encoded the records' code columns
+                    (compact_columns runs), used instead of re-encoding
+                    the interest and problem names
+        
+    Returns:
+        Dictionary mapping phase name (see PHASE_QUERIES) to a DataFrame
+        whose columns are the query parameters of that phase
+    """
+    records = records[records['email'].notna()]
+    
+    persons = records[[
+        'email', 'name', 'role', 'linkedin_url',
+        'quantum_experience', 'event_expectations',
+    ]]
+    
+    # Organizations: later rows win for industry_sector (same as ON MATCH COALESCE)
+    with_org = records[records['organization'].notna()]
+    org_sectors = with_org.groupby('organization', sort=False)['industry_sector'].last()
+    organizations = pd.DataFrame({
+        'name': org_sectors.index,
+        'industry_sector': org_sectors.astype(object).where(org_sectors.notna(), None).values,
+    })
+    
+    interests = _explode_names(records, 'interests', 'domain', vocabulary)
+    problems = _explode_names(records, 'problems', 'problem', vocabulary)
+    
+    experienced = records.loc[
+        records['quantum_experience'].isin(['active', 'exploration']),
+        ['email', 'quantum_experience']
+    ]
+    has_experience_in = interests.merge(experienced, on='email').rename(
+        columns={'quantum_experience': 'experience_level'}
+    )
+    
+    frames = {
+        'persons': persons,
+        'organizations': organizations,
+        'domains': pd.DataFrame({'name': interests['domain'].unique()}),
+        'problems': pd.DataFrame({'name': problems['problem'].unique()}),
+        'works_at': with_org[['email', 'organization']].drop_duplicates(),
+        'has_interest': interests.drop_duplicates(),
+        'has_experience_in': has_experience_in.drop_duplicates(['email', 'domain']),
+        'person_has_problem': problems.drop_duplicates(),
+    }
+    frames.update(_aggregate_derived_edges(problems, interests, with_org))
+    
+    return frames
+
+
+def _support_counts(pairs: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Count the distinct persons (emails) behind every distinct pair."""
+    distinct = pairs[columns + ['email']].drop_duplicates()
+    return distinct.groupby(columns, sort=False).size().reset_index(name='support')
+
+
+def _aggregate_derived_edges(
+    problems: pd.DataFrame,
+    interests: pd.DataFrame,
+    with_org: pd.DataFrame
+) -> Dict[str, pd.DataFrame]:
+    """Distinct derived edges with support counts (see build_derived_edge_frames)."""
+    organization_problems = problems.merge(with_org[['email', 'organization']], on='email')
+    problem_domains = problems.merge(interests, on='email')
+    return {
+        'organization_has_problem': _support_counts(
+            organization_problems, ['organization', 'problem']
+        ),
+        'can_be_solved_by': _support_counts(problem_domains, ['problem', 'domain']),
+    }
+
+
+def build_derived_edge_frames(
+    records: pd.DataFrame,
+    vocabulary: Optional[Vocabulary] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Pre-aggregate the derived edges of steps 8-9 of the template.
+    
+    (Organization)-[:HAS_PROBLEM]->(Problem) and
+    (Problem)-[:CAN_BE_SOLVED_BY]->(Domain) are implied by person data, so
+    the per-person template re-MERGEs the same edge once per person behind
+    it. Here every distinct pair is computed once, with a support count:
+    the number of distinct persons (by email) of these records that imply
+    it. The bulk import writes that count; the load queries recount support
+    from the graph (see DERIVED_EDGE_PHASES). Records without an email are
+    ignored, like in build_phase_frames.
+    
+    Args:
+        records: Load records (output of build_load_records)
+        vocabulary: Vocabulary of the records' code columns (see
+                    build_phase_frames)
+        
+    Returns:
+        Dictionary with 'organization_has_problem' (organization, problem,
+        support) and 'can_be_solved_by' (problem, domain, support) frames
+    """
+    records = records[records['email'].notna()]
+    with_org = records[records['organization'].notna()]
+    return _aggregate_derived_edges(
+        _explode_names(records, 'problems', 'problem', vocabulary),
+        _explode_names(records, 'interests', 'domain', vocabulary),
+        with_org
+    )
+
+
+def insert_phase_batch_to_neo4j(
+    session: Any,
+    phase: str,
+    rows: List[Dict[str, Any]],
+    stats: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Write one batch of a load phase to Neo4j in a managed write transaction.
+    
+    Args:
+        session: Neo4j session
+        phase: Phase name (key of PHASE_QUERIES)
+        rows: List of parameter dictionaries for the phase query
+        stats: Statistics dictionary for retry counters (optional)
+        
+    Returns:
+        Execution result with counters
+    """
+    return execute_write_with_retry(session, PHASE_QUERIES[phase], {'rows': rows}, stats)
+
+
+def report_missing_emails(
+    records: pd.DataFrame,
+    stats: Dict[str, Any],
+    quarantine: Optional[QuarantineFile] = None
+) -> None:
+    """
+    Record load records without email (the Person MERGE key) as row errors.
+    
+    Args:
+        records: Load records (output of build_load_records)
+        stats: Pipeline statistics dictionary (updated in place)
+        quarantine: Quarantine file the rows are written to (see
+                    record_row_errors)
+    """
+    missing = records[records['email'].isna()].drop(
+        columns=list(RECORD_CODE_FIELDS.values()), errors='ignore'
+    )
+    stats['rows_with_errors'] += len(missing)
+    record_row_errors(
+        stats,
+        [
+            (idx, row_data, "Missing email (Person MERGE key)")
+            for idx, row_data in zip(missing.index, missing.to_dict('records'))
+        ],
+        quarantine
+    )
+
+
+def load_phase_rows(
+    session: Any,
+    phase: str,
+    indexed_rows: Iterable[Tuple[Any, Dict[str, Any]]],
+    batch_size: int,
+    stats: Dict[str, Any],
+    quarantine: Optional[QuarantineFile] = None
+) -> None:
+    """
+    Write the (row_index, row) pairs of one phase in batches of batch_size.
+    
+    Failed batches are bisected (see write_with_bisection), so only the
+    offending rows end up in stats['errors'], each tagged with its phase.
+    Only failed 'persons' rows count as rows with errors of the pipeline;
+    other phases keep their own count in stats['phases'][phase].
+    
+    Args:
+        session: Neo4j session
+        phase: Phase name (key of PHASE_QUERIES)
+        indexed_rows: Pairs of (source row index, query parameters)
+        batch_size: Number of rows per batch
+        stats: Statistics dictionary (updated in place)
+        quarantine: Quarantine file the failed rows are written to (see
+                    record_row_errors)
+    """
+    load_counters = stats.setdefault('load_counters', {})
+    phase_stats = stats.setdefault('phases', {}).setdefault(
+        phase, {'rows': 0, 'batches': 0, 'rows_with_errors': 0}
+    )
+    
+    for indexed_batch in iter_batches(indexed_rows, batch_size):
+        counters, failed = write_with_bisection(
+            lambda rows: insert_phase_batch_to_neo4j(session, phase, rows, stats),
+            indexed_batch,
+            stats
+        )
+        accumulate_counters(load_counters, counters)
+        
+        written = len(indexed_batch) - len(failed)
+        phase_stats['rows'] += written
+        phase_stats['rows_with_errors'] += len(failed)
+        if written:
+            phase_stats['batches'] += 1
+        if phase == 'persons':
+            stats['rows_processed'] += written
+            stats['rows_with_errors'] += len(failed)
+        
+        if failed:
+            record_row_errors(
+                stats,
+                [(idx if phase == 'persons' else None, row_data, error) for idx, row_data, error in failed],
+                quarantine,
+                phase=phase
+            )
+
+
+def load_phased_to_neo4j(
+    session: Any,
+    df_transformed: pd.DataFrame,
+    batch_size: int,
+    stats: Dict[str, Any],
+    vocabulary: Optional[Vocabulary] = None,
+    quarantine: Optional[QuarantineFile] = None
+) -> None:
+    """
+    Load a transformed DataFrame into Neo4j node phases first, then relationships.
+    
+    Each phase is written in batches of batch_size rows through its own query
+    (see PHASE_QUERIES). Per-phase row/batch counts are stored in
+    stats['phases'] and write counters in stats['load_counters'].
+    
+    Args:
+        session: Neo4j session
+        df_transformed: Transformed DataFrame (output of transform_dataframe)
+        batch_size: Number of rows per batch
+        stats: Pipeline statistics dictionary (updated in place)
+        vocabulary: Vocabulary of a compacted frame (see build_phase_frames)
+        quarantine: Quarantine file the failed rows are written to (see
+                    record_row_errors)
+    """
+    records = build_load_records(df_transformed, vocabulary)
+    report_missing_emails(records, stats, quarantine)
+    
+    for phase, frame in build_phase_frames(records, vocabulary).items():
+        load_phase_rows(
+            session, phase, zip(frame.index, frame.to_dict('records')), batch_size, stats,
+            quarantine
+        )
+        phase_stats = stats['phases'][phase]
+        logger.info(
+            f"Phase '{phase}' loaded: {phase_stats['rows']} rows in "
+            f"{phase_stats['batches']} batches"
+        )
+
+
+def load_derived_edges_to_neo4j(
+    session: Any,
+    df_transformed: pd.DataFrame,
+    batch_size: int,
+    stats: Dict[str, Any],
+    vocabulary: Optional[Vocabulary] = None,
+    quarantine: Optional[QuarantineFile] = None
+) -> None:
+    """
+    Write the pre-aggregated derived edges in one batched pass per edge type.
+    
+    Used after a per-person load that skipped steps 8-9 of the template
+    (derived_edges=False): every distinct Organization-Problem and
+    Problem-Domain pair is MERGEd once, with its support count (see
+    build_derived_edge_frames), instead of once per person, which removes
+    redundant write locks on popular Problem nodes. Support is recounted
+    from the graph for every written pair, so it stays exact across
+    streamed chunks and incremental runs. The Organization, Problem and
+    Domain nodes and the person relationships must already exist.
+    
+    Args:
+        session: Neo4j session
+        df_transformed: Transformed DataFrame (output of transform_dataframe)
+        batch_size: Number of rows per batch
+        stats: Pipeline statistics dictionary (updated in place)
+        vocabulary: Vocabulary of a compacted frame (see build_phase_frames)
+        quarantine: Quarantine file the failed rows are written to (see
+                    record_row_errors)
+    """
+    frames = build_derived_edge_frames(build_load_records(df_transformed, vocabulary), vocabulary)
+    
+    for phase in DERIVED_EDGE_PHASES:
+        frame = frames[phase]
+        load_phase_rows(
+            session, phase, zip(frame.index, frame.to_dict('records')), batch_size, stats,
+            quarantine
+        )
+        logger.info(f"Derived edges '{phase}' loaded: {len(frame)} distinct pairs")
+
+
+# ============================================================================
+# STEP 8C: PARALLEL MULTI-SESSION LOADING
+# ============================================================================
+
+# Column used to partition each phase across workers. Rows with the same
+# key always go to the same worker, so concurrent transactions never write
+# the same person, and derived edges on hot Problem nodes are serialized
+# per problem. Shared node phases have one row per node, so they are
+# partitioned by their own key.
+PHASE_PARTITION_KEYS = {
+    'persons': 'email',
+    'organizations': 'name',
+    'domains': 'name',
+    'problems': 'name',
+    'works_at': 'email',
+    'has_interest': 'email',
+    'has_experience_in': 'email',
+    'person_has_problem': 'email',
+    'organization_has_problem': 'problem',
+    'can_be_solved_by': 'problem',
+}
+
+
+def partition_frame(frame: pd.DataFrame, key: str, partitions: int) -> List[pd.DataFrame]:
+    """
+    Split a DataFrame into partitions by a stable hash of one column.
+    
+    CRC32 is used instead of hash() so partitions are reproducible across
+    processes (Python string hashing is randomized per process).
+    
+    Args:
+        frame: DataFrame to split
+        key: Column whose value decides the partition
+        partitions: Number of partitions
+        
+    Returns:
+        List of partitions (some may be empty)
+    """
+    # Hashed once per distinct value; missing values keep their own str()
+    codes, uniques = pd.factorize(frame[key])
+    unique_buckets = np.array(
+        [zlib.crc32(str(value).encode('utf-8')) % partitions for value in uniques], dtype=np.int64
+    )
+    buckets = unique_buckets[codes] if len(uniques) else np.zeros(len(frame), dtype=np.int64)
+    missing = codes < 0
+    if missing.any():
+        buckets[missing] = frame[key][missing].map(
+            lambda value: zlib.crc32(str(value).encode('utf-8')) % partitions
+        ).to_numpy()
+    return [frame[buckets == bucket] for bucket in range(partitions)]
+
+
+def merge_load_stats(totals: Dict[str, Any], partial: Dict[str, Any]) -> None:
+    """
+    Merge the statistics of one worker into the pipeline statistics in place.
+    
+    Numbers are added, lists are extended and nested dictionaries are merged
+    recursively.
+    
+    Args:
+        totals: Pipeline statistics dictionary (updated in place)
+        partial: Statistics produced by one worker
+    """
+    for key, value in partial.items():
+        if isinstance(value, dict):
+            merge_load_stats(totals.setdefault(key, {}), value)
+        elif isinstance(value, list):
+            totals.setdefault(key, []).extend(value)
+        elif isinstance(value, (int, float)):
+            totals[key] = totals.get(key, 0) + value
+        else:
+            totals[key] = value
+
+
+def _load_partition(
+    driver: Driver,
+    phase: str,
+    partition: pd.DataFrame,
+    batch_size: int,
+    quarantine: Optional[QuarantineFile] = None
+) -> Dict[str, Any]:
+    """Load one partition of a phase on its own session (worker entry point)."""
+    partial = {'rows_processed': 0, 'rows_with_errors': 0, 'errors': []}
+    with get_session(driver) as session:
+        load_phase_rows(
+            session, phase, zip(partition.index, partition.to_dict('records')),
+            batch_size, partial, quarantine
+        )
+    return partial
+
+
+def load_parallel_to_neo4j(
+    driver: Driver,
+    df_transformed: pd.DataFrame,
+    batch_size: int,
+    workers: int,
+    stats: Dict[str, Any],
+    vocabulary: Optional[Vocabulary] = None,
+    quarantine: Optional[QuarantineFile] = None
+) -> None:
+    """
+    Load a transformed DataFrame with a pool of sessions working in parallel.
+    
+    Phases run in the same order as load_phased_to_neo4j, with a barrier
+    between phases, so all shared nodes exist before relationships are
+    written. Within a phase, rows are partitioned by PHASE_PARTITION_KEYS and
+    each worker writes its partition on its own session, which keeps
+    concurrent transactions off each other's nodes. Deadlock retries are
+    counted in stats['deadlock_retries'].
+    
+    Args:
+        driver: Neo4j Driver instance (thread-safe, shared by all workers)
+        df_transformed: Transformed DataFrame (output of transform_dataframe)
+        batch_size: Number of rows per batch
+        workers: Number of concurrent sessions
+        stats: Pipeline statistics dictionary (updated in place)
+        vocabulary: Vocabulary of a compacted frame (see build_phase_frames)
+        quarantine: Quarantine file the failed rows are written to by the
+                    workers (see record_row_errors)
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    
+    records = build_load_records(df_transformed, vocabulary)
+    report_missing_emails(records, stats, quarantine)
+    stats.setdefault('deadlock_retries', 0)
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='neo4j-loader') as executor:
+        for phase, frame in build_phase_frames(records, vocabulary).items():
+            partitions = [
+                partition
+                for partition in partition_frame(frame, PHASE_PARTITION_KEYS[phase], workers)
+                if not partition.empty
+            ]
+            futures = [
+                executor.submit(_load_partition, driver, phase, partition, batch_size, quarantine)
+                for partition in partitions
+            ]
+            for future in futures:
+                merge_load_stats(stats, future.result())
+            
+            phase_stats = stats.get('phases', {}).get(phase, {'rows': 0, 'batches': 0})
+            logger.info(
+                f"Phase '{phase}' loaded by {len(partitions)} workers: "
+                f"{phase_stats['rows']} rows in {phase_stats['batches']} batches"
+            )
+
+
+# ============================================================================
+# STEP 8D: STREAMING EXTRACT
+# ============================================================================
+
+# Rows of the first chunk when a memory ceiling is set (measures the row size)
+STREAM_PROBE_ROWS = 100
+
+
+def stream_csv_chunks(
+    csv_file: Path,
+    chunk_rows: int,
+    max_chunk_memory_mb: Optional[float] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV file lazily, one chunk of rows at a time.
+    
+    Only one chunk is materialized at a time, so peak memory no longer grows
+    with the size of the input. If max_chunk_memory_mb is given, the first
+    chunk is a probe of at most STREAM_PROBE_ROWS rows, and the size of each
+    next chunk is adapted from the measured memory per row of the previous
+    chunk (pandas deep memory usage), so wide free-text rows produce smaller
+    chunks. Chunk sizes never exceed chunk_rows.
+    
+    Row labels continue across chunks (0..n-1 for the whole file), so error
+    row indices keep pointing at CSV rows.
+    
+    Args:
+        csv_file: Path to the CSV file
+        chunk_rows: Maximum number of rows per chunk
+        max_chunk_memory_mb: Approximate memory ceiling per raw chunk (optional)
+        
+    Yields:
+        DataFrames with the original CSV columns
+        
+    Raises:
+        ValueError: If chunk_rows or max_chunk_memory_mb is not positive
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be >= 1, got {chunk_rows}")
+    if max_chunk_memory_mb is not None and max_chunk_memory_mb <= 0:
+        raise ValueError(f"max_chunk_memory_mb must be > 0, got {max_chunk_memory_mb}")
+    
+    # Without a measurement yet, start from a small probe chunk
+    next_rows = chunk_rows if max_chunk_memory_mb is None else min(chunk_rows, STREAM_PROBE_ROWS)
+    with pd.read_csv(csv_file, iterator=True) as reader:
+        while True:
+            try:
+                chunk = reader.get_chunk(next_rows)
+            except StopIteration:
+                return
+            if chunk.empty:
+                return
+            
+            if max_chunk_memory_mb is not None:
+                bytes_per_row = chunk.memory_usage(deep=True).sum() / len(chunk)
+                budget_rows = int(max_chunk_memory_mb * 1024 * 1024 / max(bytes_per_row, 1))
+                next_rows = max(1, min(chunk_rows, budget_rows))
+            
+            logger.debug(f"Read chunk of {len(chunk)} rows (next chunk: {next_rows} rows)")
+            yield chunk
+
+
+# ============================================================================
+# STEP 8E: ARROW-BACKED EXTRACT
+# ============================================================================
+
+# CSV readers of the whole-file extract
+CSV_READERS = ('pandas', 'arrow')
+DEFAULT_CSV_READER = 'pandas'
+
+
+def read_csv_file(csv_file: Path, reader: str = DEFAULT_CSV_READER) -> pd.DataFrame:
+    """
+    Read the whole CSV file.
+    
+    - 'pandas': pd.read_csv with the C parser; every column is read, text
+      columns as object dtype
+    - 'arrow': pyarrow's CSV reader (see arrow_csv), reading only the
+      columns in COLUMN_MAPPING, all as string[pyarrow]. Other columns
+      ("Preferencia de comida", "Column 12", ...) are never materialized.
+      The transformed rows are the same as with 'pandas'
+    
+    Args:
+        csv_file: Path to the CSV file
+        reader: One of CSV_READERS ('arrow' requires pyarrow)
+        
+    Returns:
+        DataFrame with the original CSV column names
+        
+    Raises:
+        ValueError: If reader is not one of CSV_READERS
+    """
+    if reader not in CSV_READERS:
+        raise ValueError(f"Invalid CSV reader '{reader}'. Expected one of {CSV_READERS}")
+    if reader == 'arrow':
+        return read_csv_columns(csv_file, list(COLUMN_MAPPING))
+    return pd.read_csv(csv_file)
+
+
+# ============================================================================
+# STEP 9: COMPLETE ETL PIPELINE
+# ============================================================================
+
+def load_dataframe(
+    driver: Driver,
+    session: Any,
+    df_transformed: pd.DataFrame,
+    load_mode: str,
+    batch_size: int,
+    workers: int,
+    stats: Dict[str, Any],
+    async_loader: Optional[Any] = None,
+    preaggregate_derived_edges: bool = False,
+    vocabulary: Optional[Vocabulary] = None,
+    quarantine: Optional[QuarantineFile] = None
+) -> None:
+    """
+    Load a transformed DataFrame (or one chunk of it) with the given load mode.
+    
+    The 'phased' and 'parallel' modes always write the derived edges as
+    pre-aggregated pairs; the other modes do it when
+    preaggregate_derived_edges is True.
+    
+    Args:
+        driver: Neo4j Driver instance (used by modes with their own sessions)
+        session: Neo4j session
+        df_transformed: Transformed DataFrame (output of transform_dataframe)
+        load_mode: One of LOAD_MODES
+        batch_size: Number of rows per batch
+        workers: Number of concurrent sessions for the 'parallel' mode, or of
+                 batches in flight for the 'async' mode
+        stats: Pipeline statistics dictionary (updated in place)
+        async_loader: Open async_loader.AsyncLoader of the run ('async' mode only)
+        preaggregate_derived_edges: If True, the per-person writes skip steps 8-9
+                                    of the template and the derived edges are
+                                    written afterwards by load_derived_edges_to_neo4j
+        vocabulary: Vocabulary that compacted df_transformed (see compact_dataframe)
+        quarantine: Quarantine file the rows rejected by Neo4j are written to
+                    during the load (see record_row_errors)
+    """
+    if load_mode == 'phased':
+        load_phased_to_neo4j(session, df_transformed, batch_size, stats, vocabulary, quarantine)
+        return
+    if load_mode == 'parallel':
+        load_parallel_to_neo4j(
+            driver, df_transformed, batch_size, workers, stats, vocabulary, quarantine
+        )
+        return
+    
+    derived_edges = not preaggregate_derived_edges
+    # The per-row modes read the names (see prepare_row_for_neo4j)
+    df_rows = (
+        decode_dataframe(df_transformed, vocabulary) if vocabulary is not None else df_transformed
+    )
+    if load_mode == 'async':
+        if async_loader is None:
+            raise ValueError("The 'async' load mode needs an open AsyncLoader")
+        async_loader.load(
+            df_rows, batch_size, workers, stats,
+            derived_edges=derived_edges, quarantine=quarantine
+        )
+    elif load_mode == 'batched':
+        load_batches_to_neo4j(
+            session, df_rows, batch_size, stats, derived_edges=derived_edges,
+            quarantine=quarantine
+        )
+    else:
+        load_rows_to_neo4j(
+            session, df_rows, stats, derived_edges=derived_edges, quarantine=quarantine
+        )
+    
+    if preaggregate_derived_edges:
+        load_derived_edges_to_neo4j(
+            session, df_transformed, batch_size, stats, vocabulary, quarantine
+        )
+
+
+def quarantine_invalid_rows(
+    df_transformed: pd.DataFrame,
+    quarantine: QuarantineFile,
+    stats: Dict[str, Any]
+) -> pd.DataFrame:
+    """
+    Validate a transformed DataFrame and quarantine the rows that fail.
+    
+    Quarantined rows are written with their reason codes (see validation)
+    and are not counted in stats['errors'].
+    
+    Args:
+        df_transformed: Transformed DataFrame (output of transform_dataframe)
+        quarantine: Open quarantine file
+        stats: Pipeline statistics dictionary (updated in place)
+        
+    Returns:
+        The rows that passed validation (a new DataFrame if any row failed)
+    """
+    failures = validate_dataframe(df_transformed)
+    invalid = failures.any(axis=1).to_numpy()
+    validation = stats.setdefault('validation', {'rows_checked': 0, 'rows_quarantined': 0})
+    validation['rows_checked'] += len(df_transformed)
+    if not invalid.any():
+        return df_transformed
+    
+    # The offending values as they are (build_load_records would fix the lists)
+    columns = [
+        col for col in RECORD_SCALAR_FIELDS + ['interests_list', 'problems_list']
+        if col in df_transformed.columns
+    ]
+    rows = df_transformed.loc[invalid, columns].astype(object)
+    rows = rows.where(rows.notna(), None)
+    quarantine.write_rows(
+        (idx, reasons, None, row)
+        for idx, reasons, row in zip(rows.index, failure_reasons(failures), rows.to_dict('records'))
+    )
+    validation['rows_quarantined'] += int(invalid.sum())
+    logger.warning(f"{int(invalid.sum())} rows failed validation and were quarantined")
+    # A copy, not a slice: the later steps assign columns of the frame
+    return df_transformed[~invalid].copy()
+
+
+def update_incremental_manifest(
+    manifest_file: Path,
+    manifest_rows: Dict[str, str],
+    changed: pd.DataFrame,
+    stats: Dict[str, Any]
+) -> None:
+    """
+    Record the fingerprints of the rows loaded by this run in the manifest.
+    
+    Keys with a failed row keep their previous fingerprint, so they are
+    retried on the next run. If an error cannot be attributed to a row
+    (a failed relationship batch in the phased modes), the manifest is not
+    advanced at all and the next run retries every changed row.
+    
+    Args:
+        manifest_file: Path of the manifest file
+        manifest_rows: Fingerprints the run started from
+        changed: Rows selected by select_changed_rows that were sent to the load
+        stats: Pipeline statistics dictionary (updated in place)
+    """
+    if any(error.get('row_index') is None for error in stats['errors']):
+        logger.warning("Manifest not updated: some load errors are not attributable to rows")
+        stats['incremental']['manifest_updated'] = False
+        return
+    
+    failed_keys = set(
+        changed['key'].reindex([error['row_index'] for error in stats['errors']]).dropna()
+    )
+    loaded = changed[~changed['key'].isin(failed_keys)]
+    
+    updated_rows = dict(manifest_rows)
+    updated_rows.update(zip(loaded['key'], loaded['fingerprint']))
+    save_manifest(manifest_file, updated_rows)
+    stats['incremental']['manifest_updated'] = True
+
+
+
+# Supported strategies for the LOAD step of run_etl_pipeline
+LOAD_MODES = ('row', 'batched', 'phased', 'parallel', 'async')
+
+# Chunk size used by the pipelined mode when stream_chunk_rows is not given
+DEFAULT_PIPELINE_CHUNK_ROWS = 50
+
+
+def finish_run(
+    stats: Dict[str, Any],
+    started: float,
+    run_config: Dict[str, Any],
+    report_path: Optional[str] = None
+) -> None:
+    """
+    Summarize the load metrics of a run and write its report.
+    
+    Args:
+        stats: Pipeline statistics dictionary (updated in place)
+        started: time.perf_counter() value at the start of the run
+        run_config: Run configuration included in the report
+        report_path: Path of the JSON run report (optional)
+    """
+    stats['duration_seconds'] = time.perf_counter() - started
+    if 'load_metrics' in stats:
+        stats['load_metrics'] = summarize_load_metrics(stats['load_metrics'])
+    
+    if report_path:
+        write_run_report(Path(report_path), build_run_report(stats, run_config))
+
+
+def run_etl_pipeline(
+    csv_path: Optional[str] = None,
+    neo4j_uri: Optional[str] = None,
+    neo4j_user: Optional[str] = None,
+    neo4j_password: Optional[str] = None,
+    batch_size: int = 10,
+    clear_before_load: bool = False,
+    load_mode: str = 'row',
+    apply_schema: bool = True,
+    workers: int = 4,
+    incremental: bool = False,
+    manifest_path: Optional[str] = None,
+    clear_chunk_size: Optional[int] = None,
+    stream_chunk_rows: Optional[int] = None,
+    max_chunk_memory_mb: Optional[float] = None,
+    pipelined: bool = False,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    report_path: Optional[str] = None,
+    record_path: Optional[str] = None,
+    replay_path: Optional[str] = None,
+    staging_cache_dir: Optional[str] = None,
+    preaggregate_derived_edges: bool = False,
+    maintain_graph_statistics: bool = False,
+    transform_workers: int = 1,
+    compact_columns: bool = False,
+    resolve_organizations: bool = False,
+    organization_aliases_path: Optional[str] = None,
+    deduplicate_registrants: bool = False,
+    quarantine_path: Optional[str] = None,
+    csv_reader: str = DEFAULT_CSV_READER,
+    transform_engine: str = DEFAULT_TRANSFORM_ENGINE
+) -> Dict[str, Any]:
+    """
+    Execute the complete ETL pipeline.
+    
+    Neo4j credentials and CSV path can be provided as arguments or will be
+    loaded from environment variables via Settings:
+    - NEO4J_URI: Neo4j connection URI (e.g., "bolt://localhost:7687")
+    - NEO4J_USER: Neo4j username
+    - NEO4J_QUANTUM_NETWORK_AURA: Neo4j password
+    - CSV_PATH: Path to CSV file (optional, default: "data/quantum_network.csv")
+    
+    Args:
+        csv_path: Path to CSV file (optional, uses Settings.CSV_PATH or default)
+        neo4j_uri: Neo4j connection URI (optional, uses Settings.NEO4J_URI)
+        neo4j_user: Neo4j username (optional, uses Settings.NEO4J_USER)
+        neo4j_password: Neo4j password (optional, uses Settings.NEO4J_QUANTUM_NETWORK_AURA)
+        batch_size: Number of rows sent per query when load_mode is 'batched'
+        clear_before_load: If True, clears all existing nodes and relationships before loading.
+                          WARNING: This will delete ALL data in the graph!
+        clear_chunk_size: If set, clear_before_load deletes in transactions of at
+                          most this many entities (see clear_graph)
+        load_mode: How rows are written to Neo4j:
+                   - 'row': one query per CSV row (default)
+                   - 'batched': one UNWIND $rows query per batch of batch_size rows
+                   - 'phased': distinct nodes first, then one batched pass per
+                     relationship type (see load_phased_to_neo4j)
+                   - 'parallel': like 'phased', with each phase partitioned across
+                     a pool of sessions (see load_parallel_to_neo4j)
+                   - 'async': like 'batched', with up to `workers` batches in
+                     flight on the async driver (see async_loader)
+        apply_schema: If True (default), applies pending schema migrations
+                      (uniqueness constraints backing every MERGE key) before loading
+        workers: Number of concurrent sessions when load_mode is 'parallel', or
+                 of batches in flight when load_mode is 'async'
+        incremental: If True, only rows that are new or changed since the last
+                     run (according to the fingerprint manifest) are transformed
+                     and loaded. Ignored when clear_before_load is True.
+        manifest_path: Path of the fingerprint manifest, relative to the project
+                       root like csv_path (optional, default:
+                       "<csv file>.manifest.json" next to the CSV)
+        stream_chunk_rows: If set, the CSV is read, transformed and loaded in
+                           chunks of at most this many rows instead of all at
+                           once, so memory stays bounded and the first writes
+                           start after the first chunk is transformed
+        max_chunk_memory_mb: Approximate memory ceiling per chunk in streaming
+                             mode (see stream_csv_chunks)
+        pipelined: If True, extract, transform, LLM inference and load run as
+                   concurrent stages connected by bounded queues, so chunks
+                   are written while later chunks are still being inferred
+                   (implies streaming; chunks default to
+                   DEFAULT_PIPELINE_CHUNK_ROWS rows)
+        queue_size: Maximum number of chunks waiting between two pipelined stages
+        report_path: If set, a JSON run report (configuration, counters,
+                     throughput and latency metrics) is written to this path
+        record_path: If set, the parameters of every loaded row (output of
+                     prepare_row_for_neo4j) are recorded to this gzip JSONL
+                     file (see load_recording)
+        replay_path: If set, the CSV, transform and LLM inference are skipped
+                     and the rows of this load recording are written with
+                     batched writes of batch_size rows (load_mode is ignored)
+        staging_cache_dir: If set, the transformed DataFrame is cached as
+                           Parquet in this directory, keyed by the CSV hash and
+                           TRANSFORM_VERSION, and reused by later runs on the
+                           same file (see staging_cache; requires pyarrow)
+        preaggregate_derived_edges: If True, the 'row', 'batched' and 'async'
+                                    modes write the Organization-Problem and
+                                    Problem-Domain edges once per distinct pair,
+                                    with support counts, after the per-person
+                                    writes (see load_derived_edges_to_neo4j)
+        maintain_graph_statistics: If True, the interest/experience/problem counts
+                                   of the touched Domain and Problem nodes and the
+                                   support of their derived edges are recomputed
+                                   after every loaded chunk (see graph_statistics)
+        transform_workers: Number of processes normalizing the rows (steps 1-8).
+                           With more than 1, every frame or streamed chunk is
+                           split across a process pool (see parallel_transform);
+                           the LLM inference still runs in this process
+        compact_columns: If True, every transformed frame or chunk stores
+                         industry_sector, quantum_experience and organization
+                         as categoricals and its interest/problem lists as
+                         code lists of one Vocabulary shared by the whole
+                         load; the names are decoded when the load records
+                         are built (see vocabulary)
+        resolve_organizations: If True, variants of an organization name
+                               ('IBM', 'IBM Research', 'ibm ') are mapped to
+                               one canonical name before loading (see
+                               entity_resolution)
+        organization_aliases_path: Alias table CSV of resolve_organizations
+                                   (default: next to the CSV, see
+                                   default_alias_table_path). Its mappings
+                                   (reviewed by hand if needed) are pinned
+                                   when the file exists, and it is always
+                                   rewritten with every name seen after the
+                                   load, so every merge can be reviewed
+        deduplicate_registrants: If True, the rows of a person who registered
+                                 several times (same normalized email) are
+                                 merged in pandas before loading, so each
+                                 person is written once per organization
+                                 (see registrant_consolidation). In streaming
+                                 mode, rows are merged within each chunk
+        quarantine_path: If set, every transformed frame or chunk is validated
+                         first (see validation). Failing rows are written to
+                         this JSONL file with reason codes instead of being
+                         loaded. Rows rejected by Neo4j are written there
+                         by the loaders as they fail, and stats['errors']
+                         keeps only their index and message
+        csv_reader: Reader of the whole-file extract (one of CSV_READERS).
+                    'arrow' reads only the mapped columns, as Arrow-backed
+                    strings (see read_csv_file). It also changes the
+                    incremental fingerprints (unmapped columns are no longer
+                    hashed), so the first incremental run after switching
+                    reloads every row
+        transform_engine: Normalization engine (one of TRANSFORM_ENGINES).
+                          With 'python', one LinkedInNormalizer is shared by
+                          every frame or chunk normalized in this process
+        
+    Returns:
+        Dictionary with process statistics, including:
+        - load_counters: Nodes/relationships created and deleted
+        - load_metrics: Write throughput and latency (see summarize_load_metrics)
+        - graph_statistics: Refresh counters (only with maintain_graph_statistics)
+        - organization_resolution: Resolver counters and aliases_path (only with
+          resolve_organizations)
+        - registrant_consolidation: Rows merged and writes eliminated (only
+          with deduplicate_registrants)
+        - validation: Rows checked and quarantined, per reason code (only
+          with quarantine_path)
+        - linkedin_normalizer: LinkedInNormalizer.stats() of the run (only
+          with transform_engine='python')
+        - duration_seconds: Wall time of the run
+        
+    Raises:
+        ValueError: If required credentials are not provided or the load
+                    options are invalid
+        FileNotFoundError: If CSV file is not found
+    """
+    # Get values from Settings if not provided as arguments
+    csv_path = csv_path or settings.CSV_PATH
+    neo4j_uri = neo4j_uri or settings.NEO4J_URI
+    neo4j_user = neo4j_user or settings.NEO4J_USER
+    neo4j_password = neo4j_password or settings.NEO4J_QUANTUM_NETWORK_AURA
+    
+    # Validate that we have the necessary credentials
+    if not neo4j_uri:
+        raise ValueError(
+            "NEO4J_URI is not defined. Provide it as an argument or in environment variables."
+        )
+    if not neo4j_user:
+        raise ValueError(
+            "NEO4J_USER is not defined. Provide it as an argument or in environment variables."
+        )
+    if not neo4j_password:
+        raise ValueError(
+            "NEO4J_QUANTUM_NETWORK_AURA is not defined. "
+            "Provide it as an argument or in environment variables."
+        )
+    if load_mode not in LOAD_MODES:
+        raise ValueError(
+            f"Unknown load_mode '{load_mode}'. Expected one of: {', '.join(LOAD_MODES)}"
+        )
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    if stream_chunk_rows is not None and stream_chunk_rows < 1:
+        raise ValueError(f"stream_chunk_rows must be >= 1, got {stream_chunk_rows}")
+    if max_chunk_memory_mb is not None and max_chunk_memory_mb <= 0:
+        raise ValueError(f"max_chunk_memory_mb must be > 0, got {max_chunk_memory_mb}")
+    if queue_size < 1:
+        raise ValueError(f"queue_size must be >= 1, got {queue_size}")
+    if transform_workers < 1:
+        raise ValueError(f"transform_workers must be >= 1, got {transform_workers}")
+    if csv_reader not in CSV_READERS:
+        raise ValueError(f"Invalid CSV reader '{csv_reader}'. Expected one of {CSV_READERS}")
+    if transform_engine not in TRANSFORM_ENGINES:
+        raise ValueError(
+            f"Invalid transform engine '{transform_engine}'. Expected one of {TRANSFORM_ENGINES}"
+        )
+    if organization_aliases_path is not None and not resolve_organizations:
+        raise ValueError("organization_aliases_path requires resolve_organizations")
+    if pipelined and stream_chunk_rows is None:
+        stream_chunk_rows = DEFAULT_PIPELINE_CHUNK_ROWS
+    if csv_reader == 'arrow' and stream_chunk_rows is not None:
+        # Streaming reads its chunks with stream_csv_chunks (pandas)
+        raise ValueError("csv_reader='arrow' cannot be combined with streaming or pipelined")
+    if stream_chunk_rows is not None and incremental:
+        # Group fingerprints need every registration of a person at once
+        raise ValueError(
+            "incremental mode cannot be combined with stream_chunk_rows or pipelined"
+        )
+    if replay_path is not None and (
+        incremental or stream_chunk_rows is not None or record_path or quarantine_path
+    ):
+        raise ValueError(
+            "replay_path cannot be combined with incremental, streaming, pipelined, "
+            "record_path or quarantine_path"
+        )
+    if staging_cache_dir is not None:
+        if stream_chunk_rows is not None or replay_path is not None:
+            raise ValueError(
+                "staging_cache_dir cannot be combined with streaming, pipelined or replay_path"
+            )
+        require_pyarrow()
+    
+    started = time.perf_counter()
+    stats = {
+        'rows_processed': 0,
+        'rows_with_errors': 0,
+        'errors': []
+    }
+    
+    # Resolve paths relative to project root
+    project_root = Path(__file__).parent.parent.parent
+    
+    def resolve_path(path: str) -> Path:
+        resolved = Path(path)
+        return resolved if resolved.is_absolute() else project_root / resolved
+    
+    csv_file = resolve_path(csv_path)
+    replay_file = resolve_path(replay_path) if replay_path is not None else None
+    
+    run_config = {
+        'csv_path': str(csv_file),
+        'load_mode': load_mode,
+        'batch_size': batch_size,
+        'workers': workers,
+        'clear_before_load': clear_before_load,
+        'apply_schema': apply_schema,
+        'incremental': incremental,
+        'stream_chunk_rows': stream_chunk_rows,
+        'pipelined': pipelined,
+        'queue_size': queue_size,
+        'record_path': record_path,
+        'replay_path': str(replay_file) if replay_file is not None else None,
+        'staging_cache_dir': staging_cache_dir,
+        'preaggregate_derived_edges': preaggregate_derived_edges,
+        'maintain_graph_statistics': maintain_graph_statistics,
+        'transform_workers': transform_workers,
+        'compact_columns': compact_columns,
+        'resolve_organizations': resolve_organizations,
+        'organization_aliases_path': organization_aliases_path,
+        'deduplicate_registrants': deduplicate_registrants,
+        'quarantine_path': quarantine_path,
+        'csv_reader': csv_reader,
+        'transform_engine': transform_engine,
+    }
+    
+    # One memo for the whole run: profiles repeat across chunks and events
+    linkedin_normalizer = None
+    if transform_engine == 'python':
+        # Imported here: the normalizer builds on this module
+        from src.pipeline.linkedin_normalizer import LinkedInNormalizer
+        linkedin_normalizer = LinkedInNormalizer()
+    
+    delta = None
+    if replay_file is not None:
+        # REPLAY: Rows come ready for loading from a previous recording
+        logger.info(f"REPLAY: Loading recorded parameters from {replay_file}")
+        if not replay_file.exists():
+            raise FileNotFoundError(f"Load recording not found: {replay_file}")
+        transformed_chunks: Iterable[pd.DataFrame] = []
+    elif not csv_file.exists():
+        raise FileNotFoundError(f"CSV file not found: {csv_file}")
+    elif stream_chunk_rows is not None:
+        # Generator pipeline: each chunk is transformed only when the loader
+        # asks for it, so only one chunk is held in memory at a time
+        logger.info(f"EXTRACT: Streaming CSV file {csv_file}")
+        logger.info(f"Streaming mode: chunks of up to {stream_chunk_rows} rows")
+        raw_chunks = stream_csv_chunks(csv_file, stream_chunk_rows, max_chunk_memory_mb)
+        if transform_workers > 1 and not pipelined:
+            # Imported here: the parallel transform builds on this module
+            from src.pipeline.parallel_transform import ParallelTransformer
+            
+            def transform_in_processes(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+                # One process pool for the whole stream
+                with ParallelTransformer(transform_workers, transform_engine) as transformer:
+                    for chunk in chunks:
+                        yield transformer.transform(chunk)
+            
+            transformed_chunks = transform_in_processes(raw_chunks)
+        else:
+            transformed_chunks = (
+                transform_dataframe(chunk, transform_engine, linkedin_normalizer)
+                for chunk in raw_chunks
+            )
+    else:
+        # EXTRACT: Load CSV
+        logger.info("EXTRACT: Loading CSV file")
+        logger.info(f"CSV path: {csv_file}")
+        df = read_csv_file(csv_file, csv_reader)
+        logger.info(f"Loaded {len(df)} rows from CSV")
+        
+        # STAGING CACHE: Reuse the transformed frame of a previous run
+        staged = None
+        if staging_cache_dir is not None:
+            cache_file = staging_cache_path(
+                resolve_path(staging_cache_dir), csv_file, TRANSFORM_VERSION
+            )
+            staged = load_staged_frame(cache_file)
+            stats['staging_cache'] = {'path': str(cache_file), 'hit': staged is not None}
+    
+        # DELTA: Keep only new or changed rows (incremental mode)
+        if incremental:
+            manifest_file = (
+                resolve_path(manifest_path) if manifest_path else default_manifest_path(csv_file)
+            )
+            # A cleared graph needs every row again, so start from an empty manifest
+            manifest_rows = {} if clear_before_load else load_manifest(manifest_file)
+            delta = select_changed_rows(normalize_column_names(df), manifest_rows)
+            df = df[delta['changed'].values]
+            stats['incremental'] = {
+                'manifest_path': str(manifest_file),
+                'rows_total': len(delta),
+                'rows_changed': len(df),
+                'rows_unchanged': len(delta) - len(df),
+            }
+            logger.info(
+                f"Incremental mode: {len(df)} new or changed rows, "
+                f"{len(delta) - len(df)} unchanged rows skipped"
+            )
+            if df.empty:
+                logger.info("Nothing to load: CSV unchanged since last run")
+                finish_run(stats, started, run_config, report_path)
+                return stats
+    
+        # TRANSFORM: Normalize and clean
+        if staged is not None:
+            logger.info("TRANSFORM: Using cached transformed data")
+            # Row labels are kept by the cache, so a delta is a label lookup
+            df_transformed = staged.loc[df.index]
+        else:
+            logger.info("TRANSFORM: Normalizing and cleaning data")
+            if transform_workers > 1:
+                from src.pipeline.parallel_transform import ParallelTransformer
+                with ParallelTransformer(transform_workers, transform_engine) as transformer:
+                    df_transformed = transformer.transform(df)
+            else:
+                df_transformed = transform_dataframe(df, transform_engine, linkedin_normalizer)
+            # Only a transform of the whole file can be reused by later runs
+            if staging_cache_dir is not None and (delta is None or delta['changed'].all()):
+                write_staged_frame(df_transformed, cache_file)
+        logger.info(f"DataFrame transformed: {len(df_transformed)} rows")
+        logger.debug(f"Columns: {list(df_transformed.columns)}")
+        transformed_chunks = [df_transformed]
+    
+    # LOAD: Insert into Neo4j
+    logger.info("LOAD: Inserting data into Neo4j")
+    logger.info(f"Neo4j URI: {neo4j_uri}")
+    logger.info(f"Neo4j User: {neo4j_user}")
+    logger.info(f"Load mode: {load_mode} (batch size: {batch_size})")
+    
+    # Create driver and execute pipeline
+    driver = create_driver(neo4j_uri, neo4j_user, neo4j_password)
+    
+    try:
+        with get_session(driver) as session:
+            # Clear graph if requested (before loading new data)
+            if clear_before_load:
+                logger.warning("Clearing graph before loading new data...")
+                clear_stats = clear_graph(session, confirm=True, chunk_size=clear_chunk_size)
+                stats['graph_cleared'] = clear_stats
+                logger.info(
+                    f"Graph cleared: {clear_stats['nodes_deleted']} nodes, "
+                    f"{clear_stats['relationships_deleted']} relationships deleted"
+                )
+            
+            # Bootstrap constraints/indexes so MERGE lookups are index seeks
+            if apply_schema:
+                stats['schema_migrations'] = apply_schema_migrations(session)
+            
+            if maintain_graph_statistics:
+                # Imported here: the statistics module builds on this module
+                from src.pipeline.graph_statistics import (
+                    collect_touched_keys,
+                    new_touched_keys,
+                    refresh_graph_statistics,
+                    track_touched_keys,
+                )
+            
+            with ExitStack() as stack:
+                recording = None
+                if record_path:
+                    recording = stack.enter_context(LoadRecording(resolve_path(record_path)))
+                
+                vocabulary = Vocabulary() if compact_columns else None
+                
+                resolver = None
+                if resolve_organizations:
+                    aliases_file = (
+                        resolve_path(organization_aliases_path)
+                        if organization_aliases_path is not None
+                        else default_alias_table_path(csv_file)
+                    )
+                    resolver = OrganizationResolver(aliases=read_alias_table(aliases_file))
+                
+                quarantine = None
+                if quarantine_path:
+                    quarantine = stack.enter_context(QuarantineFile(resolve_path(quarantine_path)))
+                
+                async_loader = None
+                if load_mode == 'async':
+                    # Imported here: the async loader builds on this module
+                    from src.pipeline.async_loader import AsyncLoader
+                    async_loader = stack.enter_context(
+                        AsyncLoader(neo4j_uri, neo4j_user, neo4j_password)
+                    )
+                
+                def load_chunk(df_transformed: pd.DataFrame) -> None:
+                    if quarantine is not None:
+                        df_transformed = quarantine_invalid_rows(df_transformed, quarantine, stats)
+                    if resolver is not None and 'organization' in df_transformed.columns:
+                        df_transformed['organization'] = resolver.resolve_series(
+                            df_transformed['organization']
+                        )
+                    if vocabulary is not None:
+                        df_transformed = compact_dataframe(df_transformed, vocabulary)
+                    if deduplicate_registrants:
+                        df_transformed, consolidation = consolidate_registrants(df_transformed)
+                        accumulate_counters(
+                            stats.setdefault('registrant_consolidation', {}), consolidation
+                        )
+                    if recording is not None:
+                        df_names = (
+                            decode_dataframe(df_transformed, vocabulary)
+                            if vocabulary is not None else df_transformed
+                        )
+                        recording.write_rows(
+                            (idx, prepare_row_for_neo4j(row)) for idx, row in df_names.iterrows()
+                        )
+                    load_started = time.perf_counter()
+                    load_dataframe(
+                        driver, session, df_transformed, load_mode, batch_size, workers, stats,
+                        async_loader=async_loader,
+                        preaggregate_derived_edges=preaggregate_derived_edges,
+                        vocabulary=vocabulary,
+                        quarantine=quarantine
+                    )
+                    # Wall-clock load time, for the throughput of overlapping writes
+                    record_load_seconds(stats, time.perf_counter() - load_started)
+                    if maintain_graph_statistics:
+                        touched = new_touched_keys()
+                        collect_touched_keys(
+                            build_load_records(df_transformed, vocabulary).to_dict('records'),
+                            touched
+                        )
+                        refresh_graph_statistics(session, touched, batch_size, stats)
+                    if stream_chunk_rows is not None:
+                        stats['chunks_processed'] = stats.get('chunks_processed', 0) + 1
+                        logger.info(
+                            f"Chunk {stats['chunks_processed']} loaded "
+                            f"({stats['rows_processed']} rows processed so far)"
+                        )
+                
+                if replay_file is not None:
+                    records = read_load_recording(replay_file)
+                    if maintain_graph_statistics:
+                        touched = new_touched_keys()
+                        records = track_touched_keys(records, touched)
+                    load_started = time.perf_counter()
+                    load_records_in_batches(session, records, batch_size, stats)
+                    record_load_seconds(stats, time.perf_counter() - load_started)
+                    if maintain_graph_statistics:
+                        refresh_graph_statistics(session, touched, batch_size, stats)
+                elif pipelined:
+                    # Transform and inference run in worker threads; the load
+                    # stays in this thread because the session is not thread-safe
+                    logger.info(f"Pipelined mode: stage queues hold up to {queue_size} chunks")
+                    def normalize(chunk: pd.DataFrame) -> pd.DataFrame:
+                        return normalize_dataframe(chunk, transform_engine, linkedin_normalizer)
+                    
+                    if transform_workers > 1:
+                        from src.pipeline.parallel_transform import ParallelTransformer
+                        normalize = stack.enter_context(
+                            ParallelTransformer(transform_workers, transform_engine)
+                        ).normalize
+                    stats['pipeline_stages'] = run_staged_pipeline(
+                        raw_chunks,
+                        [('transform', normalize), ('inference', infer_problems)],
+                        load_chunk,
+                        queue_size=queue_size
+                    )
+                else:
+                    for df_transformed in transformed_chunks:
+                        load_chunk(df_transformed)
+                
+                if recording is not None:
+                    stats['rows_recorded'] = recording.rows_written
+                
+                if linkedin_normalizer is not None:
+                    stats['linkedin_normalizer'] = linkedin_normalizer.stats()
+                
+                if quarantine is not None:
+                    validation = stats.setdefault('validation', {'rows_checked': 0, 'rows_quarantined': 0})
+                    validation['quarantine_path'] = str(quarantine.path)
+                    validation['reasons'] = dict(quarantine.reason_counts)
+                
+                if 'registrant_consolidation' in stats:
+                    logger.info(
+                        f"Registrant consolidation: "
+                        f"{stats['registrant_consolidation']['writes_eliminated']} row writes eliminated"
+                    )
+                
+                if resolver is not None:
+                    stats['organization_resolution'] = resolver.stats()
+                    logger.info(
+                        f"Organizations resolved: {stats['organization_resolution']['names']} names "
+                        f"into {stats['organization_resolution']['clusters']} organizations"
+                    )
+                    stats['organization_resolution']['aliases_path'] = str(aliases_file)
+                    write_alias_table(aliases_file, resolver.alias_table())
+    finally:
+        close_driver(driver)
+    
+    # Advance the manifest only with rows that were actually loaded
+    if delta is not None:
+        update_incremental_manifest(
+            manifest_file, manifest_rows, delta[delta['changed']], stats
+        )
+    
+    finish_run(stats, started, run_config, report_path)
+    
+    logger.info("Pipeline completed successfully")
     logger.info(f"Rows processed: {stats['rows_processed']}")
     logger.info(f"Rows with errors: {stats['rows_with_errors']}")
+    if 'load_metrics' in stats and stats['load_metrics']['rows_per_second']:
+        logger.info(
+            f"Write throughput: {stats['load_metrics']['rows_per_second']:.1f} rows/s, "
+            f"p95 latency {stats['load_metrics']['latency_ms']['p95']:.1f} ms"
+        )
     
     if stats['errors']:
         logger.warning(f"Total errors encountered: {len(stats['errors'])}")
@@ -0,0 +1,181 @@
+"""
+Load-time graph statistics for the Quantum Network Knowledge Graph.
+
+The strategic ranking queries (most frequent problems, capability gaps)
+aggregate `count(DISTINCT p)` over every HAS_PROBLEM / HAS_INTEREST /
+HAS_EXPERIENCE_IN relationship on each call. The loader can instead keep
+the counts as properties, so those queries become property reads:
+
+- Domain: interested_count, experienced_count, interest_experience_ratio
+  (interested / experienced, or interested when nobody has experience)
+- Problem: people_count
+- (Problem)-[:CAN_BE_SOLVED_BY]->(Domain): support (persons with the
+  problem and an interest in the domain) and support_ratio
+  (support / people_count of the problem)
+- (Organization)-[:HAS_PROBLEM]->(Problem): support (employees with the
+  problem)
+
+The statistics are refreshed after every loaded batch of rows, only for
+the Domain and Problem nodes the batch touched. Each refresh recomputes
+the exact counts of those nodes from the graph instead of adding deltas:
+MERGE makes re-loading a person a no-op, and a delta would count them
+twice.
+
+Usage (through the pipeline):
+    run_etl_pipeline(maintain_graph_statistics=True)
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+from src.core.logger import get_logger
+from src.pipeline.etl_to_graph import (
+    ORGANIZATION_PROBLEM_SUPPORT,
+    PROBLEM_DOMAIN_SUPPORT,
+    execute_write_with_retry,
+)
+
+# Initialize logger
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+DOMAIN_STATISTICS_QUERY = """
+UNWIND $names AS name
+MATCH (d:Domain {name: name})
+WITH d,
+     COUNT { (:Person)-[:HAS_INTEREST]->(d) } AS interested,
+     COUNT { (:Person)-[:HAS_EXPERIENCE_IN]->(d) } AS experienced
+SET d.interested_count = interested,
+    d.experienced_count = experienced,
+    d.interest_experience_ratio = CASE
+        WHEN experienced = 0 THEN interested * 1.0
+        ELSE interested * 1.0 / experienced
+    END,
+    d.statistics_updated_at = datetime()
+"""
+
+PROBLEM_STATISTICS_QUERY = """
+UNWIND $names AS name
+MATCH (pr:Problem {name: name})
+WITH pr, COUNT { (:Person)-[:HAS_PROBLEM]->(pr) } AS people
+SET pr.people_count = people,
+    pr.statistics_updated_at = datetime()
+WITH pr, people
+MATCH (pr)-[csb:CAN_BE_SOLVED_BY]->(d:Domain)
+WITH csb, people, """ + PROBLEM_DOMAIN_SUPPORT + """ AS support
+SET csb.support = support,
+    csb.support_ratio = CASE WHEN people = 0 THEN 0.0 ELSE support * 1.0 / people END
+"""
+
+ORGANIZATION_PROBLEM_STATISTICS_QUERY = """
+UNWIND $names AS name
+MATCH (o:Organization)-[op:HAS_PROBLEM]->(pr:Problem {name: name})
+SET op.support = """ + ORGANIZATION_PROBLEM_SUPPORT + """
+"""
+
+# Touched key -> queries refreshing it, in order
+STATISTICS_QUERIES = {
+    'domains': [DOMAIN_STATISTICS_QUERY],
+    'problems': [PROBLEM_STATISTICS_QUERY, ORGANIZATION_PROBLEM_STATISTICS_QUERY],
+}
+
+
+# ============================================================================
+# TOUCHED KEYS
+# ============================================================================
+
+def new_touched_keys() -> Dict[str, Set[str]]:
+    """Create an empty set of touched Domain and Problem names."""
+    return {'domains': set(), 'problems': set()}
+
+
+def collect_touched_keys(
+    rows: Iterable[Dict[str, Any]],
+    touched: Dict[str, Set[str]]
+) -> None:
+    """
+    Add the Domain and Problem names referenced by load rows.
+
+    Args:
+        rows: Row parameters (output of prepare_row_for_neo4j)
+        touched: Touched keys (see new_touched_keys, updated in place)
+    """
+    # The load query trims domain and problem names the same way
+    for row in rows:
+        for interest in row.get('interests') or []:
+            if interest and interest.strip():
+                touched['domains'].add(interest.strip())
+        for problem in row.get('problems') or []:
+            if problem and problem.strip():
+                touched['problems'].add(problem.strip())
+
+
+def track_touched_keys(
+    records: Iterable[Tuple[Any, Dict[str, Any]]],
+    touched: Dict[str, Set[str]]
+) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """
+    Pass (row index, row) records through, collecting their touched keys.
+
+    Args:
+        records: Pairs of (source row index, row parameters)
+        touched: Touched keys (updated in place as records are consumed)
+
+    Yields:
+        The same records
+    """
+    for idx, row in records:
+        collect_touched_keys([row], touched)
+        yield idx, row
+
+
+# ============================================================================
+# REFRESH
+# ============================================================================
+
+def refresh_graph_statistics(
+    session: Any,
+    touched: Dict[str, Set[str]],
+    batch_size: int,
+    stats: Dict[str, Any]
+) -> None:
+    """
+    Recompute the statistics of the touched Domain and Problem nodes.
+
+    Statistics are recorded in stats['graph_statistics']:
+    - refreshes: Number of refresh calls
+    - domains / problems: Number of node refreshes (a node touched by two
+      batches counts twice)
+    - errors: Number of failed refresh writes (the load itself is not failed)
+
+    Args:
+        session: Neo4j session
+        touched: Touched keys (see collect_touched_keys)
+        batch_size: Maximum number of names per write
+        stats: Pipeline statistics dictionary (updated in place)
+    """
+    summary = stats.setdefault(
+        'graph_statistics', {'refreshes': 0, 'domains': 0, 'problems': 0, 'errors': 0}
+    )
+    summary['refreshes'] += 1
+
+    for key, queries in STATISTICS_QUERIES.items():
+        names: List[str] = sorted(touched[key])
+        for start in range(0, len(names), batch_size):
+            batch = names[start:start + batch_size]
+            try:
+                for query in queries:
+                    execute_write_with_retry(session, query, {'names': batch})
+                summary[key] += len(batch)
+            except Exception as e:
+                # Stale counts are fixed by the next refresh of the same nodes
+                summary['errors'] += 1
+                logger.error(f"Error refreshing statistics of {len(batch)} {key}: {str(e)}")
+
+    logger.info(
+        f"Graph statistics refreshed: {len(touched['domains'])} domains, "
+        f"{len(touched['problems'])} problems"
+    )
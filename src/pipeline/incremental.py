@@ -0,0 +1,243 @@
+"""
+Incremental (delta) loading support for the ETL pipeline.
+
+Every registration row gets a content fingerprint computed from its
+normalized values. Fingerprints are kept in a local JSON manifest, keyed
+by person email, so the next run can skip the rows that did not change and
+only send new or modified registrations through LLM inference and loading.
+
+Manifest format:
+    {
+        "version": 1,
+        "updated_at": "2024-01-01T00:00:00+00:00",
+        "rows": {"<row key>": "<fingerprint>", ...}
+    }
+
+The manifest is written atomically (temporary file + rename), so an
+interrupted run never leaves a half-written manifest behind.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.core.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Bump when the fingerprint computation changes, so old manifests are ignored
+MANIFEST_VERSION = 1
+
+# Columns that do not affect the graph and must not trigger a reload
+IGNORED_COLUMNS = ['timestamp']
+
+# Separators that cannot appear in CSV cell values after normalization
+_FIELD_SEPARATOR = '\x1f'
+_ROW_SEPARATOR = '\x1e'
+
+
+# ============================================================================
+# FINGERPRINTS
+# ============================================================================
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def compute_row_fingerprints(
+    df: pd.DataFrame,
+    columns: Optional[List[str]] = None
+) -> pd.Series:
+    """
+    Compute a content fingerprint for every row.
+
+    Values are normalized before hashing (missing values become empty
+    strings, surrounding whitespace is removed), so cosmetic differences in
+    the CSV do not trigger a reload. Columns are hashed in sorted order.
+
+    Args:
+        df: DataFrame with normalized column names
+        columns: Columns to include (default: all except IGNORED_COLUMNS)
+
+    Returns:
+        Series of hex fingerprints, indexed like df
+    """
+    if columns is None:
+        columns = [col for col in df.columns if col not in IGNORED_COLUMNS]
+    columns = sorted(columns)
+
+    if df.empty:
+        return pd.Series([], index=df.index, dtype=object)
+
+    values = df[columns].astype(object).where(df[columns].notna(), '')
+    normalized = values.apply(lambda col: col.map(lambda value: str(value).strip()))
+    joined = normalized.apply(_FIELD_SEPARATOR.join, axis=1)
+
+    return joined.map(_sha256)
+
+
+def compute_row_keys(df: pd.DataFrame, fingerprints: pd.Series) -> pd.Series:
+    """
+    Compute the manifest key of every row.
+
+    Rows are keyed by normalized email (the Person MERGE key). Rows without
+    email fall back to their own fingerprint.
+
+    Args:
+        df: DataFrame with normalized column names
+        fingerprints: Row fingerprints (output of compute_row_fingerprints)
+
+    Returns:
+        Series of row keys, indexed like df
+    """
+    if 'email' in df.columns:
+        emails = df['email'].astype(object).where(df['email'].notna(), '')
+        emails = emails.map(lambda value: str(value).strip().lower())
+    else:
+        emails = pd.Series('', index=df.index, dtype=object)
+
+    return emails.where(emails != '', 'row:' + fingerprints)
+
+
+def compute_group_fingerprints(keys: pd.Series, fingerprints: pd.Series) -> pd.Series:
+    """
+    Combine the fingerprints of all rows sharing a key.
+
+    A person who registered several times is one Person node, so the group
+    is reloaded as a whole when any of its rows changes.
+
+    Args:
+        keys: Row keys (output of compute_row_keys)
+        fingerprints: Row fingerprints
+
+    Returns:
+        Series with the group fingerprint of every row, indexed like keys
+    """
+    if keys.empty:
+        return fingerprints
+    return fingerprints.groupby(keys, sort=False).transform(
+        lambda group: group.iloc[0] if len(group) == 1 else _sha256(_ROW_SEPARATOR.join(group))
+    )
+
+
+# ============================================================================
+# MANIFEST
+# ============================================================================
+
+def default_manifest_path(csv_file: Path) -> Path:
+    """
+    Get the default manifest location for a CSV file (next to the CSV).
+
+    Args:
+        csv_file: Path to the CSV file
+
+    Returns:
+        Path of the manifest file
+    """
+    return csv_file.with_name(f"{csv_file.name}.manifest.json")
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, str]:
+    """
+    Load the row fingerprints of a previous run.
+
+    A missing, unreadable or outdated manifest is treated as empty, which
+    makes the next run a full load.
+
+    Args:
+        manifest_path: Path of the manifest file
+
+    Returns:
+        Dictionary mapping row key to fingerprint
+    """
+    if not manifest_path.exists():
+        return {}
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+        return {}
+
+    if manifest.get('version') != MANIFEST_VERSION:
+        logger.warning(
+            f"Ignoring manifest {manifest_path} with version {manifest.get('version')} "
+            f"(expected {MANIFEST_VERSION})"
+        )
+        return {}
+
+    return manifest.get('rows', {})
+
+
+def save_manifest(manifest_path: Path, rows: Dict[str, str]) -> None:
+    """
+    Write the manifest atomically.
+
+    The content is written to a temporary file in the same directory and
+    then renamed over the previous manifest.
+
+    Args:
+        manifest_path: Path of the manifest file
+        rows: Dictionary mapping row key to fingerprint
+    """
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'updated_at': datetime.now(timezone.utc).isoformat(),
+        'rows': rows,
+    }
+
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=manifest_path.parent, prefix=f".{manifest_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, manifest_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    logger.info(f"Manifest updated: {manifest_path} ({len(rows)} keys)")
+
+
+# ============================================================================
+# DELTA SELECTION
+# ============================================================================
+
+def select_changed_rows(
+    df_normalized: pd.DataFrame,
+    manifest_rows: Dict[str, str]
+) -> pd.DataFrame:
+    """
+    Compare every row against the manifest.
+
+    Args:
+        df_normalized: DataFrame with normalized column names
+        manifest_rows: Fingerprints of the previous run (output of load_manifest)
+
+    Returns:
+        DataFrame indexed like df_normalized with columns:
+        - key: manifest key of the row
+        - fingerprint: group fingerprint to store once the row is loaded
+        - changed: True if the row is new or its content changed
+    """
+    row_fingerprints = compute_row_fingerprints(df_normalized)
+    keys = compute_row_keys(df_normalized, row_fingerprints)
+    fingerprints = compute_group_fingerprints(keys, row_fingerprints)
+
+    return pd.DataFrame({
+        'key': keys,
+        'fingerprint': fingerprints,
+        'changed': keys.map(manifest_rows) != fingerprints,
+    }, index=df_normalized.index)
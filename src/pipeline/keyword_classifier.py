@@ -0,0 +1,122 @@
+"""
+Compiled keyword classifier for rule-based inference.
+
+The rule-based inference functions test each category with its own
+`any(keyword in text for keyword in [...])` scan, so every text is
+scanned once per keyword. KeywordClassifier compiles all the keywords of
+all the categories into one alternation regex and finds every matched
+category in a single pass over the text.
+
+- Matching is accent-insensitive and case-insensitive: texts and keywords
+  are folded (NFKD, combining marks removed, lowercased) before matching,
+  so 'informacion' matches 'Información'
+- The regex is wrapped in a lookahead, so it tests every position of the
+  text and overlapping keywords are all found. At each position the
+  longest keyword wins, and a keyword also reports the categories of the
+  keywords it contains (e.g. 'oportunidades de colaboración' reports
+  'colaboración' too), so the result equals the per-keyword scans
+- classify_series classifies every distinct text of a Series once
+
+Usage:
+    classifier = KeywordClassifier([('networking', ['networking', 'contactos'])])
+    classifier.classify('Networking y contactos')  # ['networking']
+    classifier.classify_series(df['event_expectations'])
+"""
+
+import re
+import unicodedata
+from typing import Any, Dict, List, Sequence, Tuple
+
+import pandas as pd
+
+
+def fold_text(text: str) -> str:
+    """
+    Fold a text for keyword matching (accents removed, lowercased).
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        Folded text
+    """
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+class KeywordClassifier:
+    """
+    Single-pass matcher of keyword categories.
+
+    Args:
+        categories: Ordered (category, keywords) pairs. classify returns the
+                    matched categories in this order
+    """
+
+    def __init__(self, categories: Sequence[Tuple[str, Sequence[str]]]):
+        self.categories = [category for category, _ in categories]
+
+        # Folded keyword -> indexes of the categories it belongs to
+        keyword_categories: Dict[str, set] = {}
+        for index, (_, keywords) in enumerate(categories):
+            for keyword in keywords:
+                folded = fold_text(keyword)
+                if folded:
+                    keyword_categories.setdefault(folded, set()).add(index)
+
+        # A match of a keyword implies a match of every keyword inside it
+        self._matches: Dict[str, Tuple[int, ...]] = {}
+        for keyword in keyword_categories:
+            indexes = set()
+            for other, other_indexes in keyword_categories.items():
+                if other in keyword:
+                    indexes |= other_indexes
+            self._matches[keyword] = tuple(sorted(indexes))
+
+        # Longest first, so the alternation prefers the longest keyword
+        alternatives = sorted(self._matches, key=lambda keyword: (-len(keyword), keyword))
+        self._pattern = (
+            re.compile('(?=(' + '|'.join(map(re.escape, alternatives)) + '))')
+            if alternatives else None
+        )
+
+    def classify(self, text: str) -> List[str]:
+        """
+        Return the categories whose keywords appear in a text.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            Matched categories, in category order
+        """
+        if self._pattern is None or not text:
+            return []
+
+        matched = set()
+        for match in self._pattern.finditer(fold_text(text)):
+            matched.update(self._matches[match.group(1)])
+        return [self.categories[index] for index in sorted(matched)]
+
+    def classify_series(self, series: pd.Series) -> pd.Series:
+        """
+        Classify every cell of a Series, once per distinct value.
+
+        Missing cells get an empty list. Other cells are classified as
+        str(value). Every row gets its own list.
+
+        Args:
+            series: Texts to classify
+
+        Returns:
+            Object Series with the list of matched categories of every cell
+        """
+        # Factorized as str(), so values such as 1 and 1.0 stay apart
+        codes, distinct = pd.factorize(series.astype(str).to_numpy(dtype=object))
+        codes[series.isna().to_numpy()] = -1
+        results: List[List[str]] = [self.classify(value) for value in distinct]
+
+        def categories_of(code: Any) -> List[str]:
+            return list(results[code]) if code >= 0 else []
+
+        return pd.Series([categories_of(code) for code in codes], index=series.index, dtype=object)
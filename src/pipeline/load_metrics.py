@@ -0,0 +1,235 @@
+"""
+Load metrics and run reports for the ETL pipeline.
+
+Every write transaction sent by the loaders is recorded with its row count,
+client-side latency and the server-side timings from the result summary:
+
+- result_available_after: ms until the server had the first result ready
+  (query planning + execution)
+- result_consumed_after: ms until the server had streamed the whole result
+
+The pipeline also records the wall-clock time of its load calls
+(record_load_seconds). The latencies add up to more than that when writes
+overlap (parallel and async modes), so throughput is reported both ways:
+rows_per_second over the wall-clock load time, and rows_per_write_second
+over the summed write latencies.
+
+While loading, the raw measurements live in stats['load_metrics'] as plain
+numbers and lists, so the statistics of parallel workers can be merged by
+adding them. At the end of the run they are summarized (latency
+percentiles, rows/sec) and can be written, together with the rest of the
+pipeline statistics, to a machine-readable JSON run report:
+
+    {
+        "report_version": 2,
+        "generated_at": "2024-01-01T00:00:00+00:00",
+        "config": {"load_mode": "batched", "batch_size": 100, ...},
+        "stats": {"rows_processed": 1000, "load_metrics": {...}, ...}
+    }
+
+Comparing the reports of two releases on the same input shows load
+regressions (fewer rows/sec, higher p95 latency, more retries).
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.core.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Bump when the report layout changes (2: rows_per_second is wall-clock)
+REPORT_VERSION = 2
+
+
+# ============================================================================
+# RECORDING
+# ============================================================================
+
+def _new_load_metrics() -> Dict[str, Any]:
+    return {
+        'writes': 0,
+        'failed_writes': 0,
+        'rows_written': 0,
+        'write_seconds': 0.0,
+        'load_seconds': 0.0,
+        'latencies_ms': [],
+        'timed_writes': 0,
+        'result_available_after_ms': 0,
+        'result_consumed_after_ms': 0,
+    }
+
+
+def record_write(
+    stats: Dict[str, Any],
+    rows: int,
+    seconds: float,
+    available_after: Any = None,
+    consumed_after: Any = None,
+    failed: bool = False
+) -> None:
+    """
+    Record one write transaction in stats['load_metrics'].
+
+    Args:
+        stats: Pipeline statistics dictionary (updated in place)
+        rows: Number of rows sent with the transaction
+        seconds: Client-side latency, including retries
+        available_after: Server result_available_after in ms (optional)
+        consumed_after: Server result_consumed_after in ms (optional)
+        failed: True if the transaction finally failed
+    """
+    metrics = stats.setdefault('load_metrics', _new_load_metrics())
+    if failed:
+        metrics['failed_writes'] += 1
+        return
+
+    metrics['writes'] += 1
+    metrics['rows_written'] += rows
+    metrics['write_seconds'] += seconds
+    metrics['latencies_ms'].append(seconds * 1000)
+    if isinstance(available_after, (int, float)) and isinstance(consumed_after, (int, float)):
+        metrics['timed_writes'] += 1
+        metrics['result_available_after_ms'] += available_after
+        metrics['result_consumed_after_ms'] += consumed_after
+
+
+def record_load_seconds(stats: Dict[str, Any], seconds: float) -> None:
+    """
+    Add the wall-clock time of one load call to stats['load_metrics'].
+
+    Args:
+        stats: Pipeline statistics dictionary (updated in place)
+        seconds: Wall-clock time of the load call
+    """
+    stats.setdefault('load_metrics', _new_load_metrics())
+    stats['load_metrics']['load_seconds'] = stats['load_metrics'].get('load_seconds', 0.0) + seconds
+
+
+def summarize_load_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn the raw load metrics into a summary.
+
+    Args:
+        metrics: Raw metrics from stats['load_metrics']
+
+    Returns:
+        Dictionary with:
+        - writes / failed_writes / rows_written: Totals
+        - write_seconds: Sum of the write latencies
+        - load_seconds: Wall-clock time of the load
+        - rows_per_second: Rows written per second of load_seconds, or None
+          if no load time was recorded
+        - rows_per_write_second: Rows written per second of write_seconds
+          (the throughput of a single writer; lower than rows_per_second
+          when writes overlap)
+        - latency_ms: mean, p50, p95 and max client-side write latency
+        - server_ms: Total and mean result_available_after /
+          result_consumed_after over the writes that reported them
+    """
+    latencies = np.asarray(metrics.get('latencies_ms', []), dtype=float)
+    write_seconds = metrics.get('write_seconds', 0.0)
+    load_seconds = metrics.get('load_seconds', 0.0)
+    rows_written = metrics.get('rows_written', 0)
+    timed_writes = metrics.get('timed_writes', 0)
+
+    latency_ms: Dict[str, Optional[float]] = {'mean': None, 'p50': None, 'p95': None, 'max': None}
+    if latencies.size:
+        latency_ms = {
+            'mean': float(latencies.mean()),
+            'p50': float(np.percentile(latencies, 50)),
+            'p95': float(np.percentile(latencies, 95)),
+            'max': float(latencies.max()),
+        }
+
+    server_ms: Dict[str, Any] = {
+        'result_available_after': metrics.get('result_available_after_ms', 0),
+        'result_consumed_after': metrics.get('result_consumed_after_ms', 0),
+        'mean_result_available_after': None,
+        'mean_result_consumed_after': None,
+    }
+    if timed_writes:
+        server_ms['mean_result_available_after'] = server_ms['result_available_after'] / timed_writes
+        server_ms['mean_result_consumed_after'] = server_ms['result_consumed_after'] / timed_writes
+
+    return {
+        'writes': metrics.get('writes', 0),
+        'failed_writes': metrics.get('failed_writes', 0),
+        'rows_written': rows_written,
+        'write_seconds': write_seconds,
+        'load_seconds': load_seconds,
+        'rows_per_second': rows_written / load_seconds if load_seconds > 0 else None,
+        'rows_per_write_second': rows_written / write_seconds if write_seconds > 0 else None,
+        'latency_ms': latency_ms,
+        'server_ms': server_ms,
+    }
+
+
+# ============================================================================
+# RUN REPORT
+# ============================================================================
+
+def _json_default(value: Any) -> Any:
+    # numpy scalars (e.g. DataFrame row indices) and anything else unexpected
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def build_run_report(stats: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the machine-readable report of a pipeline run.
+
+    Row data is left out of the error entries: the report is meant to be
+    archived and compared, and must not carry personal data.
+
+    Args:
+        stats: Statistics returned by run_etl_pipeline
+        config: Run configuration (load mode, batch size, ...)
+
+    Returns:
+        Report dictionary
+    """
+    report_stats = {key: value for key, value in stats.items() if key != 'errors'}
+    errors: List[Dict[str, Any]] = [
+        {key: value for key, value in error.items() if key != 'row_data'}
+        for error in stats.get('errors', [])
+    ]
+    report_stats['errors'] = errors
+
+    return {
+        'report_version': REPORT_VERSION,
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'config': config,
+        'stats': report_stats,
+    }
+
+
+def write_run_report(report_path: Path, report: Dict[str, Any]) -> None:
+    """
+    Write a run report as JSON (atomically: temporary file + rename).
+
+    Args:
+        report_path: Path of the report file
+        report: Report dictionary (output of build_run_report)
+    """
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=report_path.parent, prefix=f".{report_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=_json_default)
+        os.replace(tmp_path, report_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    logger.info(f"Run report written to {report_path}")
@@ -0,0 +1,147 @@
+"""
+Record and replay of Neo4j load parameters.
+
+Re-loading a graph normally means re-running the whole transform,
+including one LLM call per row. A load recording keeps the exact parameter
+dictionaries produced by prepare_row_for_neo4j in a gzip-compressed JSONL
+file, so a test or staging graph can be rebuilt later from the recording
+alone, paying only the Neo4j write time.
+
+File format (one JSON document per line, gzip-compressed):
+
+    {"format": "quantum-network-load-params", "version": 1, "created_at": "..."}
+    {"row_index": 0, "row": {"name": "...", "email": "...", "interests": [...], ...}}
+    {"row_index": 1, "row": {...}}
+
+The recording is written to a temporary file and renamed into place when
+it is closed without error, so a failed run never leaves a truncated
+recording behind.
+
+Usage:
+    with LoadRecording(Path("data/load_params.jsonl.gz")) as recording:
+        recording.write_rows(indexed_rows)
+
+    for row_index, row in read_load_recording(Path("data/load_params.jsonl.gz")):
+        ...
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from src.core.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+RECORDING_FORMAT = 'quantum-network-load-params'
+
+# Bump when the layout of the row parameters changes
+RECORDING_VERSION = 1
+
+
+def _json_default(value: Any) -> Any:
+    # numpy scalars (row indices, numeric cells) are not JSON serializable
+    if hasattr(value, 'item'):
+        return value.item()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# ============================================================================
+# RECORDING
+# ============================================================================
+
+class LoadRecording:
+    """
+    Writer for a load recording (context manager).
+
+    Rows are appended with write_rows. The file only appears at its final
+    path when the context exits without an exception.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.rows_written = 0
+        self._tmp_path: Optional[str] = None
+        self._raw: Any = None
+        self._file: Any = None
+
+    def __enter__(self) -> 'LoadRecording':
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        self._raw = os.fdopen(fd, 'wb')
+        self._file = gzip.open(self._raw, 'wt', encoding='utf-8')
+        header = {
+            'format': RECORDING_FORMAT,
+            'version': RECORDING_VERSION,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+        }
+        self._file.write(json.dumps(header) + '\n')
+        return self
+
+    def write_rows(self, indexed_rows: Iterable[Tuple[Any, Dict[str, Any]]]) -> None:
+        """
+        Append rows to the recording.
+
+        Args:
+            indexed_rows: Pairs of (source row index, row parameters)
+        """
+        for row_index, row in indexed_rows:
+            record = {'row_index': row_index, 'row': row}
+            self._file.write(
+                json.dumps(record, ensure_ascii=False, default=_json_default) + '\n'
+            )
+            self.rows_written += 1
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            # GzipFile does not close a file object it was given
+            self._file.close()
+            self._raw.close()
+            if exc_type is None:
+                os.replace(self._tmp_path, self.path)
+                logger.info(f"Load recording written: {self.path} ({self.rows_written} rows)")
+        finally:
+            # No-op after a successful rename
+            Path(self._tmp_path).unlink(missing_ok=True)
+
+
+# ============================================================================
+# REPLAY
+# ============================================================================
+
+def read_load_recording(path: Path) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """
+    Read the rows of a load recording lazily.
+
+    Args:
+        path: Path of the recording
+
+    Yields:
+        Pairs of (source row index, row parameters)
+
+    Raises:
+        ValueError: If the file is not a load recording of a supported version
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline() or '{}')
+        if header.get('format') != RECORDING_FORMAT:
+            raise ValueError(f"{path} is not a load recording")
+        if header.get('version') != RECORDING_VERSION:
+            raise ValueError(
+                f"Unsupported load recording version {header.get('version')} in {path} "
+                f"(expected {RECORDING_VERSION})"
+            )
+
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record['row_index'], record['row']
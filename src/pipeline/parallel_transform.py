@@ -0,0 +1,133 @@
+"""
+Multi-process transform for large inputs.
+
+normalize_dataframe runs on one core. ParallelTransformer splits the rows
+of a DataFrame into contiguous chunks, normalizes the chunks in a
+ProcessPoolExecutor and concatenates the results in the original row
+order, so a large ingest uses every core of the ETL host.
+
+- Only steps 1-8 (normalize_dataframe) run in the worker processes. The
+  LLM inference (infer_problems) runs in the calling process, which keeps
+  its own client and concurrency
+- Every row is normalized independently, so the concatenated chunks are
+  identical to a single-process transform
+- Frames smaller than two chunks of min_chunk_rows are normalized in the
+  calling process: pickling them to a worker costs more than it saves
+- The pool is created once per context and reused for every frame, so
+  streamed chunks do not pay the process start-up each time
+
+Usage:
+    with ParallelTransformer(workers=8) as transformer:
+        df_transformed = transformer.transform(df)
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.core.logger import get_logger
+from src.pipeline.etl_to_graph import (
+    DEFAULT_TRANSFORM_ENGINE,
+    infer_problems,
+    normalize_dataframe,
+)
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Minimum number of rows sent to a worker process
+DEFAULT_MIN_CHUNK_ROWS = 10_000
+
+
+def split_rows(df: pd.DataFrame, parts: int, min_chunk_rows: int) -> List[pd.DataFrame]:
+    """
+    Split a DataFrame into at most `parts` contiguous row chunks.
+
+    Args:
+        df: DataFrame to split
+        parts: Maximum number of chunks
+        min_chunk_rows: Minimum number of rows per chunk (the last chunk
+                        may be the only one, with fewer rows)
+
+    Returns:
+        Chunks in row order (at least one, possibly empty)
+    """
+    chunks = max(1, min(parts, len(df) // max(min_chunk_rows, 1)))
+    bounds = np.linspace(0, len(df), chunks + 1).astype(int)
+    return [df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+class ParallelTransformer:
+    """
+    Process pool running normalize_dataframe over row chunks (context manager).
+
+    Args:
+        workers: Number of worker processes (1 runs in the calling process)
+        engine: Normalization engine (one of TRANSFORM_ENGINES)
+        min_chunk_rows: Minimum number of rows per worker chunk
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        engine: str = DEFAULT_TRANSFORM_ENGINE,
+        min_chunk_rows: int = DEFAULT_MIN_CHUNK_ROWS
+    ):
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self.workers = workers
+        self.engine = engine
+        self.min_chunk_rows = min_chunk_rows
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'ParallelTransformer':
+        if self.workers > 1:
+            # Spawned, not forked: the pipeline runs loader and stage threads,
+            # and forking a multi-threaded process can deadlock the child
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+            )
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._executor is not None:
+            # Pending chunks are cancelled when the transform failed
+            self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+            self._executor = None
+
+    def normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Normalize a DataFrame (steps 1-8) across the worker processes.
+
+        Args:
+            df: Original DataFrame from CSV
+
+        Returns:
+            Same result as normalize_dataframe(df, engine)
+        """
+        chunks = split_rows(df, self.workers, self.min_chunk_rows)
+        if self._executor is None or len(chunks) == 1:
+            return normalize_dataframe(df, self.engine)
+
+        logger.info(f"Normalizing {len(df)} rows in {len(chunks)} chunks across {self.workers} processes")
+        # map yields the results in submission order, i.e. row order
+        results = list(self._executor.map(normalize_dataframe, chunks, repeat(self.engine)))
+        return pd.concat(results)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parallel counterpart of transform_dataframe.
+
+        The LLM inference (steps 9-10) runs in the calling process.
+
+        Args:
+            df: Original DataFrame from CSV
+
+        Returns:
+            Same result as transform_dataframe(df, engine)
+        """
+        return infer_problems(self.normalize(df))
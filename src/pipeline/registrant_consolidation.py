@@ -0,0 +1,150 @@
+"""
+Pre-load consolidation of repeated registrations.
+
+The same person often registers for several events, so the CSV holds
+several rows with the same email. Loaded as they are, every row is a
+separate write that MERGEs the same Person node and reconciles its
+properties with `ON MATCH SET ... COALESCE(...)`. consolidate_registrants
+merges those rows in pandas before the load:
+
+- Rows are grouped by normalized email (trimmed, lowercased, as the
+  incremental manifest keys them). Rows without email are left as they are
+- Scalar fields keep the last non-null value of the person's rows (later
+  registrations win, like ON MATCH COALESCE), so a field left blank in the
+  latest registration keeps the earlier answer. New HAS_EXPERIENCE_IN
+  relationships therefore get the latest experience level, where the
+  first row used to win
+- email, the Person MERGE key, is the exception: it keeps the person's
+  first registration as written. The first row is the one a row-by-row
+  load creates the Person with, and registrations appended to the export
+  later do not change it, so the key does not flip between runs when the
+  latest registration uses different casing
+- A person keeps one record per distinct organization (rows without
+  organization are merged into the person's latest one), so no WORKS_AT
+  relationship is lost. industry_sector is the last non-null value, and
+  interests_list and problems_list the ordered union of the lists, of the
+  rows merged into the record
+- Each record takes the row label and position of the first row it merges
+- On a compacted frame (see vocabulary) the unions are taken over the
+  code lists that replace interests_list and problems_list (codes map 1:1
+  to names, so the union is the same)
+
+Usage:
+    df_transformed, consolidation_stats = consolidate_registrants(df_transformed)
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.pipeline.vocabulary import CODE_COLUMNS
+
+# List columns merged as ordered unions (names, or their codes in a compacted frame)
+LIST_COLUMNS = ['interests_list', 'problems_list'] + list(CODE_COLUMNS.values())
+
+
+def email_keys(emails: pd.Series) -> pd.Series:
+    """
+    Normalize emails for grouping (trimmed, lowercased, missing or empty -> None).
+
+    Args:
+        emails: Email column
+
+    Returns:
+        Object Series of keys, indexed like emails
+    """
+    keys = emails.astype(object).where(emails.notna(), None)
+    keys = keys.map(lambda value: str(value).strip().lower() or None, na_action='ignore')
+    return keys.where(keys.notna(), None)
+
+
+def _ordered_union(lists: pd.Series) -> List[Any]:
+    merged: Dict[Any, None] = {}
+    for values in lists:
+        if isinstance(values, (list, tuple)):
+            merged.update(dict.fromkeys(values))
+    return list(merged)
+
+
+def _relationship_entries(df: pd.DataFrame) -> int:
+    # Organization and list entries: each one is a MERGE of the row's write
+    entries = int(df['organization'].notna().sum()) if 'organization' in df.columns else 0
+    for col in LIST_COLUMNS:
+        if col in df.columns:
+            entries += int(df[col].map(lambda values: len(values) if isinstance(values, (list, tuple)) else 0).sum())
+    return entries
+
+
+def consolidate_registrants(df_transformed: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """
+    Merge the rows of every person who registered several times.
+
+    Args:
+        df_transformed: Transformed DataFrame (output of transform_dataframe
+                        or compact_dataframe)
+
+    Returns:
+        Tuple of (consolidated DataFrame, statistics) where statistics has:
+        - rows_in / rows_out: Rows before and after consolidation
+        - persons_consolidated: Emails that had more than one row
+        - writes_eliminated: Row writes no longer sent to Neo4j
+        - entries_eliminated: Organization, interest and problem entries
+          no longer MERGEd (repeated across a person's rows)
+    """
+    stats = {
+        'rows_in': len(df_transformed),
+        'rows_out': len(df_transformed),
+        'persons_consolidated': 0,
+        'writes_eliminated': 0,
+        'entries_eliminated': 0,
+    }
+    if 'email' not in df_transformed.columns or df_transformed.empty:
+        return df_transformed, stats
+
+    keys = email_keys(df_transformed['email'])
+    repeated = (keys.notna() & keys.duplicated(keep=False)).to_numpy()
+    if not repeated.any():
+        return df_transformed, stats
+
+    # Only the repeated registrations are regrouped; other rows stay untouched
+    positions = pd.RangeIndex(len(df_transformed))[repeated]
+    rows = df_transformed.iloc[positions].copy()
+    person = keys.iloc[positions].to_numpy()
+    by_person = rows.groupby(person, sort=False)
+
+    # Organization of every row (rows without one join the person's latest)
+    if 'organization' in rows.columns:
+        latest = by_person['organization'].transform('last')
+        rows['organization'] = rows['organization'].where(rows['organization'].notna(), latest)
+        group_keys = [person, rows['organization'].astype(object).fillna('').to_numpy()]
+    else:
+        group_keys = [person]
+    by_record = rows.groupby(group_keys, sort=False)
+    record = by_record.ngroup().to_numpy()
+
+    for col in rows.columns:
+        if col in LIST_COLUMNS:
+            merged = by_record[col].agg(_ordered_union).to_numpy()
+            rows[col] = pd.Series([list(merged[code]) for code in record], index=rows.index, dtype=object)
+        elif col == 'industry_sector':
+            rows[col] = by_record[col].transform('last')
+        elif col == 'email':
+            # Stable MERGE key: the first registration's email
+            rows[col] = by_person[col].transform('first')
+        elif col != 'organization':
+            # GroupBy.last skips missing values: the last non-null value
+            rows[col] = by_person[col].transform('last')
+
+    # One record per (person, organization), at the position of its first row
+    first = ~pd.DataFrame(dict(enumerate(group_keys))).duplicated().to_numpy()
+    order = np.concatenate([np.flatnonzero(~repeated), positions[first]])
+    consolidated = pd.concat([df_transformed[~repeated], rows[first]]).iloc[np.argsort(order, kind='stable')]
+
+    stats.update({
+        'rows_out': len(consolidated),
+        'persons_consolidated': int(pd.Series(person).nunique()),
+        'writes_eliminated': len(df_transformed) - len(consolidated),
+        'entries_eliminated': _relationship_entries(df_transformed) - _relationship_entries(consolidated),
+    })
+    return consolidated, stats
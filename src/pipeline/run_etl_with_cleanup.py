@@ -18,7 +18,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.pipeline.etl_to_graph import run_etl_pipeline
+from src.pipeline.etl_to_graph import DEFAULT_CLEAR_CHUNK_SIZE, run_etl_pipeline
 from src.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,8 +33,12 @@ def main():
     logger.info("")
     
     try:
-        # Run pipeline with cleanup enabled
-        stats = run_etl_pipeline(clear_before_load=True)
+        # Run pipeline with cleanup enabled (chunked, so large graphs don't
+        # exceed the transaction memory limit)
+        stats = run_etl_pipeline(
+            clear_before_load=True,
+            clear_chunk_size=DEFAULT_CLEAR_CHUNK_SIZE
+        )
         
         logger.info("")
         logger.info("=" * 80)
@@ -0,0 +1,160 @@
+"""
+Schema migrations for the Quantum Network Knowledge Graph.
+
+This module creates the constraints and indexes that the ETL load relies on.
+Every MERGE in the pipeline matches on a key property (Person.email,
+Organization.name, Domain.name, Problem.name); without a uniqueness
+constraint on those properties each MERGE is a label scan.
+
+Migrations are versioned and idempotent:
+- Each migration has an integer version, a name and a list of schema statements
+- All statements use IF NOT EXISTS, so re-running a migration is harmless
+- Applied migrations are recorded as (:SchemaMigration) nodes with the time
+  they were applied and how long they took
+
+Usage:
+    with get_session(driver) as session:
+        migration_stats = apply_schema_migrations(session)
+"""
+
+import time
+from typing import Any, Dict, List, Set
+
+from src.core.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# MIGRATION DEFINITIONS
+# ============================================================================
+
+# Ordered list of schema migrations. Never edit a migration that has been
+# released: add a new version instead.
+SCHEMA_MIGRATIONS: List[Dict[str, Any]] = [
+    {
+        'version': 1,
+        'name': 'unique_merge_keys',
+        'statements': [
+            "CREATE CONSTRAINT person_email_unique IF NOT EXISTS "
+            "FOR (p:Person) REQUIRE p.email IS UNIQUE",
+            "CREATE CONSTRAINT organization_name_unique IF NOT EXISTS "
+            "FOR (o:Organization) REQUIRE o.name IS UNIQUE",
+            "CREATE CONSTRAINT domain_name_unique IF NOT EXISTS "
+            "FOR (d:Domain) REQUIRE d.name IS UNIQUE",
+            "CREATE CONSTRAINT problem_name_unique IF NOT EXISTS "
+            "FOR (pr:Problem) REQUIRE pr.name IS UNIQUE",
+            "CREATE CONSTRAINT schema_migration_version_unique IF NOT EXISTS "
+            "FOR (m:SchemaMigration) REQUIRE m.version IS UNIQUE",
+        ],
+    },
+]
+
+
+# ============================================================================
+# MIGRATION HISTORY
+# ============================================================================
+
+def get_applied_migrations(session: Any) -> Set[int]:
+    """
+    Get the versions of the migrations already recorded in the graph.
+
+    Args:
+        session: Neo4j session
+
+    Returns:
+        Set of applied migration versions
+    """
+    result = session.run("MATCH (m:SchemaMigration) RETURN m.version AS version")
+    return {record['version'] for record in result}
+
+
+def record_migration(session: Any, migration: Dict[str, Any], duration_ms: float) -> None:
+    """
+    Record an applied migration as a (:SchemaMigration) node.
+
+    Args:
+        session: Neo4j session
+        migration: Migration definition
+        duration_ms: Time it took to apply the migration, in milliseconds
+    """
+    query = """
+    MERGE (m:SchemaMigration {version: $version})
+    SET m.name = $name,
+        m.applied_at = datetime(),
+        m.duration_ms = $duration_ms
+    """
+    session.run(
+        query,
+        version=migration['version'],
+        name=migration['name'],
+        duration_ms=duration_ms
+    ).consume()
+
+
+# ============================================================================
+# MIGRATION RUNNER
+# ============================================================================
+
+def apply_schema_migrations(
+    session: Any,
+    migrations: List[Dict[str, Any]] = SCHEMA_MIGRATIONS,
+    await_indexes: bool = True
+) -> Dict[str, Any]:
+    """
+    Apply pending schema migrations in version order.
+
+    Schema statements cannot share a transaction with data writes, so each
+    statement runs in its own auto-commit transaction.
+
+    Args:
+        session: Neo4j session
+        migrations: Migration definitions (default: SCHEMA_MIGRATIONS)
+        await_indexes: If True, wait until new indexes are online so the
+                       following load already uses index seeks
+
+    Returns:
+        Dictionary with migration statistics:
+        - applied: List of {'version', 'name', 'duration_ms'} for migrations applied now
+        - already_applied: Versions that were recorded before this run
+        - duration_ms: Total time spent in this step
+    """
+    started = time.perf_counter()
+    already_applied = get_applied_migrations(session)
+    applied = []
+
+    for migration in sorted(migrations, key=lambda m: m['version']):
+        if migration['version'] in already_applied:
+            continue
+
+        logger.info(
+            f"Applying schema migration {migration['version']}: {migration['name']}"
+        )
+        migration_started = time.perf_counter()
+        for statement in migration['statements']:
+            session.run(statement).consume()
+        duration_ms = (time.perf_counter() - migration_started) * 1000
+
+        record_migration(session, migration, duration_ms)
+        applied.append({
+            'version': migration['version'],
+            'name': migration['name'],
+            'duration_ms': duration_ms,
+        })
+        logger.info(
+            f"Schema migration {migration['version']} applied in {duration_ms:.1f} ms"
+        )
+
+    if applied and await_indexes:
+        # Constraints are backed by indexes that populate asynchronously
+        session.run("CALL db.awaitIndexes(300)").consume()
+
+    if not applied:
+        logger.info("Schema is up to date")
+
+    return {
+        'applied': applied,
+        'already_applied': sorted(already_applied),
+        'duration_ms': (time.perf_counter() - started) * 1000,
+    }
@@ -0,0 +1,228 @@
+"""
+Producer/consumer execution of ETL stages.
+
+The ETL stages have very different bottlenecks: transform is CPU-bound,
+LLM inference waits on the model endpoint and the load waits on Neo4j.
+Running them one after the other leaves the database idle during
+inference and the model idle during the load. This module runs every
+stage in its own thread, connected by bounded queues, so a chunk is
+written as soon as its inference finishes while the next chunk is still
+being inferred:
+
+    source ──▶ [queue] ──▶ stage 1 ──▶ [queue] ──▶ ... ──▶ [queue] ──▶ sink
+
+- The source iterator and each intermediate stage run in worker threads
+- The sink runs in the calling thread, so it can use objects that must not
+  be shared across threads (e.g. a Neo4j session)
+- Bounded queues apply backpressure: a fast stage blocks instead of
+  piling up chunks in memory
+- The first exception raised by any stage stops the pipeline and is
+  re-raised in the caller
+
+Per-stage statistics:
+- items: Chunks processed by the stage
+- busy_seconds: Time spent in the stage function
+- idle_seconds: Time spent waiting for input (upstream is the bottleneck)
+- blocked_seconds: Time spent waiting for space in the output queue
+  (downstream is the bottleneck)
+- max_queue_depth / avg_queue_depth: Depth of the input queue, sampled
+  every time the stage takes a chunk (not reported for the source)
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from src.core.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Default capacity of the queues between stages (in chunks)
+DEFAULT_QUEUE_SIZE = 2
+
+# Interval at which blocked threads check whether the pipeline was stopped
+_POLL_SECONDS = 0.1
+
+# Marks the end of the stream
+_DONE = object()
+
+# Returned by _get/_put when the pipeline was stopped by an error
+_STOPPED = object()
+
+
+# ============================================================================
+# QUEUE HELPERS
+# ============================================================================
+
+def _new_stage_stats(has_input: bool) -> Dict[str, Any]:
+    stats: Dict[str, Any] = {
+        'items': 0,
+        'busy_seconds': 0.0,
+        'idle_seconds': 0.0,
+        'blocked_seconds': 0.0,
+    }
+    if has_input:
+        stats['max_queue_depth'] = 0
+        stats['avg_queue_depth'] = 0.0
+        stats['_depth_samples'] = 0
+    return stats
+
+
+def _get(source: queue.Queue, stop: threading.Event, stats: Dict[str, Any]) -> Any:
+    depth = source.qsize()
+    samples = stats['_depth_samples'] + 1
+    stats['max_queue_depth'] = max(stats['max_queue_depth'], depth)
+    stats['avg_queue_depth'] += (depth - stats['avg_queue_depth']) / samples
+    stats['_depth_samples'] = samples
+
+    started = time.perf_counter()
+    try:
+        while not stop.is_set():
+            try:
+                return source.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _STOPPED
+    finally:
+        stats['idle_seconds'] += time.perf_counter() - started
+
+
+def _put(target: queue.Queue, item: Any, stop: threading.Event, stats: Dict[str, Any]) -> Any:
+    started = time.perf_counter()
+    try:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_SECONDS)
+                return item
+            except queue.Full:
+                continue
+        return _STOPPED
+    finally:
+        stats['blocked_seconds'] += time.perf_counter() - started
+
+
+# ============================================================================
+# PIPELINE RUNNER
+# ============================================================================
+
+def run_staged_pipeline(
+    source: Iterable[Any],
+    stages: List[Tuple[str, Callable[[Any], Any]]],
+    sink: Callable[[Any], None],
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    source_name: str = 'extract',
+    sink_name: str = 'load'
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run source -> stages -> sink as concurrent stages connected by bounded queues.
+
+    Args:
+        source: Iterable producing the input chunks (consumed in a worker thread)
+        stages: Ordered (name, function) pairs; each function maps a chunk to
+                the chunk passed to the next stage
+        sink: Function consuming the output of the last stage (runs in the
+              calling thread)
+        queue_size: Maximum number of chunks waiting between two stages
+        source_name: Stage name reported for the source
+        sink_name: Stage name reported for the sink
+
+    Returns:
+        Dictionary mapping stage name to its statistics, in pipeline order
+
+    Raises:
+        ValueError: If queue_size < 1
+        Exception: The first exception raised by the source, a stage or the sink
+    """
+    if queue_size < 1:
+        raise ValueError(f"queue_size must be >= 1, got {queue_size}")
+
+    names = [source_name] + [name for name, _ in stages] + [sink_name]
+    stats = {name: _new_stage_stats(has_input=(name != source_name)) for name in names}
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    stop = threading.Event()
+    errors: List[BaseException] = []
+
+    def fail(name: str, error: BaseException) -> None:
+        logger.error(f"Pipeline stage '{name}' failed: {error}")
+        errors.append(error)
+        stop.set()
+
+    def produce() -> None:
+        source_stats = stats[source_name]
+        try:
+            iterator = iter(source)
+            while True:
+                started = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    source_stats['busy_seconds'] += time.perf_counter() - started
+                source_stats['items'] += 1
+                if _put(queues[0], item, stop, source_stats) is _STOPPED:
+                    return
+            _put(queues[0], _DONE, stop, source_stats)
+        except BaseException as e:
+            fail(source_name, e)
+
+    def work(position: int, name: str, function: Callable[[Any], Any]) -> None:
+        stage_stats = stats[name]
+        inbox, outbox = queues[position], queues[position + 1]
+        try:
+            while True:
+                item = _get(inbox, stop, stage_stats)
+                if item is _STOPPED:
+                    return
+                if item is _DONE:
+                    _put(outbox, _DONE, stop, stage_stats)
+                    return
+                started = time.perf_counter()
+                result = function(item)
+                stage_stats['busy_seconds'] += time.perf_counter() - started
+                stage_stats['items'] += 1
+                if _put(outbox, result, stop, stage_stats) is _STOPPED:
+                    return
+        except BaseException as e:
+            fail(name, e)
+
+    threads = [threading.Thread(target=produce, name=f"etl-{source_name}", daemon=True)]
+    for position, (name, function) in enumerate(stages):
+        threads.append(threading.Thread(
+            target=work, args=(position, name, function), name=f"etl-{name}", daemon=True
+        ))
+    for thread in threads:
+        thread.start()
+
+    sink_stats = stats[sink_name]
+    try:
+        while True:
+            item = _get(queues[-1], stop, sink_stats)
+            if item is _STOPPED or item is _DONE:
+                break
+            started = time.perf_counter()
+            sink(item)
+            sink_stats['busy_seconds'] += time.perf_counter() - started
+            sink_stats['items'] += 1
+    except BaseException as e:
+        fail(sink_name, e)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+
+    for name in names:
+        stats[name].pop('_depth_samples', None)
+        logger.info(
+            f"Stage '{name}': {stats[name]['items']} chunks, "
+            f"busy {stats[name]['busy_seconds']:.2f}s, "
+            f"idle {stats[name]['idle_seconds']:.2f}s, "
+            f"blocked {stats[name]['blocked_seconds']:.2f}s"
+        )
+
+    return stats
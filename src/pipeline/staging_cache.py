@@ -0,0 +1,210 @@
+"""
+Columnar staging cache for the transformed DataFrame.
+
+transform_dataframe is expensive (one LLM call per row), and its output
+used to be thrown away after every run. The staging cache stores it as a
+Parquet file keyed by the SHA-256 of the input CSV and the transform
+version, so a later run on the same file (or an export/analytics script)
+reads the transformed rows instead of transforming again:
+
+    <cache_dir>/<csv stem>-<first 16 hex digits of the CSV hash>-t<version>.parquet
+
+- List columns (interests_list, problems_list) are stored as native Arrow
+  list<string> columns and come back as Python lists
+- llm_problem_inference holds free-form dicts, so it is stored as a JSON
+  string column and decoded on read
+- read_staged_table gives the cached rows as a pyarrow.Table read from the
+  memory-mapped file, decoding only the requested columns into Arrow
+  buffers, for export and analytics readers that do not need pandas.
+  read_staged_frame converts the table to the pandas frame the ETL loads,
+  which copies every value into Python objects
+- Files are written atomically (temporary file + rename)
+
+Requires pyarrow (a project dependency, installed by `uv sync`).
+
+Usage:
+    cache_file = staging_cache_path(cache_dir, csv_file, TRANSFORM_VERSION)
+    df_transformed = load_staged_frame(cache_file)  # None on a cache miss
+    table = read_staged_table(cache_file, columns=['email', 'problems_list'])
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional
+
+import pandas as pd
+
+from src.core.logger import get_logger
+from src.pipeline.arrow_csv import require_pyarrow
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+    pq = None
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Columns holding lists of strings
+LIST_COLUMNS = ['interests_list', 'problems_list']
+
+# Columns holding dictionaries, stored as JSON strings
+JSON_COLUMNS = ['llm_problem_inference']
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+# ============================================================================
+# CACHE KEYS
+# ============================================================================
+
+def file_sha256(path: Path) -> str:
+    """
+    Compute the SHA-256 of a file, reading it in blocks.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def staging_cache_path(cache_dir: Path, csv_file: Path, transform_version: int) -> Path:
+    """
+    Get the cache file of a CSV file for a transform version.
+
+    Args:
+        cache_dir: Directory holding the cache files
+        csv_file: Input CSV file
+        transform_version: Version of the transform that produced the frame
+
+    Returns:
+        Path of the Parquet cache file (it may not exist yet)
+    """
+    file_hash = file_sha256(csv_file)[:16]
+    return cache_dir / f"{csv_file.stem}-{file_hash}-t{transform_version}.parquet"
+
+
+# ============================================================================
+# READ / WRITE
+# ============================================================================
+
+def _decode_json(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _to_list(value: Any) -> Any:
+    # Arrow list columns come back as numpy arrays
+    if value is None:
+        return []
+    return list(value) if not isinstance(value, list) else value
+
+
+def write_staged_frame(df_transformed: pd.DataFrame, cache_file: Path) -> None:
+    """
+    Write a transformed DataFrame to the staging cache.
+
+    Args:
+        df_transformed: Output of transform_dataframe
+        cache_file: Target Parquet file (see staging_cache_path)
+    """
+    require_pyarrow()
+
+    frame = df_transformed.copy()
+    for col in JSON_COLUMNS:
+        if col in frame.columns:
+            frame[col] = frame[col].map(
+                lambda value: json.dumps(value, ensure_ascii=False) if value is not None else None
+            )
+    table = pa.Table.from_pandas(frame, preserve_index=True)
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=cache_file.parent, prefix=f".{cache_file.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    logger.info(f"Staging cache written: {cache_file} ({len(frame)} rows)")
+
+
+def read_staged_table(cache_file: Path, columns: Optional[List[str]] = None) -> 'pa.Table':
+    """
+    Read the cached rows as an Arrow table, without converting to pandas.
+
+    The file is memory-mapped and only the requested columns are decoded.
+    List columns stay list<string> and llm_problem_inference stays a JSON
+    string column.
+
+    Args:
+        cache_file: Parquet cache file
+        columns: Columns to read (default: all, including the row labels)
+
+    Returns:
+        pyarrow.Table with the cached rows
+    """
+    require_pyarrow()
+    return pq.read_table(cache_file, columns=columns, memory_map=True)
+
+
+def read_staged_frame(cache_file: Path) -> pd.DataFrame:
+    """
+    Read a transformed DataFrame from the staging cache.
+
+    The table is converted to pandas, which copies every value into Python
+    objects and rebuilds the list and JSON columns row by row. Readers that
+    do not need the exact output of transform_dataframe should use
+    read_staged_table instead.
+
+    Args:
+        cache_file: Parquet cache file
+
+    Returns:
+        DataFrame equivalent to the output of transform_dataframe
+    """
+    frame = read_staged_table(cache_file).to_pandas()
+    for col in LIST_COLUMNS:
+        if col in frame.columns:
+            frame[col] = frame[col].map(_to_list)
+    for col in JSON_COLUMNS:
+        if col in frame.columns:
+            frame[col] = frame[col].map(_decode_json)
+
+    logger.info(f"Staging cache read: {cache_file} ({len(frame)} rows)")
+    return frame
+
+
+def load_staged_frame(cache_file: Path) -> Optional[pd.DataFrame]:
+    """
+    Read a cached frame if present; unreadable cache files count as a miss.
+
+    Args:
+        cache_file: Parquet cache file
+
+    Returns:
+        Cached DataFrame, or None on a cache miss
+    """
+    require_pyarrow()
+    if not cache_file.exists():
+        return None
+    try:
+        return read_staged_frame(cache_file)
+    except (OSError, ValueError, pa.ArrowException) as e:
+        logger.warning(f"Ignoring unreadable staging cache {cache_file}: {e}")
+        return None
@@ -0,0 +1,253 @@
+"""
+Vectorized validation of transformed rows, with a quarantine file.
+
+Bad rows used to be found only when Neo4j rejected them, after a database
+round trip, and every failure kept its full row data in stats['errors'].
+validate_dataframe checks all the rows of a transformed DataFrame
+column-wise, right after the transform. Rows that fail are written to a
+quarantine JSONL file with reason codes and are never sent to Neo4j.
+
+Reason codes (VALIDATION_REASONS):
+- missing_email: No email (the Person MERGE key)
+- invalid_email: Email not shaped like local@domain.tld
+- invalid_list: interests_list or problems_list is not a list of strings
+- field_too_long: A text field is longer than MAX_FIELD_LENGTHS allows
+- list_too_long: A list has more than MAX_LIST_ITEMS entries or an entry
+  longer than MAX_LIST_ITEM_LENGTH
+- load_error: Rejected by Neo4j (written by the pipeline, not by
+  validate_dataframe)
+
+Quarantine format (one JSON document per line):
+
+    {"row_index": 3, "reasons": ["invalid_email"], "error": null, "row": {...}}
+
+The file is written to a temporary file and renamed into place when the
+writer is closed, also after a failed run, so it always holds the rows
+quarantined by the latest run.
+
+Usage:
+    failures = validate_dataframe(df_transformed)
+    invalid = failures.any(axis=1)
+    with QuarantineFile(Path("data/quarantine.jsonl")) as quarantine:
+        quarantine.write_rows(...)
+"""
+
+import json
+import os
+import tempfile
+import threading
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+MISSING_EMAIL = 'missing_email'
+INVALID_EMAIL = 'invalid_email'
+INVALID_LIST = 'invalid_list'
+FIELD_TOO_LONG = 'field_too_long'
+LIST_TOO_LONG = 'list_too_long'
+LOAD_ERROR = 'load_error'
+
+# Reason codes checked by validate_dataframe, in this order
+VALIDATION_REASONS = [MISSING_EMAIL, INVALID_EMAIL, INVALID_LIST, FIELD_TOO_LONG, LIST_TOO_LONG]
+
+# local@domain.tld, without whitespace and with a single '@'
+EMAIL_PATTERN = r'[^@\s]+@[^@\s.]+(?:\.[^@\s.]+)+'
+
+# Maximum length (characters) of the text fields written to Neo4j
+MAX_FIELD_LENGTHS = {
+    'name': 200,
+    'email': 254,
+    'role': 200,
+    'linkedin_url': 500,
+    'organization': 300,
+    'industry_sector': 200,
+    'event_expectations': 5000,
+}
+
+# List columns and their limits
+LIST_COLUMNS = ['interests_list', 'problems_list']
+MAX_LIST_ITEMS = 50
+MAX_LIST_ITEM_LENGTH = 200
+
+
+def _json_default(value: Any) -> Any:
+    # Quarantined rows may hold anything: numpy scalars as Python values,
+    # everything else as its string form
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def _text(values: pd.Series) -> pd.Series:
+    # String values as they are, anything else as NaN (so .str always works)
+    values = values.astype(object)
+    return values.where(values.map(lambda value: isinstance(value, str)))
+
+
+def _is_instance(values: np.ndarray, cls: type) -> np.ndarray:
+    # isinstance for every value, with one issubclass call per distinct type
+    types = pd.Series(values, dtype=object).map(type)
+    return types.isin([value_type for value_type in types.unique() if issubclass(value_type, cls)]).to_numpy()
+
+
+def _list_checks(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    # (not a list of strings, too many or too long entries) for every row,
+    # checked over the flattened entries of all the lists at once
+    values = values.to_numpy(dtype=object)
+    is_list = _is_instance(values, list)
+    lists = values[is_list]
+    counts = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    items = np.fromiter(chain.from_iterable(lists), dtype=object, count=int(counts.sum()))
+    # Position of the list of every entry
+    owners = np.repeat(np.arange(len(lists)), counts)
+
+    # Usually every entry is a string, which infer_dtype tells without a type per entry
+    if pd.api.types.infer_dtype(items, skipna=False) == 'string':
+        is_text = np.ones(len(items), dtype=bool)
+    else:
+        is_text = _is_instance(items, str)
+    texts = items[is_text]
+    text_lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    bad_entries = np.bincount(owners[~is_text], minlength=len(lists)) > 0
+    long_entries = np.bincount(
+        owners[is_text][text_lengths > MAX_LIST_ITEM_LENGTH], minlength=len(lists)
+    ) > 0
+
+    invalid = ~is_list
+    invalid[is_list] = bad_entries
+    too_long = np.zeros(len(values), dtype=bool)
+    too_long[is_list] = ~bad_entries & ((counts > MAX_LIST_ITEMS) | long_entries)
+    return invalid, too_long
+
+
+def validate_dataframe(df_transformed: pd.DataFrame) -> pd.DataFrame:
+    """
+    Check every row of a transformed DataFrame.
+
+    Args:
+        df_transformed: Transformed DataFrame (output of transform_dataframe)
+
+    Returns:
+        Boolean DataFrame indexed like df_transformed with one column per
+        reason code (VALIDATION_REASONS), True where the row fails that check
+    """
+    index = df_transformed.index
+    failures = pd.DataFrame(False, index=index, columns=VALIDATION_REASONS)
+
+    if 'email' in df_transformed.columns:
+        emails = df_transformed['email']
+        # Non-string values are invalid, not missing
+        stripped = _text(emails).str.strip()
+        missing = emails.isna() | (stripped == '')
+        failures[MISSING_EMAIL] = missing
+        failures[INVALID_EMAIL] = ~missing & ~stripped.str.fullmatch(EMAIL_PATTERN, na=False)
+    else:
+        failures[MISSING_EMAIL] = True
+
+    too_long = pd.Series(False, index=index)
+    for col, limit in MAX_FIELD_LENGTHS.items():
+        if col in df_transformed.columns:
+            lengths = _text(df_transformed[col]).str.len()
+            too_long |= lengths.gt(limit)
+    failures[FIELD_TOO_LONG] = too_long
+
+    for col in LIST_COLUMNS:
+        if col in df_transformed.columns:
+            invalid, list_too_long = _list_checks(df_transformed[col])
+            failures[INVALID_LIST] |= invalid
+            failures[LIST_TOO_LONG] |= list_too_long
+
+    return failures
+
+
+def failure_reasons(failures: pd.DataFrame) -> List[List[str]]:
+    """
+    Return the reason codes of every failing row.
+
+    Args:
+        failures: Output of validate_dataframe
+
+    Returns:
+        One list of reason codes per row of failures that fails a check
+    """
+    failing = failures[failures.any(axis=1)]
+    codes = np.array(failures.columns, dtype=object)
+    return [codes[row].tolist() for row in failing.to_numpy()]
+
+
+class QuarantineFile:
+    """
+    Writer for the quarantine JSONL file (context manager).
+
+    Rows are appended with write_rows as they are found, so they are never
+    kept in memory. write_rows may be called from several threads (the
+    parallel load mode). The file appears at its final path when the
+    context exits, with or without an exception.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.rows_written = 0
+        self.reason_counts: Dict[str, int] = {}
+        self._tmp_path: Optional[str] = None
+        self._file: Any = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'QuarantineFile':
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        self._file = os.fdopen(fd, 'w', encoding='utf-8')
+        return self
+
+    def write_rows(
+        self,
+        rows: Iterable[Tuple[Any, List[str], Optional[str], Dict[str, Any]]]
+    ) -> None:
+        """
+        Append quarantined rows.
+
+        Args:
+            rows: Tuples of (source row index, reason codes, error message
+                  or None, row data)
+        """
+        for row_index, reasons, error, row in rows:
+            record = {'row_index': row_index, 'reasons': reasons, 'error': error, 'row': row}
+            line = json.dumps(record, ensure_ascii=False, default=_json_default) + '\n'
+            with self._lock:
+                self._file.write(line)
+                self.rows_written += 1
+                for reason in reasons:
+                    self.reason_counts[reason] = self.reason_counts.get(reason, 0) + 1
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self._file.close()
+            os.replace(self._tmp_path, self.path)
+            logger.info(f"Quarantine written: {self.path} ({self.rows_written} rows)")
+        finally:
+            # No-op after a successful rename
+            Path(self._tmp_path).unlink(missing_ok=True)
+
+
+def read_quarantine(path: Path) -> List[Dict[str, Any]]:
+    """
+    Read the records of a quarantine file.
+
+    Args:
+        path: Path of the quarantine file
+
+    Returns:
+        List of records (row_index, reasons, error, row)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
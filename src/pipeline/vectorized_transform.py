@@ -0,0 +1,528 @@
+"""
+Vectorized transform engine for the Quantum Network Knowledge Graph.
+
+normalize_dataframe originally ran one Python function per cell
+(Series.apply with clean_text, normalize_linkedin_url, ...) and an
+axis=1 apply to build the LLM context. This engine produces the same
+output with column-wise operations: `.str` accessors, boolean masks and
+np.select.
+
+- Strings are processed as Arrow arrays (pyarrow is a project
+  dependency), so the `.str` operations run in Arrow compute kernels
+  instead of a Python loop per cell. In an environment without pyarrow
+  the same code runs on object columns (about half as fast, same output)
+- Output is identical to the per-cell functions (checked by the parity
+  tests in tests/test_vectorized_transform.py). Where Arrow and Python
+  semantics differ, the affected cells fall back to the per-cell
+  function: LinkedIn URLs that urlparse treats specially (IPv6 hosts,
+  control characters, ';' parameters) and experience answers with
+  characters outside Latin-1 (lowercasing rules differ)
+- Survey answers repeat a lot: string columns with few distinct values
+  are normalized once per distinct value and expanded back with the
+  factorize codes, and the contextual text is built once per distinct
+  combination of its source columns
+
+Usage (default engine of normalize_dataframe):
+    df_transformed = normalize_dataframe(df)                  # vectorized
+    df_transformed = normalize_dataframe(df, engine='python')  # per-cell reference
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.llm_service import EXPERIENCE_CONTEXT
+from src.core.logger import get_logger
+from src.pipeline.etl_to_graph import (
+    GENERAL_KNOWLEDGE_PROBLEM,
+    INDUSTRIAL_APPLICATIONS_PROBLEM,
+    PROBLEM_CLASSIFIER,
+    QUANTUM_EXPERIENCE_KEYWORDS,
+    normalize_linkedin_url,
+    normalize_quantum_experience,
+    parse_interests,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+    pc = None
+
+# Initialize logger
+logger = get_logger(__name__)
+
+LINKEDIN_BASE_URL = 'https://www.linkedin.com'
+
+# URLs with a scheme that urlparse splits the simple way: ASCII host without
+# brackets, no control characters and no ';' parameters in the path
+_HTTP_URL_PATTERN = (
+    r"^https?://(?P<netloc>[A-Za-z0-9._~%!$&'()*+,=:@-]*)"
+    r"(?P<path>/[^?#;\x00-\x1f\x7f]*)?"
+    r"(?:[?#][^\x00-\x1f\x7f]*)?$"
+)
+
+# Every spelling whose lower() is 'nan' (no non-ASCII character lowercases
+# to 'n' or 'a', so this equals `text.lower() == 'nan'`)
+_NAN_SPELLINGS = ['nan', 'naN', 'nAn', 'nAN', 'Nan', 'NaN', 'NAn', 'NAN']
+
+# Text columns cleaned with clean_text semantics. organization and
+# industry_sector also go through normalize_organization_name /
+# normalize_industry_sector, which are no-ops on cleaned text.
+TEXT_COLUMNS = ['name', 'email', 'role', 'organization', 'industry_sector',
+                'event_expectations']
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """
+    str() of every present cell, as an Arrow string column when pyarrow is available.
+
+    Missing cells are undefined (null or their str()): callers mask them out.
+    """
+    if pa is None:
+        return series.astype(str)
+    values = series.to_numpy(dtype=object)
+    if pd.api.types.infer_dtype(values, skipna=True) not in ('string', 'empty'):
+        values = series.astype(str).to_numpy(dtype=object)
+    array = pa.array(values, type=pa.string(), from_pandas=True)
+    return pd.Series(pd.arrays.ArrowExtensionArray(array), index=series.index)
+
+
+def _mask(values: pd.Series) -> np.ndarray:
+    return values.to_numpy(dtype=bool, na_value=False)
+
+
+def _objects(values: pd.Series) -> np.ndarray:
+    return values.to_numpy(dtype=object, na_value=None)
+
+
+def _stripped_text(series: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+    """Return (str(value).strip() for every cell, mask of empty/NaN cells)."""
+    text = _as_text(series).str.strip()
+    empty = (
+        series.isna().to_numpy()
+        | _mask(text == '')
+        | _mask(text.isin(_NAN_SPELLINGS))
+    )
+    return text, empty
+
+
+def _select(conditions: List[np.ndarray], choices: List[pd.Series], default: pd.Series) -> np.ndarray:
+    """np.select over string Series, returning an object array."""
+    result = _objects(default)
+    for condition, choice in reversed(list(zip(conditions, choices))):
+        result = np.where(condition, _objects(choice), result)
+    return result
+
+
+# ============================================================================
+# COLUMN FUNCTIONS
+# ============================================================================
+
+def clean_text_column(series: pd.Series) -> pd.Series:
+    """
+    Column-wise clean_text.
+
+    Args:
+        series: Column to clean
+
+    Returns:
+        Object Series with stripped strings, or None for empty/NaN cells
+    """
+    text, empty = _stripped_text(series)
+    return pd.Series(np.where(empty, None, _objects(text)), index=series.index, dtype=object)
+
+
+def normalize_quantum_experience_column(series: pd.Series) -> pd.Series:
+    """
+    Column-wise normalize_quantum_experience.
+
+    Args:
+        series: Raw quantum experience answers
+
+    Returns:
+        Object Series with the normalized category or None
+    """
+    missing = series.isna().to_numpy() | _mask(series == '')
+    text = _as_text(series).str.strip()
+    lowered = text.str.lower()
+
+    conditions = []
+    for _, keywords in QUANTUM_EXPERIENCE_KEYWORDS:
+        matches = np.zeros(len(series), dtype=bool)
+        for keyword in keywords:
+            matches |= _mask(lowered.str.contains(keyword, regex=False))
+        conditions.append(matches & ~missing)
+
+    categories = [category for category, _ in QUANTUM_EXPERIENCE_KEYWORDS]
+    result = np.select(conditions, categories, default=None).astype(object)
+
+    # Lowercasing outside Latin-1 differs between Arrow and Python
+    fallback = ~missing & _mask(text.str.contains(r'[^\x00-\xff]', regex=True))
+    if fallback.any():
+        result[fallback] = series[fallback].map(normalize_quantum_experience).to_numpy(dtype=object)
+
+    return pd.Series(result, index=series.index, dtype=object)
+
+
+def normalize_linkedin_url_column(series: pd.Series) -> pd.Series:
+    """
+    Column-wise normalize_linkedin_url.
+
+    Args:
+        series: LinkedIn URLs or usernames
+
+    Returns:
+        Object Series with normalized URLs or None
+    """
+    text, empty = _stripped_text(series)
+    valid = ~empty
+    result = np.full(len(series), None, dtype=object)
+
+    is_http = valid & _mask(text.str.startswith('http://') | text.str.startswith('https://'))
+
+    # Scheme URLs: keep the path when the host is LinkedIn
+    parts = text[is_http].str.extract(_HTTP_URL_PATTERN)
+    parsed = parts['netloc'].notna().to_numpy()
+    netloc = parts['netloc'].fillna('')
+    path = parts['path'].fillna('').str.strip('/')
+    is_linkedin = parsed & _mask(netloc.str.lower().str.contains('linkedin.com', regex=False))
+    http_urls = _select(
+        [_mask(path.str.startswith('in/')), _mask(path.str.startswith('/in/'))],
+        [LINKEDIN_BASE_URL + '/' + path, LINKEDIN_BASE_URL + path],
+        LINKEDIN_BASE_URL + '/in/' + path
+    )
+    http_positions = np.flatnonzero(is_http)
+    result[http_positions[is_linkedin]] = http_urls[is_linkedin]
+
+    # Unusual scheme URLs keep the exact urlparse behavior
+    fallback = http_positions[~parsed]
+    if len(fallback):
+        result[fallback] = series.iloc[fallback].map(normalize_linkedin_url).to_numpy(dtype=object)
+
+    # Host without scheme
+    is_host = valid & ~is_http & _mask(
+        text.str.startswith('www.linkedin.com') | text.str.startswith('linkedin.com')
+    )
+    rest = (
+        text[is_host]
+        .str.replace('www.', '', regex=False)
+        .str.replace('linkedin.com', '', regex=False)
+        .str.strip('/')
+    )
+    result[is_host] = _select(
+        [_mask(rest.str.startswith('/in/')), _mask(rest.str.startswith('in/'))],
+        [LINKEDIN_BASE_URL + rest, LINKEDIN_BASE_URL + '/' + rest],
+        LINKEDIN_BASE_URL + '/in/' + rest
+    )
+
+    # Bare username (a single word without slashes)
+    is_username = valid & ~is_http & ~is_host & ~_mask(
+        text.str.contains(' ', regex=False) | text.str.contains('/', regex=False)
+    )
+    result[is_username] = _objects(LINKEDIN_BASE_URL + '/in/' + text[is_username])
+
+    return pd.Series(result, index=series.index, dtype=object)
+
+
+def parse_interests_column(series: pd.Series) -> pd.Series:
+    """
+    Column-wise parse_interests.
+
+    Args:
+        series: Comma-separated interests
+
+    Returns:
+        Object Series with one list of interests per row
+    """
+    if pa is None:
+        return pd.Series(
+            series.map(parse_interests).to_numpy(dtype=object), index=series.index, dtype=object
+        )
+
+    missing = series.isna().to_numpy() | _mask(series == '')
+    text = pa.array(np.where(missing, '', series.astype(str).to_numpy(dtype=object)), type=pa.string())
+
+    # Split every row, then drop the empty and 'nan' items
+    items = pc.split_pattern(text, ',')
+    values = pc.utf8_trim_whitespace(pc.list_flatten(items))
+    parents = pc.list_parent_indices(items)
+    keep = pc.and_(pc.not_equal(values, ''), pc.invert(pc.is_in(values, value_set=pa.array(_NAN_SPELLINGS))))
+
+    # Missing cells were split as '' and have no kept items
+    counts = np.bincount(parents.filter(keep).to_numpy(), minlength=len(text))
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int32)
+    lists = pa.ListArray.from_arrays(pa.array(offsets), values.filter(keep)).to_pylist()
+
+    result = np.fromiter(lists, dtype=object, count=len(lists))
+    return pd.Series(result, index=series.index, dtype=object)
+
+
+def build_contextual_text_column(df: pd.DataFrame) -> pd.Series:
+    """
+    Column-wise build_contextual_text over normalized columns.
+
+    Args:
+        df: Normalized DataFrame (after steps 2-7)
+
+    Returns:
+        Object Series with the contextual text of every row ('' if none)
+    """
+    def column(name: str) -> pd.Series:
+        if name in df.columns:
+            return df[name]
+        return pd.Series(None, index=df.index, dtype=object)
+
+    def labeled(label: str, values: pd.Series) -> pd.Series:
+        # label + value, None where the value is missing
+        present = values.notna()
+        return (label + _as_text(values[present])).reindex(values.index)
+
+    experience = column('quantum_experience')
+    experience_text = experience.map(EXPERIENCE_CONTEXT).astype(object)
+    unmapped = experience.notna() & experience_text.isna()
+    experience_text[unmapped] = labeled('Experiencia: ', experience[unmapped]).astype(object)
+
+    parts = [
+        labeled('Expectativas del evento: ', column('event_expectations')),
+        experience_text,
+    ]
+    if 'interests_list' in df.columns:
+        joined = df['interests_list'].str.join(', ')
+        parts.append(labeled('Áreas de interés: ', joined.where(joined.fillna('') != '', None)))
+    parts.append(labeled('Sector industrial: ', column('industry_sector')))
+    parts.append(labeled('Rol profesional: ', column('role')))
+
+    if pa is not None:
+        # '. ' + part for every present part, then drop the first separator
+        terms = [
+            pc.fill_null(pc.binary_join_element_wise('. ', pa.array(part.array, type=pa.string(), from_pandas=True), ''), '')
+            for part in parts
+        ]
+        text = pc.utf8_slice_codeunits(pc.binary_join_element_wise(*terms, ''), 2)
+        return pd.Series(text.to_numpy(zero_copy_only=False), index=df.index, dtype=object)
+
+    text = np.full(len(df), '', dtype=object)
+    for part in parts:
+        values = _objects(part)
+        has = ~pd.isna(values)
+        separator = np.where(text[has] == '', '', '. ')
+        text[has] = text[has] + separator + values[has]
+    return pd.Series(text, index=df.index, dtype=object)
+
+
+
+def infer_problems_from_expectations_column(
+    expectations: pd.Series,
+    quantum_experience: Optional[pd.Series] = None
+) -> pd.Series:
+    """
+    Column-wise infer_problems_from_expectations.
+
+    Every distinct expectation is classified once (see
+    KeywordClassifier.classify_series).
+
+    Args:
+        expectations: Event expectations
+        quantum_experience: Normalized quantum experience of the same rows (optional)
+
+    Returns:
+        Object Series with one list of problem categories per row
+    """
+    text = expectations.astype(str).str.strip().where(expectations.notna(), None)
+    problems = PROBLEM_CLASSIFIER.classify_series(text)
+
+    has_text = _mask(text.fillna('') != '')
+    industry = (
+        _mask(quantum_experience == 'industry_interest') if quantum_experience is not None
+        else np.zeros(len(expectations), dtype=bool)
+    )
+    for values, industry_interest, present in zip(problems, industry, has_text):
+        if industry_interest and INDUSTRIAL_APPLICATIONS_PROBLEM not in values:
+            values.append(INDUSTRIAL_APPLICATIONS_PROBLEM)
+        if not values and present:
+            values.append(GENERAL_KNOWLEDGE_PROBLEM)
+    return problems
+
+# ============================================================================
+# DICTIONARY ENCODING
+# ============================================================================
+
+# Survey answers repeat a lot (sector, experience, interest checkboxes), so
+# columns whose sample has at most this share of distinct values are
+# normalized once per distinct value and expanded back with the codes
+DISTINCT_SAMPLE_ROWS = 10_000
+DISTINCT_RATIO = 0.5
+
+# Raw columns that build_contextual_text reads (through their normalized values)
+CONTEXT_SOURCE_COLUMNS = ['event_expectations', 'quantum_experience', 'interests',
+                          'industry_sector', 'role']
+
+# Normalized columns that build_contextual_text_column reads
+CONTEXT_COLUMNS = ['event_expectations', 'quantum_experience', 'interests_list',
+                   'industry_sector', 'role']
+
+
+def _encode(series: pd.Series) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Dictionary-encode a column of strings.
+
+    Returns:
+        (codes, distinct values), with missing cells coded as a trailing None
+        value, or None when the column holds non-string values (factorize
+        would merge values such as 1 and 1.0 whose str() differs)
+    """
+    values = series.to_numpy(dtype=object)
+    if pd.api.types.infer_dtype(values, skipna=True) not in ('string', 'empty'):
+        return None
+    codes, distinct = pd.factorize(values)
+    distinct = np.append(distinct.astype(object), None)
+    codes[codes < 0] = len(distinct) - 1
+    return codes, distinct
+
+
+def _is_repetitive(series: pd.Series) -> bool:
+    sample = series.iloc[:DISTINCT_SAMPLE_ROWS]
+    return len(sample) > 0 and sample.nunique(dropna=False) <= DISTINCT_RATIO * len(sample)
+
+
+def _apply_encoded(
+    series: pd.Series,
+    column_function: Callable[[pd.Series], pd.Series],
+    encodings: Dict[str, Tuple[np.ndarray, np.ndarray]]
+) -> pd.Series:
+    """
+    Apply a column function, once per distinct value when the column repeats.
+
+    Args:
+        series: Raw column
+        column_function: One of the column functions above
+        encodings: Encodings of the raw columns (updated in place)
+
+    Returns:
+        Output of column_function for the whole column
+    """
+    encoded = _encode(series) if _is_repetitive(series) else None
+    if encoded is None:
+        return column_function(series)
+
+    encodings[series.name] = encoded
+    codes, distinct = encoded
+    mapped = column_function(pd.Series(distinct, dtype=object)).to_numpy(dtype=object)
+    return pd.Series(mapped[codes], index=series.index, dtype=object)
+
+
+def _combine_codes(encoded: List[Tuple[np.ndarray, np.ndarray]], rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Code every distinct combination of several encoded columns.
+
+    Returns:
+        (combination code of every row, first row of every combination)
+    """
+    key = np.zeros(rows, dtype=np.int64)
+    size = 1
+    for codes, distinct in encoded:
+        if size * len(distinct) >= 2 ** 62:
+            # Renumber the combinations seen so far before the key overflows
+            key, seen = pd.factorize(key)
+            size = len(seen)
+        key = key * len(distinct) + codes
+        size *= len(distinct)
+    key, _ = pd.factorize(key)
+    first = np.empty(key.max() + 1 if rows else 0, dtype=np.int64)
+    # Reversed, so the first row of every combination is written last
+    first[key[::-1]] = np.arange(rows)[::-1]
+    return key, first
+
+
+def _contextual_text_encoded(
+    df_transformed: pd.DataFrame,
+    raw: Dict[str, pd.Series],
+    encodings: Dict[str, Tuple[np.ndarray, np.ndarray]]
+) -> pd.Series:
+    """
+    build_contextual_text_column, once per distinct combination of the raw
+    source columns when they all repeat.
+
+    Args:
+        df_transformed: Normalized DataFrame (after steps 2-7)
+        raw: Raw source columns (CONTEXT_SOURCE_COLUMNS) before normalization
+        encodings: Encodings of the raw columns computed by _apply_encoded
+
+    Returns:
+        Object Series with the contextual text of every row
+    """
+    context_encodings = []
+    for col, series in raw.items():
+        encoded = encodings.get(col) or (_encode(series) if _is_repetitive(series) else None)
+        if encoded is None:
+            return build_contextual_text_column(df_transformed)
+        context_encodings.append(encoded)
+
+    combination, first = _combine_codes(context_encodings, len(df_transformed))
+    if len(first) > DISTINCT_RATIO * len(df_transformed):
+        return build_contextual_text_column(df_transformed)
+
+    context_columns = [col for col in df_transformed.columns if col in CONTEXT_COLUMNS]
+    distinct_text = build_contextual_text_column(df_transformed[context_columns].iloc[first])
+    return pd.Series(
+        distinct_text.to_numpy(dtype=object)[combination], index=df_transformed.index, dtype=object
+    )
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+def normalize_values_vectorized(df_transformed: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorized steps 2-8 of normalize_dataframe.
+
+    Args:
+        df_transformed: DataFrame with normalized column names (step 1 done),
+                        modified in place
+
+    Returns:
+        Normalized DataFrame with 'interests_list' and 'contextual_text' columns
+    """
+    encodings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    raw = {col: df_transformed[col] for col in CONTEXT_SOURCE_COLUMNS if col in df_transformed.columns}
+
+    # Steps 2, 6 and 7: clean text columns
+    for col in TEXT_COLUMNS:
+        if col in df_transformed.columns:
+            df_transformed[col] = _apply_encoded(df_transformed[col], clean_text_column, encodings)
+
+    # Step 3: LinkedIn URLs
+    if 'linkedin_url' in df_transformed.columns:
+        df_transformed['linkedin_url'] = _apply_encoded(
+            df_transformed['linkedin_url'], normalize_linkedin_url_column, encodings
+        )
+
+    # Step 4: quantum experience
+    if 'quantum_experience' in df_transformed.columns:
+        df_transformed['quantum_experience'] = _apply_encoded(
+            df_transformed['quantum_experience'], normalize_quantum_experience_column, encodings
+        )
+
+    # Step 5: interests (every row gets its own list, like parse_interests)
+    if 'interests' in df_transformed.columns:
+        interests = _apply_encoded(df_transformed['interests'], parse_interests_column, encodings)
+        if 'interests' in encodings:
+            interests = pd.Series(
+                np.fromiter(map(list, interests), dtype=object, count=len(interests)),
+                index=interests.index
+            )
+        df_transformed['interests_list'] = interests
+
+    # Step 8: contextual text for the LLM
+    df_transformed['contextual_text'] = _contextual_text_encoded(df_transformed, raw, encodings)
+
+    logger.debug(f"Vectorized normalization of {len(df_transformed)} rows")
+    return df_transformed
@@ -0,0 +1,201 @@
+"""
+Compact representations of repeated values in transformed DataFrames.
+
+industry_sector, quantum_experience and organization take a handful of
+distinct values, and every interest and problem name is repeated across
+thousands of rows, yet each row holds its own Python string objects.
+
+- Scalar columns become pandas categoricals (one small integer code per
+  row plus one copy of each distinct value)
+- interests_list and problems_list are replaced by lists of the stable
+  integer codes of a shared Vocabulary (CODE_COLUMNS). The code objects
+  are shared by every row, and each name is stored once in the vocabulary
+  however many rows mention it. The load phases and registrant
+  consolidation work on the codes directly; the names are only decoded
+  when the load records are built (build_load_records, decode_dataframe)
+
+Usage:
+    vocabulary = Vocabulary()
+    df_transformed = compact_dataframe(df_transformed, vocabulary)
+    df_names = decode_dataframe(df_transformed, vocabulary)
+"""
+
+import sys
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Low-cardinality scalar columns stored as categoricals
+CATEGORICAL_COLUMNS = ['industry_sector', 'quantum_experience', 'organization']
+
+# List columns whose names are interned in the vocabulary
+VOCABULARY_LIST_COLUMNS = ['interests_list', 'problems_list']
+
+# Column replacing each list column in a compacted frame (one list of codes per row)
+CODE_COLUMNS = {
+    'interests_list': 'interests_codes',
+    'problems_list': 'problems_codes',
+}
+
+
+class Vocabulary:
+    """
+    Interned names with stable integer codes.
+
+    Codes are assigned in order of first appearance and never change, so a
+    vocabulary can be shared by every chunk of a streamed load.
+    """
+
+    def __init__(self):
+        self.names: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def code(self, name: Any) -> int:
+        """
+        Return the code of a name, adding it to the vocabulary if needed.
+
+        Args:
+            name: Name (any hashable value; strings are interned)
+
+        Returns:
+            Integer code of the name
+        """
+        code = self._codes.get(name)
+        if code is None:
+            if isinstance(name, str):
+                name = sys.intern(name)
+            code = len(self.names)
+            self._codes[name] = code
+            self.names.append(name)
+        return code
+
+    def decode(self, codes: Iterable[int]) -> List[Any]:
+        """Return the names of a sequence of codes."""
+        return [self.names[code] for code in codes]
+
+    def code_lists(self, series: pd.Series) -> pd.Series:
+        """
+        Replace every list of a list column by the codes of its names.
+
+        Args:
+            series: Column of lists (other cells become empty lists)
+
+        Returns:
+            Object Series with one list of codes per row
+        """
+        code = self.code
+        # list(...) so the lists are not over-allocated like a comprehension's
+        lists = [
+            list([code(value) for value in values]) if isinstance(values, (list, tuple)) else []
+            for values in series
+        ]
+        return pd.Series(lists, index=series.index, dtype=object)
+
+    def decode_lists(self, code_lists: pd.Series) -> pd.Series:
+        """
+        Replace every list of codes by the vocabulary's shared strings.
+
+        Args:
+            code_lists: Column of code lists (output of code_lists)
+
+        Returns:
+            Object Series with one new list of names per row
+        """
+        names = self.names
+        lists = [list([names[code] for code in codes]) for codes in code_lists]
+        return pd.Series(lists, index=code_lists.index, dtype=object)
+
+    def intern_lists(self, series: pd.Series) -> pd.Series:
+        """
+        Replace the names of a list column by the vocabulary's shared strings.
+
+        Args:
+            series: Column of lists (other cells become empty lists)
+
+        Returns:
+            Object Series with one new list per row
+        """
+        return self.decode_lists(self.code_lists(series))
+
+    def encode_lists(self, series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Flatten a list column into codes.
+
+        Args:
+            series: Column of lists (other cells count as empty lists)
+
+        Returns:
+            Tuple of (code of every element, position of its row in the
+            series), in row order and then list order
+        """
+        return flatten_code_lists(self.code_lists(series))
+
+
+def flatten_code_lists(code_lists: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten a column of code lists.
+
+    Args:
+        code_lists: Column of code lists (output of Vocabulary.code_lists)
+
+    Returns:
+        Tuple of (every code, position of its row in the series), in row
+        order and then list order
+    """
+    lengths = np.fromiter((len(codes) for codes in code_lists), dtype=np.int64, count=len(code_lists))
+    codes = np.fromiter(chain.from_iterable(code_lists), dtype=np.int64, count=int(lengths.sum()))
+    return codes, np.repeat(np.arange(len(code_lists), dtype=np.int64), lengths)
+
+
+def compact_dataframe(df_transformed: pd.DataFrame, vocabulary: Vocabulary) -> pd.DataFrame:
+    """
+    Store the repeated values of a transformed DataFrame compactly.
+
+    Missing values of the categorical columns become NaN (prepare_row_for_neo4j
+    and build_load_records turn them back into None).
+
+    Args:
+        df_transformed: Transformed DataFrame (modified in place)
+        vocabulary: Vocabulary shared by the frames of one load
+
+    Returns:
+        The same DataFrame with CATEGORICAL_COLUMNS as categoricals and
+        VOCABULARY_LIST_COLUMNS replaced by their code lists (CODE_COLUMNS)
+    """
+    for col in CATEGORICAL_COLUMNS:
+        if col in df_transformed.columns:
+            df_transformed[col] = df_transformed[col].astype('category')
+    for col in VOCABULARY_LIST_COLUMNS:
+        if col in df_transformed.columns:
+            df_transformed[CODE_COLUMNS[col]] = vocabulary.code_lists(df_transformed[col])
+            del df_transformed[col]
+    return df_transformed
+
+
+def decode_dataframe(df_compact: pd.DataFrame, vocabulary: Vocabulary) -> pd.DataFrame:
+    """
+    Decode the code lists of a compacted DataFrame back into name lists.
+
+    For the loaders that read the rows one at a time (prepare_row_for_neo4j).
+
+    Args:
+        df_compact: Output of compact_dataframe (not modified)
+        vocabulary: Vocabulary that compacted it
+
+    Returns:
+        New DataFrame with VOCABULARY_LIST_COLUMNS holding the vocabulary's
+        shared strings instead of CODE_COLUMNS (a frame without code
+        columns is returned as it is)
+    """
+    coded = [col for col in VOCABULARY_LIST_COLUMNS if CODE_COLUMNS[col] in df_compact.columns]
+    if not coded:
+        return df_compact
+    decoded = df_compact.drop(columns=[CODE_COLUMNS[col] for col in coded])
+    for col in coded:
+        decoded[col] = vocabulary.decode_lists(df_compact[CODE_COLUMNS[col]])
+    return decoded
@@ -96,8 +96,16 @@ def mock_neo4j_session():
     summary.counters.nodes_deleted = 0
     summary.counters.relationships_created = 2
     summary.counters.relationships_deleted = 0
+    summary.result_available_after = 3
+    summary.result_consumed_after = 5
     result.consume.return_value = summary
     session.run.return_value = result
+    # Managed transactions call the transaction function with a transaction
+    # object; the session mock doubles as that transaction
+    session.execute_write.side_effect = (
+        lambda transaction_function, *args, **kwargs:
+            transaction_function(session, *args, **kwargs)
+    )
     return session
 
 
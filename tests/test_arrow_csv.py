@@ -0,0 +1,76 @@
+"""
+Unit tests for the Arrow-backed CSV reader.
+"""
+
+import pandas as pd
+import pytest
+
+from src.pipeline.arrow_csv import read_csv_columns
+from src.pipeline.etl_to_graph import (
+    COLUMN_MAPPING,
+    build_load_records,
+    normalize_dataframe,
+    read_csv_file,
+)
+
+
+@pytest.fixture
+def survey_csv(tmp_path):
+    """Survey export with unused columns, blanks, NA spellings and numbers."""
+    csv_file = tmp_path / "survey.csv"
+    csv_file.write_text(
+        "Timestamp,Nombre completo,Correo electrónico,Organización / Empresa,"
+        "Preferencia de comida (para el lunch de cortesía),LinkedIn,Column 12\n"
+        "2024-01-01 10:00:00, Ana ,ana@example.com,Qnow,Vegano,ana,\n"
+        ",Luis,luis@example.com,,Sin TACC,N/A,\n"
+        "online,\"Pérez, Eva\",eva@example.com,2024,,None,x\n",
+        encoding='utf-8'
+    )
+    return csv_file
+
+
+class TestReadCsvColumns:
+    """Test cases for read_csv_columns function."""
+
+    def test_only_requested_columns(self, survey_csv):
+        df = read_csv_columns(survey_csv, ['LinkedIn', 'Nombre completo', 'Cargo / Rol'])
+        assert list(df.columns) == ['Nombre completo', 'LinkedIn']
+        assert (df.dtypes == pd.StringDtype('pyarrow')).all()
+
+    def test_values_as_strings(self, survey_csv):
+        df = read_csv_columns(survey_csv, list(COLUMN_MAPPING))
+        assert df['Nombre completo'].tolist() == [' Ana ', 'Luis', 'Pérez, Eva']
+        assert df['Timestamp'].tolist()[0] == '2024-01-01 10:00:00'
+        assert df['Organización / Empresa'].tolist()[2] == '2024'
+
+    def test_na_values_like_read_csv(self, survey_csv):
+        df = read_csv_columns(survey_csv, list(COLUMN_MAPPING))
+        expected = pd.read_csv(survey_csv)
+        for col in df.columns:
+            assert df[col].isna().tolist() == expected[col].isna().tolist()
+
+    def test_no_known_columns(self, survey_csv):
+        with pytest.raises(ValueError, match="none of the expected columns"):
+            read_csv_columns(survey_csv, ['Cargo / Rol'])
+
+
+class TestReadCsvFile:
+    """Test cases for read_csv_file function."""
+
+    def test_pandas_reader_reads_every_column(self, survey_csv):
+        assert len(read_csv_file(survey_csv).columns) == 7
+
+    def test_arrow_reader_skips_unused_columns(self, survey_csv):
+        df = read_csv_file(survey_csv, 'arrow')
+        assert 'Preferencia de comida (para el lunch de cortesía)' not in df.columns
+        assert 'Column 12' not in df.columns
+
+    @pytest.mark.parametrize('engine', ['vectorized', 'python'])
+    def test_same_load_records(self, survey_csv, engine):
+        expected = build_load_records(normalize_dataframe(read_csv_file(survey_csv), engine))
+        records = build_load_records(normalize_dataframe(read_csv_file(survey_csv, 'arrow'), engine))
+        assert records.equals(expected)
+
+    def test_invalid_reader(self, survey_csv):
+        with pytest.raises(ValueError, match="Invalid CSV reader"):
+            read_csv_file(survey_csv, 'polars')
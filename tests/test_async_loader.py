@@ -0,0 +1,226 @@
+"""
+Unit tests for the asyncio loader.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from neo4j.exceptions import DriverError, ServiceUnavailable
+
+from src.pipeline.async_loader import AsyncLoader, load_async_to_neo4j, load_records_async
+from src.pipeline.validation import QuarantineFile, read_quarantine
+
+
+class FakeAsyncDriver:
+    """Async driver double that records batches and the number in flight."""
+
+    def __init__(self, bad_emails=(), unavailable=False, transient_failures=0, down_emails=()):
+        self.bad_emails = set(bad_emails)
+        self.down_emails = set(down_emails)
+        self.unavailable = unavailable
+        self.transient_failures = transient_failures
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    def session(self):
+        return FakeAsyncSession(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeAsyncSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute_write(self, transaction_function, *args):
+        return await transaction_function(FakeAsyncTransaction(self.driver), *args)
+
+
+class FakeAsyncTransaction:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def run(self, query, **params):
+        driver = self.driver
+        if driver.unavailable:
+            driver.batches.append(None)
+            raise ServiceUnavailable("Connection lost")
+        if driver.down_emails & {row['email'] for row in params['rows']}:
+            raise DriverError("Database down")
+        if driver.transient_failures:
+            driver.transient_failures -= 1
+            raise ServiceUnavailable("Connection lost")
+        driver.in_flight += 1
+        driver.max_in_flight = max(driver.max_in_flight, driver.in_flight)
+        try:
+            # Yield to the event loop so other batches can start
+            await asyncio.sleep(0.01)
+            emails = [row['email'] for row in params['rows']]
+            if driver.bad_emails & set(emails):
+                raise ValueError("Constraint violation")
+            driver.batches.append(emails)
+        finally:
+            driver.in_flight -= 1
+        return FakeResult(len(emails))
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def consume(self):
+        summary = MagicMock()
+        summary.counters.nodes_created = self.rows
+        summary.counters.nodes_deleted = 0
+        summary.counters.relationships_created = 0
+        summary.counters.relationships_deleted = 0
+        summary.result_available_after = 1
+        summary.result_consumed_after = 2
+        return summary
+
+
+def make_records(count):
+    return [(idx, {'email': f"user{idx}@example.com"}) for idx in range(count)]
+
+
+def new_stats():
+    return {'rows_processed': 0, 'rows_with_errors': 0, 'errors': []}
+
+
+class TestLoadRecordsAsync:
+    """Test cases for load_records_async function."""
+
+    def test_batches_run_concurrently_up_to_limit(self):
+        """Test that several batches are in flight, never more than the limit."""
+        driver = FakeAsyncDriver()
+        stats = new_stats()
+
+        asyncio.run(load_records_async(driver, make_records(20), 2, 3, stats))
+
+        assert 1 < driver.max_in_flight <= 3
+        assert sorted(email for batch in driver.batches for email in batch) == sorted(
+            row['email'] for _, row in make_records(20)
+        )
+        assert stats['rows_processed'] == 20
+        assert stats['batches_processed'] == 10
+        assert stats['load_counters']['nodes_created'] == 20
+        assert stats['load_metrics']['writes'] == 10
+
+    def test_failing_batch_is_bisected(self):
+        """Test that only the bad row of a failing batch is reported."""
+        driver = FakeAsyncDriver(bad_emails={'user2@example.com'})
+        stats = new_stats()
+
+        asyncio.run(load_records_async(driver, make_records(4), 4, 2, stats))
+
+        assert stats['rows_processed'] == 3
+        assert stats['rows_with_errors'] == 1
+        assert stats['errors'][0]['row_index'] == 2
+        assert stats['bisections'] == 2
+        assert stats['load_metrics']['failed_writes'] == 3
+
+    def test_failed_rows_to_quarantine(self, tmp_path):
+        """Test that the bad row is written to the quarantine instead of stats['errors']."""
+        driver = FakeAsyncDriver(bad_emails={'user2@example.com'})
+        stats = new_stats()
+
+        with QuarantineFile(tmp_path / 'quarantine.jsonl') as quarantine:
+            asyncio.run(load_records_async(driver, make_records(4), 4, 2, stats, quarantine=quarantine))
+
+        assert [sorted(error) for error in stats['errors']] == [['error', 'row_index']]
+        assert stats['errors'][0]['row_index'] == 2
+        records = read_quarantine(tmp_path / 'quarantine.jsonl')
+        assert [(record['row_index'], record['row']['email']) for record in records] == [
+            (2, 'user2@example.com')
+        ]
+
+    def test_outage_is_not_bisected(self):
+        """Test that a database outage aborts the load without bisection."""
+        driver = FakeAsyncDriver(unavailable=True)
+        stats = new_stats()
+
+        with patch('src.pipeline.async_loader.asyncio.sleep', new=AsyncMock()):
+            with pytest.raises(ServiceUnavailable):
+                asyncio.run(load_records_async(driver, make_records(20), 4, 2, stats))
+
+        # Only the batches already in flight were attempted, with 3 retries each
+        assert len(driver.batches) == 8
+        assert stats['transient_retries'] == 6
+        assert 'bisections' not in stats
+        assert stats['errors'] == []
+
+    def test_outage_waits_for_batches_in_flight(self):
+        """Test that the batches in flight finish and are counted before an outage is raised."""
+        driver = FakeAsyncDriver(down_emails={'user2@example.com'})
+        stats = new_stats()
+
+        with pytest.raises(DriverError):
+            asyncio.run(load_records_async(driver, make_records(20), 2, 2, stats))
+
+        assert driver.batches == [['user0@example.com', 'user1@example.com']]
+        assert stats['rows_processed'] == 2
+        assert stats['batches_processed'] == 1
+        assert stats['load_counters']['nodes_created'] == 2
+
+    def test_transient_error_is_retried_with_backoff(self):
+        """Test that a retryable error is retried after an exponential backoff."""
+        driver = FakeAsyncDriver(transient_failures=2)
+        stats = new_stats()
+
+        with patch('src.pipeline.async_loader.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            asyncio.run(load_records_async(driver, make_records(4), 4, 1, stats))
+
+        # The last sleep is the fake transaction's own yield to the event loop
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [0.5, 1.0, 0.01]
+        assert stats['transient_retries'] == 2
+        assert stats['rows_processed'] == 4
+        assert stats['load_metrics']['writes'] == 1
+
+    def test_invalid_concurrency(self):
+        """Test that concurrency must be positive."""
+        with pytest.raises(ValueError):
+            asyncio.run(load_records_async(FakeAsyncDriver(), [], 2, 0, new_stats()))
+
+    def test_blocking_entry_point(self, sample_normalized_data):
+        """Test loading a DataFrame through the blocking entry point."""
+        driver = FakeAsyncDriver()
+        stats = new_stats()
+
+        with patch('src.pipeline.async_loader.AsyncGraphDatabase') as mock_graph_db:
+            mock_graph_db.driver.return_value = driver
+            load_async_to_neo4j(
+                "bolt://localhost:7687", "neo4j", "password",
+                sample_normalized_data, 2, 2, stats
+            )
+
+        mock_graph_db.driver.assert_called_once_with(
+            "bolt://localhost:7687", auth=("neo4j", "password")
+        )
+        assert stats['rows_processed'] == 3
+        assert driver.closed
+
+    def test_loader_reuses_driver_across_loads(self, sample_normalized_data):
+        """Test that one AsyncLoader keeps a single driver for several loads."""
+        driver = FakeAsyncDriver()
+        stats = new_stats()
+
+        with patch('src.pipeline.async_loader.AsyncGraphDatabase') as mock_graph_db:
+            mock_graph_db.driver.return_value = driver
+            with AsyncLoader("bolt://localhost:7687", "neo4j", "password") as loader:
+                loader.load(sample_normalized_data, 2, 2, stats)
+                loader.load(sample_normalized_data, 2, 2, stats)
+                assert not driver.closed
+
+        mock_graph_db.driver.assert_called_once()
+        assert driver.closed
+        assert stats['rows_processed'] == 2 * len(sample_normalized_data)
@@ -0,0 +1,108 @@
+"""
+Unit tests for the offline bulk-import artifact generator.
+"""
+
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+from src.pipeline.bulk_import import deduplicate_persons, write_bulk_import_files
+
+
+@pytest.fixture
+def transformed_data():
+    """Transformed rows with a repeated registrant and shared entities."""
+    return pd.DataFrame({
+        'name': ['John Doe', 'Jane Smith', 'Johnny Doe', 'No Email'],
+        'email': ['john@example.com', 'jane@example.com', 'john@example.com', None],
+        'role': ['Engineer', 'Scientist', None, 'Student'],
+        'organization': ['Tech Corp', 'Tech Corp', 'Tech Corp', 'Other Org'],
+        'industry_sector': ['Technology', None, None, 'Research'],
+        'quantum_experience': ['active', 'academic', 'active', None],
+        'event_expectations': ['Networking', 'Knowledge, sharing\nand more', 'Other', None],
+        'interests_list': [['Finanzas'], ['Finanzas', 'Algoritmos'], ['Finanzas'], ['Química']],
+        'problems_list': [['Falta de networking'], ['Falta de networking'], [], []],
+    })
+
+
+def read_output(tmp_path, file_name):
+    return pd.read_csv(tmp_path / file_name, keep_default_na=False)
+
+
+class TestWriteBulkImportFiles:
+    """Test cases for write_bulk_import_files function."""
+
+    def test_node_files_have_unique_ids(self, transformed_data, tmp_path):
+        """Test that node IDs are deduplicated per ID space."""
+        result = write_bulk_import_files(transformed_data, str(tmp_path))
+
+        persons = read_output(tmp_path, 'persons.csv')
+        assert list(persons.columns[:2]) == ['email:ID(Person)', 'name']
+        assert persons['email:ID(Person)'].is_unique
+        assert result['nodes']['Person']['rows'] == 2
+        assert result['nodes']['Organization']['rows'] == 1
+        assert result['nodes']['Domain']['rows'] == 2
+        assert result['skipped_rows'] == 1
+        assert set(persons[':LABEL']) == {'Person'}
+
+    def test_relationship_files_cover_all_types(self, transformed_data, tmp_path):
+        """Test that every relationship type gets a file with typed ID spaces."""
+        result = write_bulk_import_files(transformed_data, str(tmp_path))
+
+        types = {info['type'] for info in result['relationships'].values()}
+        assert types == {
+            'WORKS_AT', 'HAS_INTEREST', 'HAS_EXPERIENCE_IN', 'HAS_PROBLEM', 'CAN_BE_SOLVED_BY'
+        }
+
+        solved_by = read_output(tmp_path, 'can_be_solved_by.csv')
+        assert list(solved_by.columns) == [
+            ':START_ID(Problem)', ':END_ID(Domain)', 'support:int', 'created_at:datetime', ':TYPE'
+        ]
+        assert len(solved_by) == 2
+        assert (solved_by['support:int'] >= 1).all()
+
+        works_at = read_output(tmp_path, 'works_at.csv')
+        assert len(works_at) == 2  # Repeated registration produces one edge
+
+    def test_command_references_all_files(self, transformed_data, tmp_path):
+        """Test the generated neo4j-admin command."""
+        result = write_bulk_import_files(
+            transformed_data, str(tmp_path), database='staging',
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+
+        command = result['command']
+        assert command.startswith('neo4j-admin database import full staging')
+        assert f"--nodes=Person={tmp_path / 'persons.csv'}" in command
+        assert f"--relationships=HAS_PROBLEM={tmp_path / 'organization_has_problem.csv'}" in command
+        assert '--multiline-fields=true' in command
+
+    def test_multiline_text_survives_roundtrip(self, transformed_data, tmp_path):
+        """Test that free text with commas and newlines is quoted correctly."""
+        write_bulk_import_files(transformed_data, str(tmp_path))
+
+        persons = read_output(tmp_path, 'persons.csv').set_index('email:ID(Person)')
+        assert persons.loc['jane@example.com', 'event_expectations'] == 'Knowledge, sharing\nand more'
+
+
+class TestDeduplicatePersons:
+    """Test cases for deduplicate_persons function."""
+
+    def test_later_values_override_like_merge(self):
+        """Test that repeated registrations collapse like MERGE ... COALESCE."""
+        persons = pd.DataFrame({
+            'email': ['a@x.com', 'a@x.com'],
+            'name': ['A', 'A. Smith'],
+            'role': ['Engineer', None],
+            'linkedin_url': [None, None],
+            'quantum_experience': ['academic', 'active'],
+            'event_expectations': ['First', 'Second'],
+        })
+
+        result = deduplicate_persons(persons).iloc[0]
+
+        assert result['name'] == 'A. Smith'
+        assert result['role'] == 'Engineer'
+        assert result['quantum_experience'] == 'active'
+        assert result['event_expectations'] == 'First'
@@ -0,0 +1,277 @@
+"""
+Unit tests for organization entity resolution.
+"""
+
+import random
+
+import pandas as pd
+import pytest
+
+from src.pipeline.entity_resolution import (
+    ALIAS_TABLE_COLUMNS,
+    OrganizationResolver,
+    key_trigrams,
+    organization_key,
+    read_alias_table,
+    strip_qualifiers,
+    write_alias_table,
+)
+
+
+def jaccard(key, other):
+    grams, other_grams = key_trigrams(key), key_trigrams(other)
+    return len(grams & other_grams) / len(grams | other_grams)
+
+
+def brute_force_clusters(names, threshold):
+    """Reference: score every earlier key, join clusters by complete linkage."""
+    keys = list(dict.fromkeys(organization_key(name) for name in names))
+    cluster_of = {}
+    clusters = []
+    for i, key in enumerate(keys):
+        scores = sorted(
+            ((jaccard(key, other), other) for other in keys[:i]), key=lambda match: -match[0]
+        )
+        for score, other in scores:
+            cluster = clusters[cluster_of[other]]
+            if score >= threshold and all(jaccard(key, member) >= threshold for member in cluster):
+                cluster.append(key)
+                cluster_of[key] = cluster_of[other]
+                break
+        else:
+            cluster_of[key] = len(clusters)
+            clusters.append([key])
+    grouped = {}
+    for name in names:
+        grouped.setdefault(cluster_of[organization_key(name)], set()).add(name)
+    return sorted(map(sorted, grouped.values()))
+
+
+class TestOrganizationKey:
+    """Test cases for organization_key function."""
+
+    @pytest.mark.parametrize('name', ['IBM', 'ibm ', 'I.B.M.', 'IBM Inc.', 'IBM Corp'])
+    def test_variants_share_a_key(self, name):
+        assert organization_key(name) == 'ibm'
+
+    def test_accents_punctuation_and_legal_forms(self):
+        assert organization_key('Pontificia Universidad Católica de Chile.') == (
+            'pontificia universidad catolica de chile'
+        )
+        assert organization_key('Banco de Chile S.A.') == 'banco de chile'
+        assert organization_key('Quantum Labs Ltda') == 'quantum labs'
+
+    def test_never_empty(self):
+        assert organization_key('Research') == 'research'
+        assert organization_key('Inc.') == 'inc'
+
+    def test_strip_qualifiers(self):
+        assert strip_qualifiers('ibm research') == 'ibm'
+        assert strip_qualifiers('quantum research labs') == 'quantum'
+        assert strip_qualifiers('research') == 'research'
+
+    def test_key_trigrams(self):
+        assert key_trigrams('ibm') == {' ib', 'ibm', 'bm '}
+        assert key_trigrams('a') == {' a '}
+
+
+class TestOrganizationResolver:
+    """Test cases for OrganizationResolver."""
+
+    def test_variants_map_to_most_frequent_spelling(self):
+        resolver = OrganizationResolver()
+        series = pd.Series(
+            ['IBM Research', 'IBM', None, 'ibm ', 'IBM', 'Qnow'], index=list('abcdef')
+        )
+
+        result = resolver.resolve_series(series)
+
+        assert result.index.equals(series.index)
+        assert result.tolist() == ['IBM', 'IBM', None, 'IBM', 'IBM', 'Qnow']
+
+    def test_typos_merge_and_distinct_names_stay_apart(self):
+        resolver = OrganizationResolver()
+        names = [
+            'Universidad de Chile', 'Universidad de Chile', 'Universidad de Chle',
+            'Universidad de Talca', 'Universidad de los Andes',
+            'Universidad de los Andes Colombia',
+        ]
+
+        result = resolver.resolve_series(pd.Series(names))
+
+        assert result.tolist() == [
+            'Universidad de Chile', 'Universidad de Chile', 'Universidad de Chile',
+            'Universidad de Talca', 'Universidad de los Andes',
+            'Universidad de los Andes Colombia',
+        ]
+
+    def test_chained_names_are_not_merged(self):
+        """Test that a key must be similar to every key of the cluster it joins."""
+        resolver = OrganizationResolver()
+        names = ['Universidad de Chile', 'Universidad de Chle', 'Universidad de Chiloé']
+        # Chiloé is close to Chile but not to Chle
+        assert jaccard('universidad de chiloe', 'universidad de chile') >= 0.75
+        assert jaccard('universidad de chiloe', 'universidad de chle') < 0.75
+
+        result = resolver.resolve_series(pd.Series(names))
+
+        assert result.tolist() == [
+            'Universidad de Chile', 'Universidad de Chile', 'Universidad de Chiloé'
+        ]
+        assert (resolver.alias_table()['similarity'] >= 0.75).all()
+
+    def test_qualifiers_only_stripped_to_existing_spellings(self):
+        """Test that qualified names do not merge without an unqualified spelling."""
+        resolver = OrganizationResolver()
+
+        result = resolver.resolve_series(pd.Series(['Quantum Group', 'Quantum Labs', 'Quantum Research']))
+
+        assert result.tolist() == ['Quantum Group', 'Quantum Labs', 'Quantum Research']
+        # Once 'Quantum' is seen, a new qualified spelling joins it
+        assert resolver.resolve_series(pd.Series(['Quantum', 'Quantum Lab'])).tolist() == [
+            'Quantum', 'Quantum'
+        ]
+        assert resolver.resolve('Quantum Group') == 'Quantum Group'
+
+    def test_resolve_single_name(self):
+        resolver = OrganizationResolver()
+        assert resolver.resolve('Tech Corp') == 'Tech Corp'
+        assert resolver.resolve('TECH CORP.') == 'Tech Corp'
+        assert resolver.resolve(None) is None
+
+    def test_canonical_names_are_stable_across_calls(self):
+        """Test that later chunks map to the names already resolved."""
+        resolver = OrganizationResolver()
+        resolver.resolve_series(pd.Series(['ibm ']))
+
+        result = resolver.resolve_series(pd.Series(['IBM', 'IBM', 'IBM', 'IBM Research']))
+
+        assert result.tolist() == ['ibm ', 'ibm ', 'ibm ', 'ibm ']
+
+    def test_clusters_with_canonical_names_are_not_merged(self):
+        """Test that a bridging name does not merge two resolved organizations."""
+        resolver = OrganizationResolver(threshold=0.6)
+        resolver.resolve_series(pd.Series(['Quantum Alpha', 'Quantum Alpine']))
+
+        assert resolver.resolve('Quantum Alpin') in ('Quantum Alpha', 'Quantum Alpine')
+        assert resolver.resolve('Quantum Alpha') == 'Quantum Alpha'
+        assert resolver.resolve('Quantum Alpine') == 'Quantum Alpine'
+
+    def test_pinned_aliases(self):
+        resolver = OrganizationResolver(aliases={
+            'IBM Research': 'IBM Research',
+            'International Business Machines': 'IBM',
+            'Universidad de Chile': 'UChile',
+        })
+
+        result = resolver.resolve_series(pd.Series([
+            'IBM', 'IBM Research', 'International Business Machines', 'Universidad de Chle', 'UChile'
+        ]))
+
+        assert result.tolist() == ['IBM', 'IBM Research', 'IBM', 'UChile', 'UChile']
+
+    @pytest.mark.parametrize('seed', [0, 1])
+    def test_matches_all_pairs_comparison(self, seed):
+        """Test that blocking finds every pair the all-pairs comparison finds."""
+        rng = random.Random(seed)
+        words = ['quantum', 'universidad', 'chile', 'andes', 'tech', 'datos', 'banco', 'centro', 'qnow']
+        names = []
+        for _ in range(300):
+            name = ' '.join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+            if rng.random() < 0.5:
+                position = rng.randrange(len(name))
+                name = name[:position] + rng.choice('aeiouxyz') + name[position + 1:]
+            names.append(name.title() if rng.random() < 0.5 else name)
+
+        resolver = OrganizationResolver(threshold=0.7, max_block_size=10_000, max_candidates=10_000)
+        result = resolver.resolve_series(pd.Series(names))
+
+        clusters = {}
+        for name, canonical in zip(names, result):
+            clusters.setdefault(canonical, set()).add(name)
+        assert sorted(map(sorted, clusters.values())) == brute_force_clusters(names, 0.7)
+
+    def test_comparisons_are_blocked(self):
+        names = [f"Organization {i} {i * 7919 % 10007}" for i in range(2000)]
+        resolver = OrganizationResolver()
+
+        resolver.resolve_series(pd.Series(names))
+
+        assert resolver.stats()['comparisons'] < len(names) * 10
+
+    def test_comparisons_per_name_stay_bounded(self):
+        """Test that crowded blocks do not make the comparisons grow with the index."""
+        rng = random.Random(0)
+        words = ['quantum', 'universidad', 'chile', 'andes', 'tech', 'datos', 'banco', 'centro']
+        names = [
+            ' '.join(rng.choice(words) for _ in range(4)) + f" {rng.randrange(1000)}"
+            for _ in range(4000)
+        ]
+
+        per_name = []
+        for size in (1000, 4000):
+            resolver = OrganizationResolver(max_candidates=20)
+            resolver.resolve_series(pd.Series(names[:size]))
+            stats = resolver.stats()
+            assert stats['comparisons'] <= 20 * stats['keys']
+            per_name.append(stats['comparisons'] / stats['keys'])
+        uncapped = OrganizationResolver(max_candidates=len(names))
+        uncapped.resolve_series(pd.Series(names))
+
+        assert uncapped.stats()['comparisons'] / uncapped.stats()['keys'] > 2 * per_name[1]
+
+    def test_stats(self):
+        resolver = OrganizationResolver()
+        resolver.resolve_series(pd.Series(['IBM', 'ibm', 'Qnow', None]))
+
+        stats = resolver.stats()
+
+        assert stats['names'] == 3
+        assert stats['keys'] == 2
+        assert stats['clusters'] == 2
+        assert stats['names_merged'] == 1
+
+    @pytest.mark.parametrize('kwargs', [
+        {'threshold': 0}, {'threshold': 1.5}, {'max_block_size': 0}, {'max_candidates': 0}
+    ])
+    def test_invalid_parameters(self, kwargs):
+        with pytest.raises(ValueError):
+            OrganizationResolver(**kwargs)
+
+
+class TestAliasTable:
+    """Test cases for the alias table."""
+
+    def test_alias_table(self):
+        resolver = OrganizationResolver()
+        resolver.resolve_series(pd.Series(['Qnow', 'IBM', 'IBM', 'IBM Research', 'ibm']))
+
+        table = resolver.alias_table()
+
+        assert list(table.columns) == ALIAS_TABLE_COLUMNS
+        assert table[['organization', 'canonical', 'rows']].values.tolist() == [
+            ['IBM', 'IBM', 2],
+            ['ibm', 'IBM', 1],
+            ['IBM Research', 'IBM', 1],
+            ['Qnow', 'Qnow', 1],
+        ]
+        assert table['similarity'].tolist() == [1.0, 1.0, 1.0, 1.0]
+
+    def test_round_trip_pins_reviewed_mappings(self, tmp_path):
+        path = tmp_path / 'organization_aliases.csv'
+        resolver = OrganizationResolver()
+        resolver.resolve_series(pd.Series(['IBM', 'IBM Research']))
+        table = resolver.alias_table()
+        # Reviewer splits IBM Research off
+        table.loc[table['organization'] == 'IBM Research', 'canonical'] = 'IBM Research'
+        write_alias_table(path, table)
+
+        rerun = OrganizationResolver(aliases=read_alias_table(path))
+
+        assert rerun.resolve_series(pd.Series(['IBM Research', 'ibm'])).tolist() == [
+            'IBM Research', 'IBM'
+        ]
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_missing_table_is_empty(self, tmp_path):
+        assert read_alias_table(tmp_path / 'missing.csv') == {}
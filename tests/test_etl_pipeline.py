@@ -5,6 +5,8 @@ This test suite covers all functions in the etl_to_graph module,
 ensuring proper data transformation and Neo4j integration.
 """
 
+import json
+import os
 import pandas as pd
 import pytest
 from pathlib import Path
@@ -13,6 +15,7 @@ import numpy as np
 
 from src.pipeline.etl_to_graph import (
     normalize_column_names,
+    normalize_dataframe,
     clean_text,
     normalize_linkedin_url,
     normalize_quantum_experience,
@@ -26,8 +29,32 @@ from src.pipeline.etl_to_graph import (
     close_driver,
     get_session,
     insert_row_to_neo4j,
+    insert_batch_to_neo4j,
+    load_rows_to_neo4j,
+    load_batches_to_neo4j,
+    iter_batches,
+    build_load_records,
+    build_phase_frames,
+    build_derived_edge_frames,
+    load_phased_to_neo4j,
+    load_derived_edges_to_neo4j,
+    DERIVED_EDGE_PHASES,
+    PHASE_QUERIES,
+    partition_frame,
+    load_parallel_to_neo4j,
+    insert_phase_batch_to_neo4j,
+    execute_write_with_retry,
+    write_with_bisection,
+    DEADLOCK_ERROR_CODE,
+    clear_graph,
+    stream_csv_chunks,
+    STREAM_PROBE_ROWS,
     run_etl_pipeline,
 )
+from src.pipeline import etl_to_graph
+from src.pipeline.entity_resolution import default_alias_table_path, read_alias_table
+from src.pipeline.validation import QuarantineFile, read_quarantine
+from neo4j.exceptions import Neo4jError, ServiceUnavailable
 
 
 # ============================================================================
@@ -373,6 +400,24 @@ class TestGenerateCypherQuery:
         assert "ON MATCH SET" in query
         assert "UNWIND" in query
         assert "WHERE" in query
+    
+    def test_batched_query_unwinds_rows_list(self):
+        """Test that the batched query reads a $rows list instead of a single $row."""
+        query = generate_cypher_query(batched=True)
+        
+        assert "UNWIND $rows AS row" in query
+        assert "UNWIND [$row] AS row" not in query
+        assert "UNWIND [$row] AS row" in generate_cypher_query()
+    
+    def test_query_without_derived_edges(self):
+        """Test that derived_edges=False drops the Organization/Problem-Domain edges."""
+        query = generate_cypher_query(batched=True, derived_edges=False)
+        
+        assert "CAN_BE_SOLVED_BY" not in query
+        assert "(o)-[op:HAS_PROBLEM]" not in query
+        assert "(p)-[hp:HAS_PROBLEM]" in query
+        assert "RETURN count(p) AS persons_processed" in query
+        assert "CAN_BE_SOLVED_BY" in generate_cypher_query(batched=True)
 
 
 # ============================================================================
@@ -415,6 +460,77 @@ class TestNeo4jConnection:
         mock_session.close.assert_called_once()
 
 
+# ============================================================================
+# Tests for Graph Cleanup
+# ============================================================================
+
+def make_delete_session(deletions):
+    """
+    Build a mock session whose delete queries report the given counters.
+    
+    deletions maps a query fragment to the list of (nodes, relationships)
+    deleted by successive runs; once exhausted, nothing is deleted.
+    """
+    session = MagicMock()
+    remaining = {fragment: list(counts) for fragment, counts in deletions.items()}
+    
+    def run(query, **params):
+        nodes, relationships = 0, 0
+        for fragment, counts in remaining.items():
+            if fragment in query and counts:
+                nodes, relationships = counts.pop(0)
+        result = MagicMock()
+        result.consume.return_value.counters.nodes_deleted = nodes
+        result.consume.return_value.counters.relationships_deleted = relationships
+        result.consume.return_value.counters.nodes_created = 0
+        result.consume.return_value.counters.relationships_created = 0
+        return result
+    
+    session.run.side_effect = run
+    return session
+
+
+class TestClearGraph:
+    """Test cases for clear_graph function."""
+    
+    def test_requires_confirmation(self):
+        """Test that deletion requires confirm=True."""
+        with pytest.raises(ValueError, match="confirm=True"):
+            clear_graph(MagicMock())
+    
+    def test_chunked_clear_deletes_in_bounded_transactions(self):
+        """Test that chunked mode loops until nothing is left to delete."""
+        session = make_delete_session({
+            'DELETE r': [(0, 3), (0, 2)],
+            'DETACH DELETE n': [(3, 0), (1, 0)],
+        })
+        
+        result = clear_graph(session, confirm=True, chunk_size=3)
+        
+        assert result == {'nodes_deleted': 4, 'relationships_deleted': 5, 'chunks': 4}
+        queries = [call.args[0] for call in session.run.call_args_list]
+        assert all('LIMIT $limit' in q for q in queries)
+        assert all(call.kwargs['limit'] == 3 for call in session.run.call_args_list)
+        assert queries.index(next(q for q in queries if 'DETACH' in q)) > 0
+    
+    def test_label_scoped_clear(self):
+        """Test that label scoping only touches nodes with those labels."""
+        session = make_delete_session({'DETACH DELETE n': [(2, 1)]})
+        
+        result = clear_graph(session, confirm=True, labels=['Problem'])
+        
+        queries = [call.args[0] for call in session.run.call_args_list]
+        assert all('(n:`Problem`)' in q for q in queries)
+        assert result['nodes_deleted'] == 2
+    
+    def test_invalid_options(self):
+        """Test that invalid chunk options are rejected."""
+        with pytest.raises(ValueError):
+            clear_graph(MagicMock(), confirm=True, chunk_size=0)
+        with pytest.raises(ValueError):
+            clear_graph(MagicMock(), confirm=True, labels=[])
+
+
 # ============================================================================
 # Tests for Neo4j Insertion
 # ============================================================================
@@ -444,10 +560,568 @@ class TestInsertRowToNeo4j:
         assert call_args.kwargs['row'] == row_data
 
 
+class TestInsertBatchToNeo4j:
+    """Test cases for insert_batch_to_neo4j and iter_batches functions."""
+    
+    def test_insert_batch_single_round_trip(self, mock_neo4j_session):
+        """Test that a whole batch is sent through one query."""
+        rows = [
+            {'name': 'John Doe', 'email': 'john@example.com', 'interests': []},
+            {'name': 'Jane Smith', 'email': 'jane@example.com', 'interests': []},
+        ]
+        
+        result = insert_batch_to_neo4j(mock_neo4j_session, rows)
+        
+        mock_neo4j_session.run.assert_called_once()
+        call_args = mock_neo4j_session.run.call_args
+        assert "UNWIND $rows AS row" in call_args.args[0]
+        assert call_args.kwargs['rows'] == rows
+        assert result['nodes_created'] == 1
+        assert result['relationships_created'] == 2
+    
+    def test_iter_batches(self):
+        """Test splitting items into batches."""
+        assert list(iter_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(iter_batches([], 3)) == []
+    
+    def test_iter_batches_invalid_size(self):
+        """Test that a non-positive batch size is rejected."""
+        with pytest.raises(ValueError):
+            list(iter_batches([1, 2], 0))
+
+
+# ============================================================================
+# Tests for Phase-Split Loading
+# ============================================================================
+
+@pytest.fixture
+def phased_transformed_data():
+    """Transformed rows with shared organizations, interests and problems."""
+    return pd.DataFrame({
+        'name': ['John Doe', 'Jane Smith', 'Bob Johnson', 'No Email'],
+        'email': ['john@example.com', 'jane@example.com', 'bob@example.com', None],
+        'organization': ['Tech Corp', 'Tech Corp', None, 'Other Org'],
+        'industry_sector': ['Technology', None, 'Academia', 'Research'],
+        'quantum_experience': ['active', 'academic', 'exploration', None],
+        'interests_list': [
+            ['Investigación académica', 'Desarrollo de software'],
+            ['Investigación académica'],
+            [],
+            ['Casos de uso en Finanzas'],
+        ],
+        'problems_list': [
+            ['Falta de networking'],
+            ['Falta de networking', 'Falta de actualización'],
+            ['Falta de conocimiento general'],
+            [],
+        ],
+    })
+
+
+def make_graph_session():
+    """
+    Build a mock session keeping the person relationships (written by the
+    phase queries or the per-person template) and the derived edge support
+    in memory.
+    
+    Derived edge support follows the query: recounted from the stored
+    relationships when the query counts them, taken from the row otherwise.
+    """
+    session = MagicMock()
+    session.graph = {'works_at': set(), 'has_interest': set(), 'person_has_problem': set()}
+    session.support = {}
+    
+    def recount(phase, row):
+        problems = {email for email, problem in session.graph['person_has_problem'] if problem == row['problem']}
+        if phase == 'organization_has_problem':
+            related = session.graph['works_at']
+            other = row['organization']
+        else:
+            related = session.graph['has_interest']
+            other = row['domain']
+        return len({email for email, name in related if name == other} & problems)
+    
+    def run(query, **params):
+        if query not in PHASE_QUERIES.values():
+            # Per-person template: one row per person
+            for row in params.get('rows', [params.get('row')]):
+                if row.get('organization'):
+                    session.graph['works_at'].add((row['email'], row['organization']))
+                session.graph['has_interest'].update((row['email'], name) for name in row['interests'])
+                session.graph['person_has_problem'].update((row['email'], name) for name in row['problems'])
+        for phase, phase_query in PHASE_QUERIES.items():
+            if query != phase_query:
+                continue
+            for row in params['rows']:
+                if phase in session.graph:
+                    session.graph[phase].add(tuple(row[key] for key in row if key != 'experience_level'))
+                elif phase in DERIVED_EDGE_PHASES:
+                    pair = (phase, row.get('organization') or row['domain'], row['problem'])
+                    session.support[pair] = recount(phase, row) if 'COUNT {' in query else row['support']
+        result = MagicMock()
+        result.consume.return_value.counters.nodes_created = 0
+        return result
+    
+    session.run.side_effect = run
+    session.execute_write.side_effect = (
+        lambda transaction_function, *args, **kwargs:
+            transaction_function(session, *args, **kwargs)
+    )
+    return session
+
+
+class TestPhasedLoading:
+    """Test cases for phase-split loading functions."""
+    
+    def test_build_load_records_matches_prepare_row(self, sample_normalized_data):
+        """Test that column-wise records equal prepare_row_for_neo4j output."""
+        records = build_load_records(sample_normalized_data)
+        
+        for idx, row in sample_normalized_data.iterrows():
+            expected = prepare_row_for_neo4j(row)
+            expected['problems'] = []  # No problems_list column in this fixture
+            assert records.loc[idx].to_dict() == expected
+    
+    def test_phase_frames_are_distinct(self, phased_transformed_data):
+        """Test that shared nodes and derived edges appear once per load."""
+        frames = build_phase_frames(build_load_records(phased_transformed_data))
+        
+        assert list(frames) == list(PHASE_QUERIES)
+        assert frames['organizations'].to_dict('records') == [
+            {'name': 'Tech Corp', 'industry_sector': 'Technology'}
+        ]
+        assert sorted(frames['domains']['name']) == [
+            'Desarrollo de software', 'Investigación académica'
+        ]
+        assert len(frames['problems']) == 3
+        assert len(frames['organization_has_problem']) == 2
+        assert frames['has_experience_in']['email'].unique().tolist() == ['john@example.com']
+        # Person without organization still gets its problem relationships
+        assert 'bob@example.com' in frames['person_has_problem']['email'].values
+        # Records without email are excluded from every phase
+        assert len(frames['persons']) == 3
+    
+    def test_derived_edge_support_counts(self, phased_transformed_data):
+        """Test that derived edges are distinct pairs counted by distinct persons."""
+        frames = build_derived_edge_frames(build_load_records(phased_transformed_data))
+        
+        assert list(frames) == DERIVED_EDGE_PHASES
+        organization_problems = {
+            (row['organization'], row['problem']): row['support']
+            for row in frames['organization_has_problem'].to_dict('records')
+        }
+        assert organization_problems == {
+            ('Tech Corp', 'Falta de networking'): 2,
+            ('Tech Corp', 'Falta de actualización'): 1,
+        }
+        solved_by = {
+            (row['problem'], row['domain']): row['support']
+            for row in frames['can_be_solved_by'].to_dict('records')
+        }
+        assert solved_by == {
+            ('Falta de networking', 'Investigación académica'): 2,
+            ('Falta de networking', 'Desarrollo de software'): 1,
+            ('Falta de actualización', 'Investigación académica'): 1,
+        }
+        # The phased load writes the same aggregated frames
+        phase_frames = build_phase_frames(build_load_records(phased_transformed_data))
+        pd.testing.assert_frame_equal(
+            phase_frames['can_be_solved_by'], frames['can_be_solved_by']
+        )
+    
+    def test_load_derived_edges(self, phased_transformed_data, mock_neo4j_session):
+        """Test that each distinct derived edge is written once with its support."""
+        stats = {'rows_processed': 0, 'rows_with_errors': 0, 'errors': []}
+        
+        load_derived_edges_to_neo4j(mock_neo4j_session, phased_transformed_data, 10, stats)
+        
+        calls = mock_neo4j_session.run.call_args_list
+        assert [call.args[0] for call in calls] == [
+            PHASE_QUERIES[phase] for phase in DERIVED_EDGE_PHASES
+        ]
+        assert [len(call.kwargs['rows']) for call in calls] == [2, 3]
+        assert all('support' in row for call in calls for row in call.kwargs['rows'])
+        assert stats['phases']['can_be_solved_by']['rows'] == 3
+        # Derived edges do not count as processed person rows
+        assert stats['rows_processed'] == 0
+    
+    def test_load_phased_nodes_before_relationships(
+        self, phased_transformed_data, mock_neo4j_session
+    ):
+        """Test that node phases run first and row accounting uses persons."""
+        stats = {'rows_processed': 0, 'rows_with_errors': 0, 'errors': []}
+        
+        load_phased_to_neo4j(mock_neo4j_session, phased_transformed_data, 2, stats)
+        
+        queries = [call.args[0] for call in mock_neo4j_session.run.call_args_list]
+        first_relationship = next(i for i, q in enumerate(queries) if 'WORKS_AT' in q)
+        assert all('MATCH (' not in q for q in queries[:first_relationship])
+        
+        assert stats['rows_processed'] == 3
+        assert stats['rows_with_errors'] == 1
+        assert stats['errors'][0]['row_index'] == 3
+        assert stats['phases']['persons'] == {'rows': 3, 'batches': 2, 'rows_with_errors': 0}
+        assert stats['load_counters']['nodes_created'] == len(queries)
+    
+    def test_load_phased_relationship_batch_error(
+        self, phased_transformed_data, mock_neo4j_session
+    ):
+        """Test that a failed relationship batch does not fail person rows."""
+        summary = mock_neo4j_session.run.return_value
+        
+        def run(query, **params):
+            if 'CAN_BE_SOLVED_BY' in query:
+                raise Exception("Relationship error")
+            return summary
+        
+        mock_neo4j_session.run.side_effect = run
+        stats = {'rows_processed': 0, 'rows_with_errors': 0, 'errors': []}
+        
+        load_phased_to_neo4j(mock_neo4j_session, phased_transformed_data, 10, stats)
+        
+        assert stats['rows_processed'] == 3
+        assert stats['phases']['can_be_solved_by']['rows_with_errors'] == 3
+        assert stats['errors'][-1]['phase'] == 'can_be_solved_by'
+    
+    def test_load_phased_errors_to_quarantine(
+        self, phased_transformed_data, mock_neo4j_session, tmp_path
+    ):
+        """Test that failed phase rows are written to the quarantine during the load."""
+        summary = mock_neo4j_session.run.return_value
+        
+        def run(query, **params):
+            if 'CAN_BE_SOLVED_BY' in query:
+                raise Exception("Relationship error")
+            return summary
+        
+        mock_neo4j_session.run.side_effect = run
+        stats = {'rows_processed': 0, 'rows_with_errors': 0, 'errors': []}
+        
+        with QuarantineFile(tmp_path / 'quarantine.jsonl') as quarantine:
+            load_phased_to_neo4j(
+                mock_neo4j_session, phased_transformed_data, 10, stats, quarantine=quarantine
+            )
+            # Missing email and the three failed pairs, before the file is closed
+            assert quarantine.rows_written == 4
+        
+        assert all('row_data' not in error for error in stats['errors'])
+        assert stats['errors'][0] == {
+            'row_index': 3, 'error': "Missing email (Person MERGE key)"
+        }
+        assert stats['errors'][-1] == {
+            'row_index': None, 'phase': 'can_be_solved_by', 'error': "Relationship error"
+        }
+        records = read_quarantine(tmp_path / 'quarantine.jsonl')
+        assert records[-1]['reasons'] == ['load_error']
+        assert set(records[-1]['row']) == {'problem', 'domain', 'support'}
+
+
+class TestParallelLoading:
+    """Test cases for the parallel multi-session loader."""
+    
+    def test_partition_frame_is_stable_and_disjoint(self):
+        """Test that a key always maps to the same partition."""
+        frame = pd.DataFrame({
+            'email': ['a@x.com', 'b@x.com', 'a@x.com', 'c@x.com'],
+            'domain': ['D1', 'D1', 'D2', 'D3'],
+        })
+        
+        partitions = partition_frame(frame, 'email', 3)
+        
+        assert sum(len(p) for p in partitions) == len(frame)
+        owners = [i for i, p in enumerate(partitions) if 'a@x.com' in p['email'].values]
+        assert len(owners) == 1
+        assert partition_frame(frame, 'email', 3)[owners[0]].equals(partitions[owners[0]])
+    
+    def test_parallel_load_matches_phased_accounting(
+        self, phased_transformed_data, mock_neo4j_session
+    ):
+        """Test that workers use their own sessions and stats are merged."""
+        driver = MagicMock()
+        driver.session.return_value = mock_neo4j_session
+        stats = {'rows_processed': 0, 'rows_with_errors': 0, 'errors': []}
+        
+        load_parallel_to_neo4j(driver, phased_transformed_data, 1, 3, stats)
+        
+        assert driver.session.call_count > 1
+        assert stats['rows_processed'] == 3
+        assert stats['rows_with_errors'] == 1
+        assert stats['phases']['persons']['rows'] == 3
+        assert stats['phases']['has_interest']['rows'] == 3
+        assert stats['deadlock_retries'] == 0
+        assert stats['load_counters']['nodes_created'] == mock_neo4j_session.run.call_count
+    
+    @patch('src.pipeline.etl_to_graph.time.sleep')
+    def test_deadlock_retries_are_counted(self, mock_sleep, mock_neo4j_session):
+        """Test that deadlocked batches are retried and counted."""
+        deadlock = Neo4jError._hydrate_neo4j(code=DEADLOCK_ERROR_CODE, message="Deadlock")
+        summary_result = mock_neo4j_session.run.return_value
+        mock_neo4j_session.run.side_effect = [deadlock, deadlock, summary_result]
+        stats = {}
+        
+        result = insert_phase_batch_to_neo4j(
+            mock_neo4j_session, 'persons', [{'email': 'a@x.com'}], stats
+        )
+        
+        assert result['nodes_created'] == 1
+        assert stats['deadlock_retries'] == 2
+        assert mock_neo4j_session.run.call_count == 3
+
+
+# ============================================================================
+# Tests for Write Retries and Batch Bisection
+# ============================================================================
+
+class TestWriteRetriesAndBisection:
+    """Test cases for execute_write_with_retry and write_with_bisection."""
+    
+    def test_write_uses_managed_transaction(self, mock_neo4j_session):
+        """Test that writes go through session.execute_write."""
+        result = execute_write_with_retry(mock_neo4j_session, "RETURN 1", {'row': {}})
+        
+        mock_neo4j_session.execute_write.assert_called_once()
+        assert result['nodes_created'] == 1
+    
+    def test_write_records_load_metrics(self, mock_neo4j_session):
+        """Test that latency, rows and server timings of a write are recorded."""
+        stats = {}
+        
+        execute_write_with_retry(mock_neo4j_session, "RETURN 1", {'rows': [{}, {}]}, stats)
+        
+        metrics = stats['load_metrics']
+        assert metrics['writes'] == 1
+        assert metrics['rows_written'] == 2
+        assert len(metrics['latencies_ms']) == 1
+        assert metrics['result_available_after_ms'] == 3
+        assert metrics['result_consumed_after_ms'] == 5
+    
+    @patch('src.pipeline.etl_to_graph.time.sleep')
+    def test_retryable_error_uses_exponential_backoff(self, mock_sleep, mock_neo4j_session):
+        """Test that retryable errors are retried with growing waits."""
+        summary_result = mock_neo4j_session.run.return_value
+        mock_neo4j_session.run.side_effect = [
+            ServiceUnavailable("Connection lost"),
+            ServiceUnavailable("Connection lost"),
+            summary_result,
+        ]
+        stats = {}
+        
+        execute_write_with_retry(
+            mock_neo4j_session, "RETURN 1", {}, stats,
+            initial_backoff=0.5, backoff_multiplier=2.0
+        )
+        
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+        assert stats['transient_retries'] == 2
+    
+    @patch('src.pipeline.etl_to_graph.time.sleep')
+    def test_non_retryable_error_is_raised(self, mock_sleep, mock_neo4j_session):
+        """Test that client errors are not retried."""
+        error = Neo4jError._hydrate_neo4j(
+            code='Neo.ClientError.Statement.SyntaxError', message="Bad query"
+        )
+        mock_neo4j_session.run.side_effect = error
+        
+        with pytest.raises(Neo4jError):
+            execute_write_with_retry(mock_neo4j_session, "RETURN", {}, max_retries=3)
+        
+        mock_sleep.assert_not_called()
+    
+    def test_bisection_isolates_bad_rows(self):
+        """Test that only the offending rows of a failed batch are lost."""
+        written = []
+        
+        def write_batch(rows):
+            if any(row['bad'] for row in rows):
+                raise ValueError("Constraint violation")
+            written.extend(row['id'] for row in rows)
+            return {'nodes_created': len(rows)}
+        
+        indexed_rows = [(i, {'id': i, 'bad': i in (2, 5)}) for i in range(8)]
+        stats = {}
+        
+        counters, failed = write_with_bisection(write_batch, indexed_rows, stats)
+        
+        assert sorted(written) == [0, 1, 3, 4, 6, 7]
+        assert counters == {'nodes_created': 6}
+        assert [idx for idx, _, _ in failed] == [2, 5]
+        assert failed[0][2] == "Constraint violation"
+        assert stats['bisections'] > 0
+    
+    def test_bisection_on_non_retryable_neo4j_error(self):
+        """Test that client errors from Neo4j are bisected like other row errors."""
+        error = Neo4jError._hydrate_neo4j(
+            code='Neo.ClientError.Schema.ConstraintValidationFailed', message="Constraint"
+        )
+        
+        def write_batch(rows):
+            if any(row['bad'] for row in rows):
+                raise error
+            return {'nodes_created': len(rows)}
+        
+        indexed_rows = [(i, {'bad': i == 1}) for i in range(4)]
+        counters, failed = write_with_bisection(write_batch, indexed_rows, {})
+        
+        assert counters == {'nodes_created': 3}
+        assert [idx for idx, _, _ in failed] == [1]
+    
+    @pytest.mark.parametrize('error', [
+        ServiceUnavailable("Connection lost"),
+        Neo4jError._hydrate_neo4j(
+            code='Neo.TransientError.General.DatabaseUnavailable', message="Unavailable"
+        ),
+    ])
+    def test_outage_is_not_bisected(self, error):
+        """Test that a database outage is raised without bisection."""
+        write_batch = MagicMock(side_effect=error)
+        stats = {}
+        
+        with pytest.raises(type(error)):
+            write_with_bisection(write_batch, [(i, {}) for i in range(1000)], stats)
+        
+        write_batch.assert_called_once()
+        assert 'bisections' not in stats
+    
+    def test_row_mode_aborts_on_outage(self, sample_normalized_data, mock_neo4j_session):
+        """Test that the row mode stops at the first outage instead of failing every row."""
+        mock_neo4j_session.run.side_effect = ServiceUnavailable("Connection lost")
+        stats = {'rows_processed': 0, 'rows_with_errors': 0, 'errors': []}
+        
+        with patch('src.pipeline.etl_to_graph.time.sleep'):
+            with pytest.raises(ServiceUnavailable):
+                load_rows_to_neo4j(mock_neo4j_session, sample_normalized_data, stats)
+        
+        assert stats['errors'] == []
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.insert_batch_to_neo4j')
+    @patch('pandas.read_csv')
+    def test_batched_pipeline_keeps_good_rows_of_failed_batch(
+        self,
+        mock_read_csv,
+        mock_insert_batch,
+        mock_get_session,
+        mock_create_driver,
+        sample_csv_data,
+        mock_neo4j_session
+    ):
+        """Test that one bad row no longer drops its whole batch."""
+        mock_read_csv.return_value = sample_csv_data
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        
+        def insert_batch(session, rows, stats=None, derived_edges=True):
+            if any(row['email'] == 'jane@example.com' for row in rows):
+                raise Exception("Bad row")
+            return {'nodes_created': len(rows)}
+        
+        mock_insert_batch.side_effect = insert_batch
+        
+        with patch('src.pipeline.etl_to_graph.settings') as mock_settings:
+            mock_settings.CSV_PATH = "data/test.csv"
+            mock_settings.NEO4J_URI = "bolt://localhost:7687"
+            mock_settings.NEO4J_USER = "neo4j"
+            mock_settings.NEO4J_QUANTUM_NETWORK_AURA = "password"
+            
+            with patch('pathlib.Path.exists', return_value=True):
+                stats = run_etl_pipeline(load_mode='batched', batch_size=3)
+        
+        assert stats['rows_processed'] == 2
+        assert stats['rows_with_errors'] == 1
+        assert stats['errors'][0]['row_index'] == 1
+        assert stats['load_counters'] == {'nodes_created': 2}
+    
+    @patch('src.pipeline.etl_to_graph.insert_batch_to_neo4j')
+    def test_batched_load_writes_failed_rows_to_quarantine(
+        self, mock_insert_batch, sample_csv_data, mock_neo4j_session, tmp_path
+    ):
+        """Test that rows isolated by bisection go to the quarantine, not stats['errors']."""
+        def insert_batch(session, rows, stats=None, derived_edges=True):
+            if any(row['email'] == 'jane@example.com' for row in rows):
+                raise Exception("Bad row")
+            return {'nodes_created': len(rows)}
+        
+        mock_insert_batch.side_effect = insert_batch
+        stats = {'rows_processed': 0, 'rows_with_errors': 0, 'errors': []}
+        
+        with QuarantineFile(tmp_path / 'quarantine.jsonl') as quarantine:
+            load_batches_to_neo4j(
+                mock_neo4j_session, normalize_dataframe(sample_csv_data), 3, stats,
+                quarantine=quarantine
+            )
+            assert quarantine.rows_written == 1
+        
+        assert stats['errors'] == [{'row_index': 1, 'error': 'Bad row'}]
+        records = read_quarantine(tmp_path / 'quarantine.jsonl')
+        assert records[0]['row_index'] == 1
+        assert records[0]['row']['email'] == 'jane@example.com'
+
+
 # ============================================================================
 # Tests for Complete ETL Pipeline
 # ============================================================================
 
+class TestStreamCsvChunks:
+    """Test cases for stream_csv_chunks function."""
+    
+    def test_chunks_cover_file_in_order(self, tmp_path, sample_csv_data):
+        """Test that chunks have at most chunk_rows rows and keep CSV row labels."""
+        csv_file = tmp_path / "stream.csv"
+        sample_csv_data.to_csv(csv_file, index=False)
+        
+        chunks = list(stream_csv_chunks(csv_file, chunk_rows=2))
+        
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert list(chunks[1].index) == [2]
+        assert list(pd.concat(chunks)['Correo electrónico']) == list(
+            sample_csv_data['Correo electrónico']
+        )
+    
+    def test_memory_ceiling_shrinks_chunks(self, tmp_path, sample_csv_data):
+        """Test that a tiny memory ceiling reduces later chunks to one row."""
+        csv_file = tmp_path / "stream.csv"
+        sample_csv_data.to_csv(csv_file, index=False)
+        
+        chunks = list(stream_csv_chunks(csv_file, chunk_rows=2, max_chunk_memory_mb=0.0001))
+        
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert len(list(stream_csv_chunks(csv_file, chunk_rows=1))) == 3
+    
+    def test_memory_ceiling_probes_first_chunk(self, tmp_path):
+        """Test that the first chunk is a small probe, not chunk_rows rows."""
+        csv_file = tmp_path / "wide.csv"
+        pd.DataFrame({'text': ['x' * 2000] * 500}).to_csv(csv_file, index=False)
+        
+        chunks = list(stream_csv_chunks(csv_file, chunk_rows=1000, max_chunk_memory_mb=0.1))
+        
+        assert len(chunks[0]) == STREAM_PROBE_ROWS
+        assert all(0 < len(chunk) < STREAM_PROBE_ROWS for chunk in chunks[1:])
+        assert sum(len(chunk) for chunk in chunks) == 500
+    
+    @pytest.mark.parametrize('max_chunk_memory_mb', [0, -1.5])
+    def test_invalid_memory_ceiling(self, tmp_path, sample_csv_data, max_chunk_memory_mb):
+        """Test that the memory ceiling must be positive."""
+        csv_file = tmp_path / "stream.csv"
+        sample_csv_data.to_csv(csv_file, index=False)
+        
+        with pytest.raises(ValueError, match="max_chunk_memory_mb"):
+            next(stream_csv_chunks(csv_file, chunk_rows=2, max_chunk_memory_mb=max_chunk_memory_mb))
+        with pytest.raises(ValueError, match="max_chunk_memory_mb"):
+            run_etl_pipeline(
+                csv_path=str(csv_file), stream_chunk_rows=2, max_chunk_memory_mb=max_chunk_memory_mb
+            )
+    
+    def test_invalid_chunk_rows(self, tmp_path, sample_csv_data):
+        """Test that chunk_rows must be positive."""
+        csv_file = tmp_path / "stream.csv"
+        sample_csv_data.to_csv(csv_file, index=False)
+        
+        with pytest.raises(ValueError):
+            next(stream_csv_chunks(csv_file, chunk_rows=0))
+
+
 class TestRunETLPipeline:
     """Test cases for run_etl_pipeline function."""
     
@@ -490,6 +1164,8 @@ class TestRunETLPipeline:
         
         assert stats['rows_processed'] == 3
         assert stats['rows_with_errors'] == 0
+        assert stats['load_counters'] == {'nodes_created': 3, 'relationships_created': 6}
+        assert stats['duration_seconds'] >= 0
     
     def test_run_pipeline_missing_credentials(self):
         """Test pipeline with missing credentials."""
@@ -554,3 +1230,865 @@ class TestRunETLPipeline:
         assert stats['rows_with_errors'] == 1
         assert len(stats['errors']) == 1
 
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.insert_batch_to_neo4j')
+    @patch('pandas.read_csv')
+    def test_run_pipeline_batched_mode(
+        self,
+        mock_read_csv,
+        mock_insert_batch,
+        mock_get_session,
+        mock_create_driver,
+        sample_csv_data,
+        mock_neo4j_session
+    ):
+        """Test that batched mode honors batch_size and aggregates counters."""
+        mock_read_csv.return_value = sample_csv_data
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        
+        # First batch succeeds, second batch fails
+        mock_insert_batch.side_effect = [
+            {'nodes_created': 4, 'relationships_created': 6},
+            Exception("Batch error"),
+        ]
+        
+        with patch('src.pipeline.etl_to_graph.settings') as mock_settings:
+            mock_settings.CSV_PATH = "data/test.csv"
+            mock_settings.NEO4J_URI = "bolt://localhost:7687"
+            mock_settings.NEO4J_USER = "neo4j"
+            mock_settings.NEO4J_QUANTUM_NETWORK_AURA = "password"
+            
+            with patch('pathlib.Path.exists', return_value=True):
+                stats = run_etl_pipeline(load_mode='batched', batch_size=2)
+        
+        assert mock_insert_batch.call_count == 2
+        first_batch = mock_insert_batch.call_args_list[0].args[1]
+        assert [row['email'] for row in first_batch] == ['john@example.com', 'jane@example.com']
+        
+        assert stats['rows_processed'] == 2
+        assert stats['rows_with_errors'] == 1
+        assert stats['batches_processed'] == 1
+        assert stats['load_counters'] == {'nodes_created': 4, 'relationships_created': 6}
+        assert stats['errors'][0]['row_index'] == 2
+    
+    def test_run_pipeline_invalid_load_mode(self):
+        """Test that an unknown load mode is rejected before any work is done."""
+        with patch('src.pipeline.etl_to_graph.settings') as mock_settings:
+            mock_settings.NEO4J_URI = "bolt://localhost:7687"
+            mock_settings.NEO4J_USER = "neo4j"
+            mock_settings.NEO4J_QUANTUM_NETWORK_AURA = "password"
+            
+            with pytest.raises(ValueError, match="Unknown load_mode"):
+                run_etl_pipeline(load_mode='bulk')
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_incremental_skips_unchanged_csv(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        sample_normalized_data,
+        mock_neo4j_session
+    ):
+        """Test that a rerun on an unchanged CSV skips transform and load."""
+        mock_transform.return_value = sample_normalized_data.iloc[:1]
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        manifest_path = temp_csv_file.parent / "manifest.json"
+        
+        first = run_etl_pipeline(
+            csv_path=str(temp_csv_file), incremental=True, manifest_path=str(manifest_path)
+        )
+        second = run_etl_pipeline(
+            csv_path=str(temp_csv_file), incremental=True, manifest_path=str(manifest_path)
+        )
+        
+        assert first['incremental']['rows_changed'] == 1
+        assert first['incremental']['manifest_updated'] is True
+        assert second['incremental']['rows_changed'] == 0
+        assert second['incremental']['rows_unchanged'] == 1
+        assert mock_transform.call_count == 1
+        assert mock_create_driver.call_count == 1
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_relative_manifest_path(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        sample_normalized_data,
+        mock_neo4j_session,
+        monkeypatch
+    ):
+        """Test that a relative manifest_path is resolved from the project root, like csv_path."""
+        mock_transform.return_value = sample_normalized_data.iloc[:1]
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        project_root = Path(etl_to_graph.__file__).parent.parent.parent
+        manifest_path = temp_csv_file.parent / "manifest.json"
+        # Run from another directory: the path must not depend on the working directory
+        monkeypatch.chdir(temp_csv_file.parent)
+        
+        stats = run_etl_pipeline(
+            csv_path=str(temp_csv_file), incremental=True,
+            manifest_path=os.path.relpath(manifest_path, project_root)
+        )
+        
+        assert Path(stats['incremental']['manifest_path']).resolve() == manifest_path.resolve()
+        assert manifest_path.exists()
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.insert_batch_to_neo4j')
+    def test_run_pipeline_streaming_mode(
+        self,
+        mock_insert_batch,
+        mock_get_session,
+        mock_create_driver,
+        tmp_path,
+        sample_csv_data,
+        mock_neo4j_session
+    ):
+        """Test that streaming mode loads every chunk and interleaves transform and load."""
+        csv_file = tmp_path / "stream.csv"
+        sample_csv_data.to_csv(csv_file, index=False)
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_insert_batch.return_value = {'nodes_created': 1}
+        
+        events = []
+        real_transform = transform_dataframe
+        
+        def transform(chunk, *args):
+            events.append(('transform', len(chunk)))
+            return real_transform(chunk, *args)
+        
+        def insert(session, rows, stats=None, derived_edges=True):
+            events.append(('load', len(rows)))
+            return {'nodes_created': len(rows)}
+        
+        mock_insert_batch.side_effect = insert
+        
+        with patch('src.pipeline.etl_to_graph.transform_dataframe', side_effect=transform):
+            stats = run_etl_pipeline(
+                csv_path=str(csv_file), load_mode='batched', batch_size=10,
+                apply_schema=False, stream_chunk_rows=2
+            )
+        
+        # The first chunk is written before the second one is transformed
+        assert events == [('transform', 2), ('load', 2), ('transform', 1), ('load', 1)]
+        assert stats['chunks_processed'] == 2
+        assert stats['rows_processed'] == 3
+        assert stats['load_counters'] == {'nodes_created': 3}
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.insert_batch_to_neo4j')
+    @patch('src.pipeline.etl_to_graph.infer_problem_category')
+    def test_run_pipeline_pipelined_mode(
+        self,
+        mock_infer,
+        mock_insert_batch,
+        mock_get_session,
+        mock_create_driver,
+        tmp_path,
+        sample_csv_data,
+        mock_neo4j_session
+    ):
+        """Test that pipelined mode loads every chunk and reports stage statistics."""
+        csv_file = tmp_path / "pipelined.csv"
+        sample_csv_data.to_csv(csv_file, index=False)
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_infer.return_value = {'problem_category': 'Optimización', 'confidence': 0.9}
+        mock_insert_batch.side_effect = lambda session, rows, stats=None, derived_edges=True: {
+            'nodes_created': len(rows)
+        }
+        
+        stats = run_etl_pipeline(
+            csv_path=str(csv_file), load_mode='batched', apply_schema=False,
+            stream_chunk_rows=2, pipelined=True, queue_size=1
+        )
+        
+        assert stats['rows_processed'] == 3
+        assert stats['chunks_processed'] == 2
+        assert stats['load_counters'] == {'nodes_created': 3}
+        assert list(stats['pipeline_stages']) == ['extract', 'transform', 'inference', 'load']
+        assert stats['pipeline_stages']['inference']['items'] == 2
+        loaded_rows = [
+            row for call in mock_insert_batch.call_args_list for row in call.args[1]
+        ]
+        assert all(row['problems'] == ['Optimización'] for row in loaded_rows)
+    
+    def test_run_pipeline_streaming_rejects_incremental(self, temp_csv_file):
+        """Test that streaming and incremental modes cannot be combined."""
+        with pytest.raises(ValueError, match="incremental"):
+            run_etl_pipeline(
+                csv_path=str(temp_csv_file), incremental=True, stream_chunk_rows=10
+            )
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_writes_report(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        sample_normalized_data,
+        mock_neo4j_session
+    ):
+        """Test that the run report holds the configuration and load metrics."""
+        mock_transform.return_value = sample_normalized_data
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        report_path = temp_csv_file.parent / "run_report.json"
+        
+        stats = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', batch_size=2,
+            apply_schema=False, report_path=str(report_path)
+        )
+        
+        assert stats['load_metrics']['writes'] == 2
+        assert stats['load_metrics']['rows_written'] == 3
+        assert stats['load_metrics']['server_ms']['mean_result_available_after'] == 3
+        # Throughput over the wall-clock load time
+        load_seconds = stats['load_metrics']['load_seconds']
+        assert 0 < load_seconds <= stats['duration_seconds']
+        assert stats['load_metrics']['rows_per_second'] == 3 / load_seconds
+        report = json.loads(report_path.read_text(encoding='utf-8'))
+        assert report['config']['load_mode'] == 'batched'
+        assert report['config']['batch_size'] == 2
+        assert report['stats']['load_metrics'] == stats['load_metrics']
+        assert report['stats']['load_counters'] == {
+            'nodes_created': 2, 'nodes_deleted': 0,
+            'relationships_created': 4, 'relationships_deleted': 0,
+        }
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.insert_batch_to_neo4j')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_record_and_replay(
+        self,
+        mock_transform,
+        mock_insert_batch,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        sample_normalized_data,
+        mock_neo4j_session
+    ):
+        """Test that a replay writes the recorded rows without transforming again."""
+        mock_transform.return_value = sample_normalized_data
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_insert_batch.return_value = {'nodes_created': 1}
+        record_path = temp_csv_file.parent / "load_params.jsonl.gz"
+        
+        recorded = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', batch_size=10,
+            apply_schema=False, record_path=str(record_path)
+        )
+        original_rows = mock_insert_batch.call_args_list[0].args[1]
+        mock_insert_batch.reset_mock()
+        
+        replayed = run_etl_pipeline(
+            replay_path=str(record_path), batch_size=2, apply_schema=False
+        )
+        
+        assert recorded['rows_recorded'] == 3
+        assert mock_transform.call_count == 1
+        assert mock_insert_batch.call_count == 2
+        replayed_rows = [
+            row for call in mock_insert_batch.call_args_list for row in call.args[1]
+        ]
+        assert replayed_rows == original_rows
+        assert replayed['rows_processed'] == 3
+    
+    def test_run_pipeline_replay_rejects_incremental(self):
+        """Test that a replay cannot be combined with incremental mode."""
+        with pytest.raises(ValueError, match="replay_path"):
+            run_etl_pipeline(replay_path="data/load_params.jsonl.gz", incremental=True)
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.insert_batch_to_neo4j')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_staging_cache(
+        self,
+        mock_transform,
+        mock_insert_batch,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        sample_normalized_data,
+        mock_neo4j_session
+    ):
+        """Test that a second run on the same CSV reuses the cached transform."""
+        mock_transform.return_value = sample_normalized_data.iloc[:1]
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_insert_batch.return_value = {'nodes_created': 1}
+        cache_dir = temp_csv_file.parent / "staging"
+        
+        first = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', apply_schema=False,
+            staging_cache_dir=str(cache_dir)
+        )
+        second = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', apply_schema=False,
+            staging_cache_dir=str(cache_dir)
+        )
+        
+        assert first['staging_cache']['hit'] is False
+        assert second['staging_cache']['hit'] is True
+        assert mock_transform.call_count == 1
+        first_rows, second_rows = (call.args[1] for call in mock_insert_batch.call_args_list)
+        assert second_rows == first_rows
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.async_loader.AsyncLoader')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_async_mode(
+        self,
+        mock_transform,
+        mock_async_loader,
+        mock_get_session,
+        mock_create_driver,
+        tmp_path,
+        sample_csv_data,
+        sample_normalized_data,
+        mock_neo4j_session
+    ):
+        """Test that the async mode opens one loader per run with the credentials."""
+        csv_file = tmp_path / "stream.csv"
+        sample_csv_data.to_csv(csv_file, index=False)
+        mock_transform.return_value = sample_normalized_data
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        loader = mock_async_loader.return_value.__enter__.return_value
+        
+        run_etl_pipeline(
+            csv_path=str(csv_file), neo4j_uri="bolt://db:7687", neo4j_user="neo4j",
+            neo4j_password="secret", load_mode='async', batch_size=50, workers=8,
+            apply_schema=False, stream_chunk_rows=2
+        )
+        
+        # One driver and event loop for both chunks
+        mock_async_loader.assert_called_once_with("bolt://db:7687", "neo4j", "secret")
+        mock_async_loader.return_value.__exit__.assert_called_once()
+        assert loader.load.call_count == 2
+        args = loader.load.call_args.args
+        assert args[0] is sample_normalized_data
+        assert args[1:3] == (50, 8)
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_preaggregated_derived_edges(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        phased_transformed_data,
+        mock_neo4j_session
+    ):
+        """Test that derived edges are written once per pair after the person batches."""
+        mock_transform.return_value = phased_transformed_data
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        
+        stats = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', batch_size=10,
+            apply_schema=False, preaggregate_derived_edges=True
+        )
+        
+        queries = [call.args[0] for call in mock_neo4j_session.run.call_args_list]
+        assert "CAN_BE_SOLVED_BY" not in queries[0]
+        assert queries[1:] == [PHASE_QUERIES[phase] for phase in DERIVED_EDGE_PHASES]
+        assert stats['phases']['organization_has_problem']['rows'] == 2
+    
+    @pytest.mark.parametrize('load_mode', ['phased', 'batched'])
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_streamed_derived_edge_support(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        load_mode,
+        sample_csv_data,
+        phased_transformed_data,
+        tmp_path
+    ):
+        """Test that derived edge support counts the persons of every streamed chunk."""
+        csv_file = tmp_path / "stream.csv"
+        sample_csv_data.iloc[:2].to_csv(csv_file, index=False)
+        session = make_graph_session()
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = session
+        mock_get_session.return_value.__exit__.return_value = None
+        # John and Jane share an organization, a problem and an interest
+        mock_transform.side_effect = [
+            phased_transformed_data.iloc[[0]], phased_transformed_data.iloc[[1]]
+        ]
+        
+        run_etl_pipeline(
+            csv_path=str(csv_file), load_mode=load_mode, batch_size=10, apply_schema=False,
+            stream_chunk_rows=1, preaggregate_derived_edges=True
+        )
+        
+        assert session.support[
+            ('organization_has_problem', 'Tech Corp', 'Falta de networking')
+        ] == 2
+        assert session.support[
+            ('can_be_solved_by', 'Investigación académica', 'Falta de networking')
+        ] == 2
+        assert session.support[
+            ('can_be_solved_by', 'Investigación académica', 'Falta de actualización')
+        ] == 1
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_with_transform_workers(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        phased_transformed_data,
+        mock_neo4j_session
+    ):
+        """Test that transform_workers > 1 transforms through the process pool."""
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        
+        with patch(
+            'src.pipeline.parallel_transform.ParallelTransformer.transform',
+            return_value=phased_transformed_data
+        ) as mock_parallel:
+            stats = run_etl_pipeline(
+                csv_path=str(temp_csv_file), load_mode='batched', batch_size=10,
+                apply_schema=False, transform_workers=2
+            )
+        
+        mock_parallel.assert_called_once()
+        mock_transform.assert_not_called()
+        assert stats['rows_processed'] == len(phased_transformed_data)
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    @pytest.mark.parametrize('load_mode,deduplicate', [
+        ('batched', False), ('phased', False), ('phased', True),
+    ])
+    def test_run_pipeline_with_compact_columns(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        phased_transformed_data,
+        mock_neo4j_session,
+        load_mode,
+        deduplicate
+    ):
+        """Test that compact columns send the same rows to Neo4j."""
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        # A repeated registration, merged by deduplicate_registrants
+        repeated = pd.concat([phased_transformed_data, phased_transformed_data.iloc[[0]].assign(
+            interests_list=[['Optimización', 'Finanzas']]
+        )], ignore_index=True)
+        
+        mock_transform.return_value = repeated.copy()
+        plain = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode=load_mode, batch_size=10, apply_schema=False,
+            deduplicate_registrants=deduplicate
+        )
+        plain_calls = mock_neo4j_session.run.call_args_list[:]
+        mock_neo4j_session.run.reset_mock()
+        
+        mock_transform.return_value = repeated.copy()
+        compact = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode=load_mode, batch_size=10,
+            apply_schema=False, compact_columns=True, deduplicate_registrants=deduplicate
+        )
+        
+        assert mock_neo4j_session.run.call_args_list == plain_calls
+        assert compact['rows_processed'] == plain['rows_processed']
+        if deduplicate:
+            assert compact['registrant_consolidation'] == plain['registrant_consolidation']
+            assert compact['registrant_consolidation']['persons_consolidated'] == 1
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_with_resolve_organizations(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        phased_transformed_data,
+        mock_neo4j_session,
+        tmp_path
+    ):
+        """Test that organization variants are loaded under one name and the alias table is written."""
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_transform.return_value = phased_transformed_data.assign(
+            organization=['Tech Corp', 'TECH CORP.', None, 'Other Org']
+        )
+        aliases_file = tmp_path / 'organization_aliases.csv'
+        
+        stats = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', batch_size=10, apply_schema=False,
+            resolve_organizations=True, organization_aliases_path=str(aliases_file)
+        )
+        
+        rows = mock_neo4j_session.run.call_args.kwargs['rows']
+        assert [row['organization'] for row in rows] == ['Tech Corp', 'Tech Corp', None, 'Other Org']
+        assert stats['organization_resolution']['names_merged'] == 1
+        assert read_alias_table(aliases_file) == {
+            'Tech Corp': 'Tech Corp', 'TECH CORP.': 'Tech Corp', 'Other Org': 'Other Org'
+        }
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_writes_default_alias_table(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        phased_transformed_data,
+        mock_neo4j_session
+    ):
+        """Test that the merges are written for review without organization_aliases_path."""
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_transform.return_value = phased_transformed_data.assign(
+            organization=['Tech Corp', 'TECH CORP.', None, 'Other Org']
+        )
+        
+        stats = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', batch_size=10, apply_schema=False,
+            resolve_organizations=True
+        )
+        
+        aliases_file = default_alias_table_path(temp_csv_file)
+        assert stats['organization_resolution']['aliases_path'] == str(aliases_file)
+        assert read_alias_table(aliases_file)['TECH CORP.'] == 'Tech Corp'
+    
+    def test_run_pipeline_aliases_path_requires_resolution(self, temp_csv_file):
+        """Test that organization_aliases_path needs resolve_organizations."""
+        with pytest.raises(ValueError, match="resolve_organizations"):
+            run_etl_pipeline(csv_path=str(temp_csv_file), organization_aliases_path='aliases.csv')
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_with_deduplicate_registrants(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        phased_transformed_data,
+        mock_neo4j_session
+    ):
+        """Test that repeated registrations are written once."""
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_transform.return_value = phased_transformed_data.assign(
+            email=['john@example.com', 'JOHN@example.com', 'bob@example.com', None]
+        )
+        
+        stats = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', batch_size=10, apply_schema=False,
+            deduplicate_registrants=True
+        )
+        
+        rows = mock_neo4j_session.run.call_args.kwargs['rows']
+        # The first registration's email is the MERGE key; other fields are the latest
+        assert [row['email'] for row in rows] == ['john@example.com', 'bob@example.com', None]
+        assert rows[0]['name'] == 'Jane Smith'
+        assert stats['registrant_consolidation']['writes_eliminated'] == 1
+        assert stats['registrant_consolidation']['rows_out'] == 3
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_with_quarantine(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        phased_transformed_data,
+        mock_neo4j_session,
+        tmp_path
+    ):
+        """Test that invalid rows are quarantined instead of loaded."""
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_transform.return_value = phased_transformed_data.assign(
+            email=['john@example.com', 'jane@example', 'bob@example.com', None]
+        )
+        quarantine_path = tmp_path / 'quarantine.jsonl'
+        
+        stats = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', batch_size=10, apply_schema=False,
+            quarantine_path=str(quarantine_path)
+        )
+        
+        rows = mock_neo4j_session.run.call_args.kwargs['rows']
+        assert [row['email'] for row in rows] == ['john@example.com', 'bob@example.com']
+        assert stats['validation'] == {
+            'rows_checked': 4,
+            'rows_quarantined': 2,
+            'quarantine_path': str(quarantine_path),
+            'reasons': {'invalid_email': 1, 'missing_email': 1},
+        }
+        records = read_quarantine(quarantine_path)
+        assert [(record['row_index'], record['reasons']) for record in records] == [
+            (1, ['invalid_email']), (3, ['missing_email'])
+        ]
+        assert records[0]['row']['name'] == 'Jane Smith'
+        assert records[0]['row']['interests_list'] == ['Investigación académica']
+        assert stats['errors'] == []
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    @pytest.mark.filterwarnings('error::pandas.errors.SettingWithCopyWarning')
+    def test_run_pipeline_quarantine_with_resolve_organizations(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        phased_transformed_data,
+        mock_neo4j_session,
+        tmp_path
+    ):
+        """Test that the rows kept by validation can be modified by the later steps."""
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_transform.return_value = phased_transformed_data.assign(
+            email=['john@example.com', 'jane@example', 'bob@example.com', None]
+        )
+        
+        stats = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', batch_size=10, apply_schema=False,
+            quarantine_path=str(tmp_path / 'quarantine.jsonl'), resolve_organizations=True
+        )
+        
+        rows = mock_neo4j_session.run.call_args.kwargs['rows']
+        assert [row['email'] for row in rows] == ['john@example.com', 'bob@example.com']
+        assert stats['validation']['rows_quarantined'] == 2
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    @patch('src.pipeline.etl_to_graph.insert_row_to_neo4j')
+    def test_run_pipeline_quarantines_load_errors(
+        self,
+        mock_insert,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        phased_transformed_data,
+        mock_neo4j_session,
+        tmp_path
+    ):
+        """Test that rows rejected by Neo4j go to the quarantine, not stats['errors']."""
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_transform.return_value = phased_transformed_data.iloc[:3]
+        mock_insert.side_effect = [{}, Exception("Test error"), {}]
+        quarantine_path = tmp_path / 'quarantine.jsonl'
+        
+        stats = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='row', apply_schema=False,
+            quarantine_path=str(quarantine_path)
+        )
+        
+        assert stats['rows_with_errors'] == 1
+        assert stats['errors'] == [{'row_index': 1, 'error': 'Test error'}]
+        records = read_quarantine(quarantine_path)
+        assert len(records) == 1
+        assert records[0]['reasons'] == ['load_error']
+        assert records[0]['error'] == 'Test error'
+        assert records[0]['row']['email'] == 'jane@example.com'
+        assert stats['validation']['reasons'] == {'load_error': 1}
+    
+    def test_run_pipeline_replay_with_quarantine(self, temp_csv_file, tmp_path):
+        """Test that replay cannot be combined with quarantine_path."""
+        with pytest.raises(ValueError, match="quarantine_path"):
+            run_etl_pipeline(
+                csv_path=str(temp_csv_file), replay_path=str(tmp_path / 'rec'),
+                quarantine_path=str(tmp_path / 'quarantine.jsonl')
+            )
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_with_arrow_csv_reader(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        mock_neo4j_session
+    ):
+        """Test that the Arrow reader skips unused columns and loads the same rows."""
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_transform.side_effect = lambda df, *args: normalize_dataframe(df).assign(problems_list=[[]] * len(df))
+        pd.read_csv(temp_csv_file).assign(**{'Column 12': ['x']}).to_csv(temp_csv_file, index=False)
+        
+        run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', batch_size=10, apply_schema=False
+        )
+        plain_calls = mock_neo4j_session.run.call_args_list[:]
+        mock_neo4j_session.run.reset_mock()
+        
+        stats = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', batch_size=10, apply_schema=False,
+            csv_reader='arrow'
+        )
+        
+        raw = mock_transform.call_args.args[0]
+        assert 'Column 12' not in raw.columns
+        assert (raw.dtypes == pd.StringDtype('pyarrow')).all()
+        assert mock_neo4j_session.run.call_args_list == plain_calls
+        assert stats['rows_processed'] == 1
+    
+    def test_run_pipeline_invalid_csv_reader(self, temp_csv_file):
+        """Test that csv_reader must be one of CSV_READERS."""
+        with pytest.raises(ValueError, match="Invalid CSV reader"):
+            run_etl_pipeline(csv_path=str(temp_csv_file), csv_reader='polars')
+    
+    def test_run_pipeline_arrow_csv_reader_with_streaming(self, temp_csv_file):
+        """Test that the Arrow reader cannot be combined with streaming."""
+        with pytest.raises(ValueError, match="csv_reader='arrow'"):
+            run_etl_pipeline(csv_path=str(temp_csv_file), csv_reader='arrow', pipelined=True)
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.insert_batch_to_neo4j')
+    @patch('src.pipeline.etl_to_graph.infer_problem_category')
+    def test_run_pipeline_python_engine_shares_linkedin_normalizer(
+        self,
+        mock_infer,
+        mock_insert_batch,
+        mock_get_session,
+        mock_create_driver,
+        tmp_path,
+        sample_csv_data,
+        mock_neo4j_session
+    ):
+        """Test that one LinkedInNormalizer serves every chunk and reports its stats."""
+        csv_file = tmp_path / "stream.csv"
+        sample_csv_data.assign(LinkedIn='linkedin.com/in/same').to_csv(csv_file, index=False)
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        mock_insert_batch.return_value = {'nodes_created': 1}
+        mock_infer.return_value = {'problems': []}
+        
+        stats = run_etl_pipeline(
+            csv_path=str(csv_file), load_mode='batched', batch_size=10,
+            apply_schema=False, stream_chunk_rows=1, transform_engine='python'
+        )
+        
+        rows = [row for call in mock_insert_batch.call_args_list for row in call.args[1]]
+        assert [row['linkedin_url'] for row in rows] == ['https://www.linkedin.com/in/same'] * 3
+        # Parsed by the first chunk, memo hits for the next two
+        assert stats['linkedin_normalizer']['calls'] == 3
+        assert stats['linkedin_normalizer']['memo_misses'] == 1
+        assert stats['linkedin_normalizer']['memo_hits'] == 2
+    
+    def test_run_pipeline_invalid_transform_engine(self, temp_csv_file):
+        """Test that transform_engine must be one of TRANSFORM_ENGINES."""
+        with pytest.raises(ValueError, match="Invalid transform engine"):
+            run_etl_pipeline(csv_path=str(temp_csv_file), transform_engine='numba')
+    
+    def test_run_pipeline_invalid_transform_workers(self, temp_csv_file):
+        """Test that transform_workers must be positive."""
+        with pytest.raises(ValueError, match="transform_workers"):
+            run_etl_pipeline(csv_path=str(temp_csv_file), transform_workers=0)
+    
+    @patch('src.pipeline.etl_to_graph.create_driver')
+    @patch('src.pipeline.etl_to_graph.get_session')
+    @patch('src.pipeline.etl_to_graph.transform_dataframe')
+    def test_run_pipeline_maintains_graph_statistics(
+        self,
+        mock_transform,
+        mock_get_session,
+        mock_create_driver,
+        temp_csv_file,
+        phased_transformed_data,
+        mock_neo4j_session
+    ):
+        """Test that the touched Domain and Problem nodes are refreshed after the load."""
+        from src.pipeline.graph_statistics import DOMAIN_STATISTICS_QUERY
+        
+        mock_transform.return_value = phased_transformed_data
+        mock_create_driver.return_value = MagicMock()
+        mock_get_session.return_value.__enter__.return_value = mock_neo4j_session
+        mock_get_session.return_value.__exit__.return_value = None
+        
+        stats = run_etl_pipeline(
+            csv_path=str(temp_csv_file), load_mode='batched', batch_size=10,
+            apply_schema=False, maintain_graph_statistics=True
+        )
+        
+        domain_calls = [
+            call.kwargs['names'] for call in mock_neo4j_session.run.call_args_list
+            if call.args[0] == DOMAIN_STATISTICS_QUERY
+        ]
+        assert domain_calls == [[
+            'Casos de uso en Finanzas', 'Desarrollo de software', 'Investigación académica'
+        ]]
+        assert stats['graph_statistics'] == {
+            'refreshes': 1, 'domains': 3, 'problems': 3, 'errors': 0
+        }
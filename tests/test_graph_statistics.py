@@ -0,0 +1,100 @@
+"""
+Unit tests for load-time graph statistics.
+"""
+
+import pytest
+
+from src.pipeline.graph_statistics import (
+    DOMAIN_STATISTICS_QUERY,
+    ORGANIZATION_PROBLEM_STATISTICS_QUERY,
+    PROBLEM_STATISTICS_QUERY,
+    collect_touched_keys,
+    new_touched_keys,
+    refresh_graph_statistics,
+    track_touched_keys,
+)
+
+
+def new_stats():
+    return {'rows_processed': 0, 'rows_with_errors': 0, 'errors': []}
+
+
+class TestTouchedKeys:
+    """Test cases for touched key collection."""
+
+    def test_collect_touched_keys(self):
+        """Test that names are trimmed, deduplicated and empty values skipped."""
+        touched = new_touched_keys()
+
+        collect_touched_keys([
+            {'interests': [' Hardware cuántico', 'Finanzas', ''], 'problems': ['Falta de networking']},
+            {'interests': ['Finanzas'], 'problems': [None, ' Falta de networking ', '  ']},
+            {'interests': None, 'problems': []},
+        ], touched)
+
+        assert touched == {
+            'domains': {'Hardware cuántico', 'Finanzas'},
+            'problems': {'Falta de networking'},
+        }
+
+    def test_track_touched_keys_passes_records_through(self):
+        """Test that tracking yields the records unchanged while collecting keys."""
+        records = [(0, {'interests': ['Finanzas'], 'problems': []}),
+                   (1, {'interests': [], 'problems': ['Falta de talento']})]
+        touched = new_touched_keys()
+
+        assert list(track_touched_keys(iter(records), touched)) == records
+        assert touched == {'domains': {'Finanzas'}, 'problems': {'Falta de talento'}}
+
+
+class TestRefreshGraphStatistics:
+    """Test cases for refresh_graph_statistics function."""
+
+    def test_refresh_runs_queries_in_batches(self, mock_neo4j_session):
+        """Test that touched names are refreshed in sorted batches."""
+        touched = {'domains': {'c', 'a', 'b'}, 'problems': {'p'}}
+        stats = new_stats()
+
+        refresh_graph_statistics(mock_neo4j_session, touched, 2, stats)
+
+        calls = [(call.args[0], call.kwargs['names'])
+                 for call in mock_neo4j_session.run.call_args_list]
+        assert calls == [
+            (DOMAIN_STATISTICS_QUERY, ['a', 'b']),
+            (DOMAIN_STATISTICS_QUERY, ['c']),
+            (PROBLEM_STATISTICS_QUERY, ['p']),
+            (ORGANIZATION_PROBLEM_STATISTICS_QUERY, ['p']),
+        ]
+        assert stats['graph_statistics'] == {
+            'refreshes': 1, 'domains': 3, 'problems': 1, 'errors': 0
+        }
+        # Statistics writes are not load rows
+        assert 'load_metrics' not in stats
+
+    def test_refresh_error_does_not_fail_load(self, mock_neo4j_session):
+        """Test that a failed refresh write is counted and the rest still runs."""
+        summary = mock_neo4j_session.run.return_value
+
+        def run(query, **params):
+            if query == DOMAIN_STATISTICS_QUERY:
+                raise Exception("Refresh error")
+            return summary
+
+        mock_neo4j_session.run.side_effect = run
+        stats = new_stats()
+
+        refresh_graph_statistics(
+            mock_neo4j_session, {'domains': {'a'}, 'problems': {'p'}}, 10, stats
+        )
+
+        assert stats['graph_statistics']['errors'] == 1
+        assert stats['graph_statistics']['problems'] == 1
+        assert stats['rows_with_errors'] == 0
+
+    @pytest.mark.parametrize('query', [
+        DOMAIN_STATISTICS_QUERY, PROBLEM_STATISTICS_QUERY, ORGANIZATION_PROBLEM_STATISTICS_QUERY
+    ])
+    def test_queries_match_touched_names(self, query):
+        """Test that every query is scoped to the $names parameter."""
+        assert "UNWIND $names AS name" in query
+        assert "{name: name}" in query
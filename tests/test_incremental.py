@@ -0,0 +1,107 @@
+"""
+Unit tests for incremental (delta) loading support.
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from src.pipeline.incremental import (
+    MANIFEST_VERSION,
+    compute_row_fingerprints,
+    load_manifest,
+    save_manifest,
+    select_changed_rows,
+)
+
+
+@pytest.fixture
+def registrations():
+    """Normalized registrations, including a repeated registrant."""
+    return pd.DataFrame({
+        'name': ['John Doe', 'Jane Smith', 'John Doe'],
+        'email': ['john@example.com', 'Jane@Example.com ', 'john@example.com'],
+        'organization': ['Tech Corp', None, 'Tech Corp'],
+        'timestamp': ['2024-01-01', '2024-01-02', '2024-01-03'],
+    })
+
+
+class TestFingerprints:
+    """Test cases for row fingerprints."""
+
+    def test_fingerprint_ignores_cosmetic_differences(self):
+        """Test that whitespace and missing-value spelling do not change fingerprints."""
+        df = pd.DataFrame({
+            'name': ['John Doe', '  John Doe '],
+            'organization': [None, float('nan')],
+            'timestamp': ['2024-01-01', '2024-02-01'],
+        })
+
+        fingerprints = compute_row_fingerprints(df)
+
+        assert fingerprints.iloc[0] == fingerprints.iloc[1]
+
+    def test_fingerprint_detects_content_change(self):
+        """Test that any content change produces a different fingerprint."""
+        df = pd.DataFrame({'name': ['John Doe', 'John Doe'], 'role': ['Engineer', 'CTO']})
+
+        fingerprints = compute_row_fingerprints(df)
+
+        assert fingerprints.iloc[0] != fingerprints.iloc[1]
+
+
+class TestSelectChangedRows:
+    """Test cases for select_changed_rows function."""
+
+    def test_all_rows_changed_without_manifest(self, registrations):
+        """Test that every row is loaded on the first run."""
+        delta = select_changed_rows(registrations, {})
+
+        assert delta['changed'].all()
+        assert delta['key'].tolist() == [
+            'john@example.com', 'jane@example.com', 'john@example.com'
+        ]
+
+    def test_unchanged_rows_are_skipped(self, registrations):
+        """Test that a rerun on the same data selects nothing."""
+        first = select_changed_rows(registrations, {})
+        manifest = dict(zip(first['key'], first['fingerprint']))
+
+        assert not select_changed_rows(registrations, manifest)['changed'].any()
+
+    def test_change_reloads_whole_registrant_group(self, registrations):
+        """Test that a change in one registration reloads all rows of that person."""
+        first = select_changed_rows(registrations, {})
+        manifest = dict(zip(first['key'], first['fingerprint']))
+
+        modified = registrations.copy()
+        modified.loc[2, 'organization'] = 'Quantum Labs'
+        delta = select_changed_rows(modified, manifest)
+
+        assert delta['changed'].tolist() == [True, False, True]
+
+
+class TestManifest:
+    """Test cases for manifest persistence."""
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Test that the manifest is written atomically and read back."""
+        manifest_path = tmp_path / "data.csv.manifest.json"
+
+        save_manifest(manifest_path, {'john@example.com': 'abc'})
+
+        assert load_manifest(manifest_path) == {'john@example.com': 'abc'}
+        assert json.loads(manifest_path.read_text())['version'] == MANIFEST_VERSION
+        assert list(tmp_path.iterdir()) == [manifest_path]  # No temporary files left
+
+    def test_missing_or_outdated_manifest_is_empty(self, tmp_path):
+        """Test that unusable manifests trigger a full load."""
+        manifest_path = tmp_path / "manifest.json"
+        assert load_manifest(manifest_path) == {}
+
+        manifest_path.write_text(json.dumps({'version': -1, 'rows': {'a': 'b'}}))
+        assert load_manifest(manifest_path) == {}
+
+        manifest_path.write_text("{not json")
+        assert load_manifest(manifest_path) == {}
@@ -0,0 +1,106 @@
+"""
+Unit tests for the compiled keyword classifier.
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipeline.etl_to_graph import PROBLEM_KEYWORDS, infer_problems_from_expectations
+from src.pipeline.keyword_classifier import KeywordClassifier, fold_text
+
+
+CATEGORIES = [
+    ('knowledge', ['información', 'más información']),
+    ('networking', ['networking', 'colaboración']),
+    ('collaboration', ['oportunidades de colaboración']),
+    ('first', ['xy']),
+    ('second', ['yz']),
+]
+
+
+def scan_categories(categories, text):
+    """Reference: one `keyword in text` scan per keyword (folded)."""
+    folded = fold_text(text)
+    return [
+        category for category, keywords in categories
+        if any(fold_text(keyword) in folded for keyword in keywords)
+    ]
+
+
+class TestKeywordClassifier:
+    """Test cases for KeywordClassifier."""
+
+    def test_fold_text(self):
+        assert fold_text('Información CUÁNTICA ñandú') == 'informacion cuantica nandu'
+
+    def test_accent_and_case_insensitive(self):
+        classifier = KeywordClassifier(CATEGORIES)
+        assert classifier.classify('Más INFORMACION') == ['knowledge']
+
+    def test_keywords_inside_longer_keywords(self):
+        """Test that a long keyword also reports the keywords it contains."""
+        classifier = KeywordClassifier(CATEGORIES)
+        assert classifier.classify('Oportunidades de colaboracion') == ['networking', 'collaboration']
+
+    def test_overlapping_keywords(self):
+        """Test that keywords sharing characters are all found."""
+        classifier = KeywordClassifier(CATEGORIES)
+        assert classifier.classify('xyz') == ['first', 'second']
+
+    def test_no_match(self):
+        classifier = KeywordClassifier(CATEGORIES)
+        assert classifier.classify('nada') == []
+        assert classifier.classify('') == []
+        assert KeywordClassifier([]).classify('networking') == []
+
+    @pytest.mark.parametrize('seed', [0, 1])
+    def test_matches_per_keyword_scans(self, seed):
+        """Test random texts built from keyword fragments against the reference scans."""
+        rng = random.Random(seed)
+        fragments = [
+            keyword for _, keywords in PROBLEM_KEYWORDS for keyword in keywords
+        ] + ['Á', 'x', ' ', 'colab', 'oración', 'GAP']
+        classifier = KeywordClassifier(PROBLEM_KEYWORDS)
+
+        for _ in range(300):
+            text = ''.join(rng.choice(fragments) for _ in range(rng.randint(0, 4)))
+            assert classifier.classify(text) == scan_categories(PROBLEM_KEYWORDS, text)
+
+    def test_classify_series(self):
+        classifier = KeywordClassifier(CATEGORIES)
+        series = pd.Series(['networking', None, 'networking', np.nan, 'nada'], index=list('abcde'))
+
+        result = classifier.classify_series(series)
+
+        assert result.index.equals(series.index)
+        assert result.tolist() == [['networking'], [], ['networking'], [], []]
+        # Every row gets its own list
+        assert result['a'] is not result['c']
+
+
+class TestInferProblemsFromExpectations:
+    """Test cases for infer_problems_from_expectations function."""
+
+    def test_categories_in_keyword_order(self):
+        assert infer_problems_from_expectations('Networking y conocer aplicaciones') == [
+            "Falta de conocimiento general",
+            "Falta de networking",
+            "Falta de información sobre aplicaciones",
+        ]
+
+    def test_industry_interest(self):
+        assert infer_problems_from_expectations(None, 'industry_interest') == [
+            "Falta de información sobre aplicaciones industriales"
+        ]
+        assert infer_problems_from_expectations('Networking', 'industry_interest') == [
+            "Falta de networking",
+            "Falta de información sobre aplicaciones industriales",
+        ]
+
+    def test_fallback_to_general_knowledge(self):
+        assert infer_problems_from_expectations('Algo distinto') == ["Falta de conocimiento general"]
+        assert infer_problems_from_expectations('   ') == []
+        assert infer_problems_from_expectations(np.nan) == []
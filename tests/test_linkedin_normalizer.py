@@ -0,0 +1,93 @@
+"""
+Unit tests for the memoized LinkedIn URL normalizer.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipeline.etl_to_graph import normalize_dataframe, normalize_linkedin_url
+from src.pipeline.linkedin_normalizer import LinkedInNormalizer
+from tests.test_vectorized_transform import LINKEDIN_VALUES
+
+
+CANONICAL_VALUES = [
+    'https://www.linkedin.com/in/johndoe', 'https://www.linkedin.com/in/johndoe/',
+    ' https://www.linkedin.com/in/johndoe//', 'https://www.linkedin.com/in/josé',
+    'https://www.linkedin.com/in/jo%20hn', 'https://www.linkedin.com/in/john;doe',
+    'https://www.linkedin.com/in/john?x=1', 'https://www.linkedin.com/in/a/b',
+    'https://www.linkedin.com/in/', 'xhttps://www.linkedin.com/in/johndoe',
+    'https://www.linkedin.com/in/johndoe\nx', 1, 1.0, True,
+]
+
+
+class TestLinkedInNormalizer:
+    """Test cases for LinkedInNormalizer."""
+
+    @pytest.mark.parametrize('value', LINKEDIN_VALUES + CANONICAL_VALUES)
+    def test_matches_normalize_linkedin_url(self, value):
+        assert LinkedInNormalizer().normalize(value) == normalize_linkedin_url(value)
+
+    def test_normalize_series_matches(self):
+        series = pd.Series(LINKEDIN_VALUES + CANONICAL_VALUES, dtype=object, index=np.arange(5, 49))
+        result = LinkedInNormalizer().normalize_series(series)
+
+        assert result.dtype == object
+        assert result.index.equals(series.index)
+        assert result.tolist() == series.apply(normalize_linkedin_url).tolist()
+
+    def test_normalize_series_empty(self):
+        result = LinkedInNormalizer().normalize_series(pd.Series([], dtype=object))
+        assert result.tolist() == []
+
+    def test_typed_memo(self):
+        """Test that equal values of different types are memoized apart."""
+        normalizer = LinkedInNormalizer()
+        assert normalizer.normalize(1) == 'https://www.linkedin.com/in/1'
+        assert normalizer.normalize(1.0) == 'https://www.linkedin.com/in/1.0'
+
+    def test_stats(self):
+        normalizer = LinkedInNormalizer()
+        assert normalizer.stats()['hit_rate'] is None
+
+        normalizer.normalize_series(pd.Series([
+            'https://www.linkedin.com/in/a/', 'linkedin.com/in/b', 'linkedin.com/in/b', 'c'
+        ]))
+        normalizer.normalize('c')
+
+        assert normalizer.stats() == {
+            'calls': 5,
+            'fast_path': 1,
+            'memo_hits': 1,
+            'memo_misses': 2,
+            'memo_size': 2,
+            'hit_rate': 3 / 5,
+        }
+
+    def test_memo_is_bounded(self):
+        normalizer = LinkedInNormalizer(maxsize=2)
+        for handle in ['a', 'b', 'c', 'a']:
+            normalizer.normalize(handle)
+
+        stats = normalizer.stats()
+        assert stats['memo_size'] == 2
+        assert stats['memo_misses'] == 4
+
+    def test_normalize_dataframe_shares_normalizer(self, sample_csv_data):
+        """Test that the python engine normalizes LinkedIn URLs with the given normalizer."""
+        normalizer = LinkedInNormalizer()
+        first = normalize_dataframe(sample_csv_data, engine='python', linkedin_normalizer=normalizer)
+        second = normalize_dataframe(sample_csv_data, engine='python', linkedin_normalizer=normalizer)
+
+        pd.testing.assert_frame_equal(first, second)
+        assert normalizer.stats()['calls'] == 2 * len(sample_csv_data)
+        # The canonical URL takes the fast path, the other two hit the memo the second time
+        assert normalizer.stats()['fast_path'] == 2
+        assert normalizer.stats()['memo_hits'] == 2
+
+    def test_clear(self):
+        normalizer = LinkedInNormalizer()
+        normalizer.normalize('a')
+        normalizer.clear()
+        assert normalizer.stats()['calls'] == 0
+        assert normalizer.stats()['memo_size'] == 0
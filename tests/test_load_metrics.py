@@ -0,0 +1,111 @@
+"""
+Unit tests for load metrics and run reports.
+"""
+
+import json
+
+import numpy as np
+
+from src.pipeline.load_metrics import (
+    REPORT_VERSION,
+    build_run_report,
+    record_load_seconds,
+    record_write,
+    summarize_load_metrics,
+    write_run_report,
+)
+
+
+class TestLoadMetrics:
+    """Test cases for record_write and summarize_load_metrics functions."""
+
+    def test_record_and_summarize(self):
+        """Test that writes are aggregated into throughput and latency figures."""
+        stats = {}
+        record_write(stats, rows=10, seconds=0.1, available_after=4, consumed_after=6)
+        record_write(stats, rows=30, seconds=0.3, available_after=8, consumed_after=10)
+        record_write(stats, rows=5, seconds=1.0, failed=True)
+        record_load_seconds(stats, 0.4)
+
+        summary = summarize_load_metrics(stats['load_metrics'])
+
+        assert summary['writes'] == 2
+        assert summary['failed_writes'] == 1
+        assert summary['rows_written'] == 40
+        assert summary['rows_per_second'] == 100.0
+        assert summary['rows_per_write_second'] == 100.0
+        assert summary['latency_ms']['max'] == 300.0
+        assert summary['latency_ms']['p50'] == 200.0
+        assert summary['server_ms']['result_available_after'] == 12
+        assert summary['server_ms']['mean_result_consumed_after'] == 8
+
+    def test_overlapping_writes(self):
+        """Test that throughput uses the wall-clock load time, not the summed latencies."""
+        stats = {}
+        # Four 1 s writes in flight at once, over 1 s of wall-clock time
+        for _ in range(4):
+            record_write(stats, rows=10, seconds=1.0)
+        record_load_seconds(stats, 1.0)
+
+        summary = summarize_load_metrics(stats['load_metrics'])
+
+        assert summary['write_seconds'] == 4.0
+        assert summary['load_seconds'] == 1.0
+        assert summary['rows_per_second'] == 40.0
+        assert summary['rows_per_write_second'] == 10.0
+
+    def test_without_load_time(self):
+        """Test that rows_per_second is not guessed when no load time was recorded."""
+        stats = {}
+        record_write(stats, rows=10, seconds=0.5)
+
+        summary = summarize_load_metrics(stats['load_metrics'])
+
+        assert summary['rows_per_second'] is None
+        assert summary['rows_per_write_second'] == 20.0
+
+    def test_missing_server_timings(self):
+        """Test that writes without server timings still count for throughput."""
+        stats = {}
+        record_write(stats, rows=1, seconds=0.5)
+
+        summary = summarize_load_metrics(stats['load_metrics'])
+
+        assert summary['rows_written'] == 1
+        assert summary['server_ms']['mean_result_available_after'] is None
+
+    def test_summarize_without_writes(self):
+        """Test the summary of a run that wrote nothing."""
+        summary = summarize_load_metrics({})
+
+        assert summary['writes'] == 0
+        assert summary['rows_per_second'] is None
+        assert summary['latency_ms']['p95'] is None
+
+
+class TestRunReport:
+    """Test cases for build_run_report and write_run_report functions."""
+
+    def test_report_excludes_row_data(self, tmp_path):
+        """Test that the report is valid JSON without personal row data."""
+        stats = {
+            'rows_processed': 2,
+            'rows_with_errors': 1,
+            'errors': [{
+                'row_index': np.int64(3),
+                'error': 'boom',
+                'row_data': {'email': 'john@example.com'},
+            }],
+        }
+        report_path = tmp_path / "reports" / "run.json"
+
+        write_run_report(report_path, build_run_report(stats, {'load_mode': 'batched'}))
+
+        report = json.loads(report_path.read_text(encoding='utf-8'))
+        assert report['report_version'] == REPORT_VERSION
+        assert report['config'] == {'load_mode': 'batched'}
+        assert report['stats']['errors'] == [{'row_index': 3, 'error': 'boom'}]
+        assert 'john@example.com' not in report_path.read_text(encoding='utf-8')
+        assert list(report_path.parent.iterdir()) == [report_path]
+        # The returned stats keep their row data
+        assert 'row_data' in stats['errors'][0]
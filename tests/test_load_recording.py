@@ -0,0 +1,55 @@
+"""
+Unit tests for recording and replaying load parameters.
+"""
+
+import gzip
+import math
+
+import numpy as np
+import pytest
+
+from src.pipeline.load_recording import LoadRecording, read_load_recording
+
+
+class TestLoadRecording:
+    """Test cases for LoadRecording and read_load_recording."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that recorded rows are replayed unchanged and in order."""
+        path = tmp_path / "params.jsonl.gz"
+        rows = [
+            (np.int64(0), {'email': 'john@example.com', 'interests': ['Optimización'],
+                           'role': float('nan')}),
+            (np.int64(1), {'email': 'jane@example.com', 'interests': [], 'role': 'CTO'}),
+        ]
+
+        with LoadRecording(path) as recording:
+            recording.write_rows(rows)
+
+        replayed = list(read_load_recording(path))
+
+        assert recording.rows_written == 2
+        assert [idx for idx, _ in replayed] == [0, 1]
+        assert replayed[0][1]['interests'] == ['Optimización']
+        assert math.isnan(replayed[0][1]['role'])
+        assert replayed[1][1] == rows[1][1]
+
+    def test_failed_run_leaves_no_file(self, tmp_path):
+        """Test that an exception discards the partial recording."""
+        path = tmp_path / "params.jsonl.gz"
+
+        with pytest.raises(RuntimeError):
+            with LoadRecording(path) as recording:
+                recording.write_rows([(0, {'email': 'john@example.com'})])
+                raise RuntimeError("load failed")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_rejects_foreign_file(self, tmp_path):
+        """Test that files without the recording header are rejected."""
+        path = tmp_path / "other.jsonl.gz"
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write('{"row_index": 0, "row": {}}\n')
+
+        with pytest.raises(ValueError, match="not a load recording"):
+            list(read_load_recording(path))
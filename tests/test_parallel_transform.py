@@ -0,0 +1,81 @@
+"""
+Unit tests for the multi-process transform.
+"""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.pipeline.etl_to_graph import normalize_dataframe
+from src.pipeline.parallel_transform import ParallelTransformer, split_rows
+from tests.test_vectorized_transform import random_frame
+
+
+class TestSplitRows:
+    """Test cases for split_rows function."""
+
+    def test_contiguous_chunks_in_order(self):
+        df = random_frame(10, 0)
+        chunks = split_rows(df, 3, 2)
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 4]
+        pd.testing.assert_frame_equal(pd.concat(chunks), df)
+
+    def test_min_chunk_rows_limits_chunks(self):
+        assert len(split_rows(random_frame(10, 0), 8, 4)) == 2
+        assert len(split_rows(random_frame(3, 0), 8, 4)) == 1
+
+    def test_empty_frame(self):
+        chunks = split_rows(random_frame(0, 0), 4, 1)
+        assert len(chunks) == 1
+        assert chunks[0].empty
+
+
+@pytest.fixture(scope='module')
+def transformer():
+    """Shared 2-process transformer (spawning workers is slow)."""
+    with ParallelTransformer(2, min_chunk_rows=10) as shared:
+        yield shared
+
+
+class TestParallelTransformer:
+    """Test cases for ParallelTransformer."""
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError, match="workers"):
+            ParallelTransformer(0)
+
+    def test_matches_single_process(self, transformer):
+        df = random_frame(120, 1)
+        pd.testing.assert_frame_equal(transformer.normalize(df), normalize_dataframe(df))
+
+    def test_reused_for_several_frames(self, transformer):
+        for seed in range(3):
+            df = random_frame(30 + seed, seed)
+            pd.testing.assert_frame_equal(transformer.normalize(df), normalize_dataframe(df))
+
+    def test_small_frames_stay_in_process(self, transformer):
+        df = random_frame(15, 2)
+
+        with patch.object(transformer._executor, 'map') as mock_map:
+            result = transformer.normalize(df)
+
+        mock_map.assert_not_called()
+        pd.testing.assert_frame_equal(result, normalize_dataframe(df))
+
+    def test_single_worker_runs_in_process(self):
+        df = random_frame(40, 4)
+
+        with ParallelTransformer(1, min_chunk_rows=10) as single:
+            assert single._executor is None
+            pd.testing.assert_frame_equal(single.normalize(df), normalize_dataframe(df))
+
+    def test_transform_runs_inference_in_process(self, transformer):
+        df = random_frame(40, 3)
+
+        with patch('src.pipeline.parallel_transform.infer_problems', side_effect=lambda frame: frame) as mock_infer:
+            result = transformer.transform(df)
+
+        mock_infer.assert_called_once()
+        pd.testing.assert_frame_equal(result, normalize_dataframe(df))
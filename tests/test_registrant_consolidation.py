@@ -0,0 +1,122 @@
+"""
+Unit tests for pre-load consolidation of repeated registrations.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.pipeline.etl_to_graph import build_load_records, build_phase_frames
+from src.pipeline.registrant_consolidation import consolidate_registrants, email_keys
+
+
+def registrations():
+    return pd.DataFrame({
+        'name': ['Ana', 'Luis', 'Ana P.', None, 'No Email'],
+        'email': ['ana@example.com', 'luis@example.com', ' ANA@example.com', 'ana@example.com', None],
+        'role': ['Developer', None, None, 'Lead', None],
+        'organization': ['Qnow', None, None, 'Tech Corp', 'Other Org'],
+        'industry_sector': ['Tecnología', None, None, None, 'Academia'],
+        'quantum_experience': ['active', 'academic', None, 'exploration', None],
+        'interests_list': [['QML', 'Finanzas'], [], ['Finanzas', 'Química'], ['Optimización'], ['QML']],
+        'problems_list': [['Falta de networking'], [], [], ['Falta de networking', 'Falta de talento'], []],
+    }, index=[10, 11, 12, 13, 14])
+
+
+def relationship_rows(df):
+    frames = build_phase_frames(build_load_records(df))
+    # Consolidated records carry the latest experience level
+    frames['has_experience_in'] = frames['has_experience_in'][['email', 'domain']]
+    return {
+        phase: sorted(map(tuple, frame.drop_duplicates().values.tolist()))
+        for phase, frame in frames.items() if phase != 'persons'
+    }
+
+
+class TestEmailKeys:
+    """Test cases for email_keys function."""
+
+    def test_trimmed_and_lowercased(self):
+        keys = email_keys(pd.Series([' Ana@Example.com ', None, '', np.nan, '   ']))
+        assert keys.tolist() == ['ana@example.com', None, None, None, None]
+
+
+class TestConsolidateRegistrants:
+    """Test cases for consolidate_registrants function."""
+
+    def test_without_repeated_emails_returns_input(self):
+        df = registrations().iloc[[0, 1, 4]]
+
+        consolidated, stats = consolidate_registrants(df)
+
+        assert consolidated is df
+        assert stats == {
+            'rows_in': 3, 'rows_out': 3, 'persons_consolidated': 0,
+            'writes_eliminated': 0, 'entries_eliminated': 0,
+        }
+
+    def test_merges_rows_per_person_and_organization(self):
+        consolidated, stats = consolidate_registrants(registrations())
+
+        assert consolidated.index.tolist() == [10, 11, 12, 14]
+        ana = consolidated.loc[[10, 12]]
+        # Person fields: last non-null value of all the person's rows
+        assert ana['name'].tolist() == ['Ana P.', 'Ana P.']
+        assert ana['role'].tolist() == ['Lead', 'Lead']
+        assert ana['quantum_experience'].tolist() == ['exploration', 'exploration']
+        # One record per organization; the row without one joins the latest
+        assert ana['organization'].tolist() == ['Qnow', 'Tech Corp']
+        assert ana['industry_sector'].tolist() == ['Tecnología', None]
+        assert ana['interests_list'].tolist() == [['QML', 'Finanzas'], ['Finanzas', 'Química', 'Optimización']]
+        assert ana['problems_list'].tolist() == [
+            ['Falta de networking'], ['Falta de networking', 'Falta de talento']
+        ]
+        # Other rows are untouched
+        pd.testing.assert_frame_equal(consolidated.loc[[11, 14]], registrations().loc[[11, 14]])
+        assert stats['writes_eliminated'] == 1
+        assert stats['persons_consolidated'] == 1
+
+    def test_email_of_first_registration_is_kept(self):
+        """Test that the MERGE key does not follow the casing of later registrations."""
+        df = pd.DataFrame({
+            'email': ['John@Example.com', 'JOHN@example.com', 'john@example.com'],
+            'organization': ['Qnow', 'Qnow', None],
+        })
+
+        first_run, _ = consolidate_registrants(df.iloc[:2])
+        second_run, _ = consolidate_registrants(df)
+
+        assert first_run['email'].tolist() == ['John@Example.com']
+        assert second_run['email'].tolist() == ['John@Example.com']
+
+    def test_repeated_entries_are_counted(self):
+        df = pd.DataFrame({
+            'email': ['ana@example.com', 'ana@example.com', 'ana@example.com'],
+            'organization': ['Qnow', 'Qnow', None],
+            'interests_list': [['QML'], ['QML', 'Finanzas'], ['QML']],
+            'problems_list': [[], [], ['Falta de networking']],
+        })
+
+        consolidated, stats = consolidate_registrants(df)
+
+        assert consolidated['interests_list'].tolist() == [['QML', 'Finanzas']]
+        assert consolidated['problems_list'].tolist() == [['Falta de networking']]
+        assert stats['rows_out'] == 1
+        assert stats['writes_eliminated'] == 2
+        # One organization and two QML entries
+        assert stats['entries_eliminated'] == 3
+
+    def test_input_is_not_modified(self):
+        df = registrations()
+
+        consolidate_registrants(df)
+
+        pd.testing.assert_frame_equal(df, registrations())
+
+    def test_same_relationships_as_row_by_row_load(self):
+        """Test that consolidation removes writes, not relationships."""
+        df = registrations()
+        df['email'] = df['email'].str.strip().str.lower()
+
+        consolidated, _ = consolidate_registrants(df)
+
+        assert relationship_rows(consolidated) == relationship_rows(df)
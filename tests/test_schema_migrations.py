@@ -0,0 +1,79 @@
+"""
+Unit tests for the schema migration step.
+"""
+
+from unittest.mock import MagicMock
+
+from src.pipeline.schema_migrations import (
+    SCHEMA_MIGRATIONS,
+    apply_schema_migrations,
+    get_applied_migrations,
+)
+
+
+def make_session(applied_versions):
+    """Build a mock session whose migration history holds applied_versions."""
+    session = MagicMock()
+
+    def run(query, **params):
+        if query.startswith("MATCH (m:SchemaMigration)"):
+            return [{'version': version} for version in applied_versions]
+        return MagicMock()
+
+    session.run.side_effect = run
+    return session
+
+
+def executed_queries(session):
+    """Return the Cypher text of every query run on the mock session."""
+    return [call.args[0] for call in session.run.call_args_list]
+
+
+class TestApplySchemaMigrations:
+    """Test cases for apply_schema_migrations function."""
+
+    def test_constraints_cover_merge_keys(self):
+        """Test that every MERGE key of the load query has a uniqueness constraint."""
+        statements = " ".join(SCHEMA_MIGRATIONS[0]['statements'])
+
+        assert "(p:Person) REQUIRE p.email IS UNIQUE" in statements
+        assert "(o:Organization) REQUIRE o.name IS UNIQUE" in statements
+        assert "(d:Domain) REQUIRE d.name IS UNIQUE" in statements
+        assert "(pr:Problem) REQUIRE pr.name IS UNIQUE" in statements
+        assert all("IF NOT EXISTS" in s for s in SCHEMA_MIGRATIONS[0]['statements'])
+
+    def test_apply_pending_migrations(self):
+        """Test that pending migrations run and are recorded with their duration."""
+        session = make_session(applied_versions=[])
+
+        result = apply_schema_migrations(session)
+
+        assert [m['version'] for m in result['applied']] == [1]
+        assert result['applied'][0]['duration_ms'] >= 0
+        assert result['already_applied'] == []
+
+        queries = executed_queries(session)
+        for statement in SCHEMA_MIGRATIONS[0]['statements']:
+            assert statement in queries
+        record_calls = [
+            call for call in session.run.call_args_list
+            if "MERGE (m:SchemaMigration" in call.args[0]
+        ]
+        assert len(record_calls) == 1
+        assert record_calls[0].kwargs['version'] == 1
+        assert any("db.awaitIndexes" in q for q in queries)
+
+    def test_skip_applied_migrations(self):
+        """Test that recorded migrations are not re-applied."""
+        session = make_session(applied_versions=[1])
+
+        result = apply_schema_migrations(session)
+
+        assert result['applied'] == []
+        assert result['already_applied'] == [1]
+        assert len(session.run.call_args_list) == 1  # Only the history lookup
+
+    def test_get_applied_migrations(self):
+        """Test reading the migration history."""
+        session = make_session(applied_versions=[1, 2])
+        assert get_applied_migrations(session) == {1, 2}
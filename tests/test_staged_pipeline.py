@@ -0,0 +1,79 @@
+"""
+Unit tests for the producer/consumer stage runner.
+"""
+
+import threading
+
+import pytest
+
+from src.pipeline.staged_pipeline import run_staged_pipeline
+
+
+class TestRunStagedPipeline:
+    """Test cases for run_staged_pipeline function."""
+
+    def test_chunks_flow_through_stages_in_order(self):
+        """Test that every chunk passes every stage and reaches the sink in order."""
+        loaded = []
+
+        stats = run_staged_pipeline(
+            range(5),
+            [('double', lambda x: x * 2), ('increment', lambda x: x + 1)],
+            loaded.append,
+            queue_size=1
+        )
+
+        assert loaded == [1, 3, 5, 7, 9]
+        assert list(stats) == ['extract', 'double', 'increment', 'load']
+        assert all(stage['items'] == 5 for stage in stats.values())
+        assert all(stage['max_queue_depth'] <= 1 for stage in list(stats.values())[1:])
+        assert 'max_queue_depth' not in stats['extract']
+
+    def test_load_overlaps_inference(self):
+        """Test that the first chunk is loaded while the next one is still in inference."""
+        first_loaded = threading.Event()
+        overlapped = []
+
+        def infer(chunk):
+            if chunk == 1:
+                # Only completes if the sink handles chunk 0 concurrently
+                overlapped.append(first_loaded.wait(timeout=5))
+            return chunk
+
+        def load(chunk):
+            if chunk == 0:
+                first_loaded.set()
+
+        run_staged_pipeline(range(2), [('inference', infer)], load)
+
+        assert overlapped == [True]
+
+    def test_stage_error_is_raised(self):
+        """Test that a failing stage stops the pipeline and re-raises its error."""
+        loaded = []
+
+        def infer(chunk):
+            if chunk == 2:
+                raise RuntimeError("LLM unavailable")
+            return chunk
+
+        with pytest.raises(RuntimeError, match="LLM unavailable"):
+            run_staged_pipeline(range(100), [('inference', infer)], loaded.append)
+
+        assert 2 not in loaded
+        assert len(loaded) < 100
+
+    def test_sink_error_is_raised(self):
+        """Test that a failing sink stops the upstream stages."""
+        def load(chunk):
+            raise ValueError("write failed")
+
+        with pytest.raises(ValueError, match="write failed"):
+            run_staged_pipeline(iter(range(1000)), [('transform', lambda x: x)], load)
+
+        assert not any(t.name.startswith('etl-') for t in threading.enumerate())
+
+    def test_invalid_queue_size(self):
+        """Test that queue_size must be positive."""
+        with pytest.raises(ValueError):
+            run_staged_pipeline([], [], lambda chunk: None, queue_size=0)
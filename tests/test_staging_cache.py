@@ -0,0 +1,82 @@
+"""
+Unit tests for the Parquet staging cache.
+"""
+
+import pyarrow as pa
+import pytest
+
+from src.pipeline.staging_cache import (
+    file_sha256,
+    load_staged_frame,
+    read_staged_table,
+    staging_cache_path,
+    write_staged_frame,
+)
+
+
+@pytest.fixture
+def transformed_frame(sample_normalized_data):
+    """Transformed frame with list and dictionary columns."""
+    frame = sample_normalized_data.copy()
+    frame['problems_list'] = [['Optimización'], [], ['Falta de networking']]
+    frame['llm_problem_inference'] = [
+        {'problem_category': 'Optimización', 'confidence': 0.9},
+        {'problem_category': 'SIN IDENTIFICAR PROBLEMA', 'confidence': 0.0},
+        {'problem_category': 'Falta de networking', 'confidence': 0.7, 'thought': 'x'},
+    ]
+    return frame.set_axis([5, 6, 7])
+
+
+class TestStagingCache:
+    """Test cases for the staging cache functions."""
+
+    def test_cache_path_depends_on_content_and_version(self, tmp_path):
+        """Test that the cache key changes with the file content and transform version."""
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("a,b\n1,2\n", encoding='utf-8')
+        first = staging_cache_path(tmp_path, csv_file, 1)
+
+        assert first.name == f"data-{file_sha256(csv_file)[:16]}-t1.parquet"
+        assert staging_cache_path(tmp_path, csv_file, 2) != first
+
+        csv_file.write_text("a,b\n1,3\n", encoding='utf-8')
+        assert staging_cache_path(tmp_path, csv_file, 1) != first
+
+    def test_round_trip(self, tmp_path, transformed_frame):
+        """Test that lists, dictionaries and row labels survive the cache."""
+        cache_file = tmp_path / "cache" / "data.parquet"
+
+        write_staged_frame(transformed_frame, cache_file)
+        cached = load_staged_frame(cache_file)
+
+        assert list(cached.index) == [5, 6, 7]
+        assert list(cached.columns) == list(transformed_frame.columns)
+        assert cached['interests_list'].tolist() == transformed_frame['interests_list'].tolist()
+        assert cached['problems_list'].tolist() == [['Optimización'], [], ['Falta de networking']]
+        assert cached['llm_problem_inference'].tolist() == (
+            transformed_frame['llm_problem_inference'].tolist()
+        )
+        assert cached['email'].tolist() == transformed_frame['email'].tolist()
+        assert list(cache_file.parent.iterdir()) == [cache_file]
+
+    def test_read_table_without_pandas(self, tmp_path, transformed_frame):
+        """Test that analytics readers get the requested columns as an Arrow table."""
+        cache_file = tmp_path / "data.parquet"
+        write_staged_frame(transformed_frame, cache_file)
+
+        table = read_staged_table(cache_file, columns=['email', 'problems_list'])
+
+        assert isinstance(table, pa.Table)
+        assert table.column_names == ['email', 'problems_list']
+        assert pa.types.is_list(table.schema.field('problems_list').type)
+        assert table.column('problems_list').to_pylist() == [
+            ['Optimización'], [], ['Falta de networking']
+        ]
+
+    def test_missing_or_corrupt_cache_is_a_miss(self, tmp_path):
+        """Test that absent and unreadable cache files are treated as misses."""
+        cache_file = tmp_path / "data.parquet"
+        assert load_staged_frame(cache_file) is None
+
+        cache_file.write_bytes(b"not parquet")
+        assert load_staged_frame(cache_file) is None
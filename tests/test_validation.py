@@ -0,0 +1,121 @@
+"""
+Unit tests for vectorized validation and the quarantine file.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipeline.validation import (
+    FIELD_TOO_LONG,
+    INVALID_EMAIL,
+    INVALID_LIST,
+    LIST_TOO_LONG,
+    MAX_LIST_ITEM_LENGTH,
+    MAX_LIST_ITEMS,
+    MISSING_EMAIL,
+    VALIDATION_REASONS,
+    QuarantineFile,
+    failure_reasons,
+    read_quarantine,
+    validate_dataframe,
+)
+
+
+def transformed_rows():
+    return pd.DataFrame({
+        'name': ['Ana', 'Luis', 'Eva', 'Max', 'Sol', 'X' * 201],
+        'email': ['ana@example.com', None, 'eva@example', ' max@example.com ', '   ', 'x@example.com'],
+        'organization': ['Qnow', None, None, None, None, None],
+        'interests_list': [['QML'], [], ['QML'], 'QML', ['Q'] * (MAX_LIST_ITEMS + 1), []],
+        'problems_list': [[], [], [], [], [], [1]],
+    }, index=[10, 11, 12, 13, 14, 15])
+
+
+class TestValidateDataframe:
+    """Test cases for validate_dataframe function."""
+
+    def test_reason_columns(self):
+        failures = validate_dataframe(transformed_rows())
+        assert list(failures.columns) == VALIDATION_REASONS
+        assert list(failures.index) == [10, 11, 12, 13, 14, 15]
+
+    def test_checks(self):
+        failures = validate_dataframe(transformed_rows())
+        assert failures[MISSING_EMAIL].tolist() == [False, True, False, False, True, False]
+        assert failures[INVALID_EMAIL].tolist() == [False, False, True, False, False, False]
+        assert failures[INVALID_LIST].tolist() == [False, False, False, True, False, True]
+        assert failures[LIST_TOO_LONG].tolist() == [False, False, False, False, True, False]
+        assert failures[FIELD_TOO_LONG].tolist() == [False, False, False, False, False, True]
+
+    @pytest.mark.parametrize('email', ['a b@example.com', 'a@@example.com', '@example.com', 'a@.com'])
+    def test_invalid_emails(self, email):
+        failures = validate_dataframe(pd.DataFrame({'email': [email]}))
+        assert failures[INVALID_EMAIL].tolist() == [True]
+
+    def test_non_string_email_is_invalid(self):
+        failures = validate_dataframe(pd.DataFrame({'email': [42, np.nan]}))
+        assert failures[INVALID_EMAIL].tolist() == [True, False]
+        assert failures[MISSING_EMAIL].tolist() == [False, True]
+
+    def test_list_entries(self):
+        """Test the list checks on mixed entries, with repeated row labels."""
+        df = pd.DataFrame({'email': 'a@example.com', 'interests_list': [
+            [np.str_('QML')], [None], ['QML', 2], ('QML',), None, [], ['Q' * (MAX_LIST_ITEM_LENGTH + 1)],
+            [None, 'Q' * (MAX_LIST_ITEM_LENGTH + 1)],
+        ]}, index=[1, 1, 2, 2, 3, 3, 4, 4])
+
+        failures = validate_dataframe(df)
+
+        assert failures[INVALID_LIST].tolist() == [False, True, True, True, True, False, False, True]
+        assert failures[LIST_TOO_LONG].tolist() == [False, False, False, False, False, False, True, False]
+
+    def test_categorical_columns(self):
+        df = transformed_rows().astype({'organization': 'category'})
+        assert validate_dataframe(df).equals(validate_dataframe(transformed_rows()))
+
+    def test_missing_email_column(self):
+        failures = validate_dataframe(pd.DataFrame({'name': ['Ana']}))
+        assert failures[MISSING_EMAIL].tolist() == [True]
+
+
+class TestFailureReasons:
+    """Test cases for failure_reasons function."""
+
+    def test_failing_rows_only(self):
+        reasons = failure_reasons(validate_dataframe(transformed_rows()))
+        assert reasons == [
+            [MISSING_EMAIL], [INVALID_EMAIL], [INVALID_LIST],
+            [MISSING_EMAIL, LIST_TOO_LONG], [INVALID_LIST, FIELD_TOO_LONG],
+        ]
+
+
+class TestQuarantineFile:
+    """Test cases for QuarantineFile class."""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / 'out' / 'quarantine.jsonl'
+        with QuarantineFile(path) as quarantine:
+            quarantine.write_rows([
+                (np.int64(3), [INVALID_EMAIL], None, {'email': 'eva@example', 'size': np.int64(2)}),
+                (7, ['load_error'], 'Constraint violation', None),
+            ])
+        
+        assert quarantine.rows_written == 2
+        assert quarantine.reason_counts == {INVALID_EMAIL: 1, 'load_error': 1}
+        assert read_quarantine(path) == [
+            {'row_index': 3, 'reasons': [INVALID_EMAIL], 'error': None,
+             'row': {'email': 'eva@example', 'size': 2}},
+            {'row_index': 7, 'reasons': ['load_error'], 'error': 'Constraint violation', 'row': None},
+        ]
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_written_after_failure(self, tmp_path):
+        path = tmp_path / 'quarantine.jsonl'
+        with pytest.raises(RuntimeError):
+            with QuarantineFile(path) as quarantine:
+                quarantine.write_rows([(1, [MISSING_EMAIL], None, {})])
+                raise RuntimeError("load failed")
+        
+        assert len(read_quarantine(path)) == 1
+        assert list(tmp_path.iterdir()) == [path]
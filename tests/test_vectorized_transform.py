@@ -0,0 +1,240 @@
+"""
+Parity tests for the vectorized transform engine.
+
+Every column function must return exactly what the per-cell function of
+etl_to_graph returns for the same value.
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.llm_service import build_contextual_text
+from src.pipeline.etl_to_graph import (
+    clean_text,
+    infer_problems_from_expectations,
+    normalize_dataframe,
+    normalize_linkedin_url,
+    normalize_quantum_experience,
+    parse_interests,
+)
+from src.pipeline import vectorized_transform
+from src.pipeline.vectorized_transform import (
+    _combine_codes,
+    _encode,
+    build_contextual_text_column,
+    clean_text_column,
+    infer_problems_from_expectations_column,
+    normalize_linkedin_url_column,
+    normalize_quantum_experience_column,
+    parse_interests_column,
+)
+
+
+TEXT_VALUES = [
+    'John Doe', '  padded  ', '', '   ', None, np.nan, 'nan', ' NaN ', 'None',
+    42, 3.5, 'ñandú', '\tTabbed\n', 'a ',
+]
+
+LINKEDIN_VALUES = [
+    'https://www.linkedin.com/in/johndoe/', 'http://linkedin.com/in/johndoe',
+    'https://linkedin.com/johndoe', 'https://www.linkedin.com', 'https://www.LinkedIn.com/in/x',
+    'https://example.com/in/johndoe', 'https://www.linkedin.com/in/johndoe?trk=abc',
+    'https://www.linkedin.com/in/john;doe', 'https://[::1]/in/johndoe', 'https://[bad/in/x',
+    'https://www.linkedin.com/in/jo\thn', 'https://linkedin.com//in//x//', 'https://user@linkedin.com:443/in/x',
+    'HTTPS://www.linkedin.com/in/x', 'https://ñ.linkedin.com/in/x', 'https://www.linkedin.com/in/josé',
+    'www.linkedin.com/in/janesmith', 'linkedin.com/in/janesmith/', 'www.linkedin.com/janesmith',
+    'linkedin.com', 'www.linkedin.com.ar/in/x', 'johndoe', 'john doe', 'john/doe', '',
+    '  ', None, np.nan, 'nan', 12345,
+]
+
+EXPERIENCE_VALUES = [
+    'Sí, actualmente en proyectos activos', 'Sí, en etapa de exploración / piloto',
+    'No, solo como interés académico / general', 'No, pero me interesa iniciar',
+    'No, pero me interesa entender su aplicación potencial en la industria',
+    'PILOTO', 'Exploracion', 'algo distinto', '', '  ', None, np.nan, 7,
+]
+
+INTEREST_VALUES = [
+    'Investigación académica, Casos de uso en Finanzas', 'Desarrollo de software / algoritmos',
+    ' a ,, b , nan, NaN ,c ', ',', '', '   ', None, np.nan, 'nan', 5, 'solo',
+]
+
+
+def random_frame(rows, seed):
+    """Build a raw survey frame by sampling the edge-case values."""
+    rng = random.Random(seed)
+    expectations = [
+        'Conocer aplicaciones', '  networking y contactos ', '', None, 'nan', 'Quiero ideas',
+    ]
+    return pd.DataFrame({
+        'Nombre completo': [rng.choice(TEXT_VALUES) for _ in range(rows)],
+        'Correo electrónico': [rng.choice([f'user{i}@example.com', None, ' ']) for i in range(rows)],
+        'Organización / Empresa': [rng.choice(TEXT_VALUES) for _ in range(rows)],
+        'Cargo / Rol': [rng.choice(TEXT_VALUES) for _ in range(rows)],
+        'Sector al que pertenece su organización': [rng.choice(TEXT_VALUES) for _ in range(rows)],
+        'Interés principal en Computación Cuántica - (Seleccionar una o más)': [
+            rng.choice(INTEREST_VALUES) for _ in range(rows)
+        ],
+        '¿Ha trabajado previamente con tecnologías cuánticas?': [
+            rng.choice(EXPERIENCE_VALUES) for _ in range(rows)
+        ],
+        '¿Qué espera obtener de este evento?': [rng.choice(expectations) for _ in range(rows)],
+        'LinkedIn': [rng.choice(LINKEDIN_VALUES) for _ in range(rows)],
+        'Timestamp': ['2024-01-01 10:00:00'] * rows,
+    }, index=pd.RangeIndex(100, 100 + rows))
+
+
+def assert_same_values(actual, expected):
+    assert actual.dtype == object
+    assert actual.index.equals(expected.index)
+    assert actual.tolist() == expected.tolist()
+
+
+class TestColumnParity:
+    """Test that each column function matches its per-cell function."""
+
+    def test_clean_text(self):
+        series = pd.Series(TEXT_VALUES, dtype=object)
+        assert_same_values(clean_text_column(series), series.apply(clean_text))
+
+    def test_linkedin_url(self):
+        series = pd.Series(LINKEDIN_VALUES, dtype=object)
+        assert_same_values(
+            normalize_linkedin_url_column(series), series.apply(normalize_linkedin_url)
+        )
+
+    def test_quantum_experience(self):
+        series = pd.Series(EXPERIENCE_VALUES, dtype=object)
+        assert_same_values(
+            normalize_quantum_experience_column(series),
+            series.apply(normalize_quantum_experience)
+        )
+
+    def test_interests(self):
+        series = pd.Series(INTEREST_VALUES, dtype=object, index=list('abcdefghijk'))
+        assert_same_values(parse_interests_column(series), series.apply(parse_interests))
+
+    def test_interests_lists_are_independent(self):
+        """Test that rows without interests do not share one list object."""
+        result = parse_interests_column(pd.Series([None, None], dtype=object))
+        result.iloc[0].append('x')
+        assert result.iloc[1] == []
+
+    def test_problems_from_expectations(self):
+        expectations = pd.Series(
+            ['Conocer aplicaciones', 'Networking', ' ', None, np.nan, 'Algo', '', 3] * 2,
+            dtype=object
+        )
+        experience = pd.Series(['industry_interest', None] * 8, dtype=object)
+        expected = pd.Series([
+            infer_problems_from_expectations(value, qe) for value, qe in zip(expectations, experience)
+        ])
+        assert_same_values(
+            infer_problems_from_expectations_column(expectations, experience), expected
+        )
+        assert_same_values(
+            infer_problems_from_expectations_column(expectations),
+            expectations.apply(infer_problems_from_expectations)
+        )
+
+    def test_contextual_text(self):
+        df = pd.DataFrame({
+            'event_expectations': ['Conocer', None, None, 'Ideas'],
+            'quantum_experience': ['active', None, 'custom', None],
+            'interests_list': [['A', 'B'], [], ['C'], []],
+            'industry_sector': [None, None, 'Finanzas', None],
+            'role': ['CTO', None, None, None],
+        })
+        expected = df.apply(
+            lambda row: build_contextual_text(
+                event_expectations=row.get('event_expectations'),
+                quantum_experience=row.get('quantum_experience'),
+                interests=row.get('interests_list', []),
+                industry_sector=row.get('industry_sector'),
+                role=row.get('role')
+            ),
+            axis=1
+        )
+        assert_same_values(build_contextual_text_column(df), expected)
+
+
+class TestNormalizeDataframeParity:
+    """Test that both engines of normalize_dataframe give identical frames."""
+
+    @pytest.mark.parametrize('seed', [0, 1, 2])
+    def test_random_frames(self, seed):
+        df = random_frame(300, seed)
+        pd.testing.assert_frame_equal(
+            normalize_dataframe(df, engine='vectorized'),
+            normalize_dataframe(df, engine='python')
+        )
+
+    def test_sample_data(self, sample_csv_data):
+        pd.testing.assert_frame_equal(
+            normalize_dataframe(sample_csv_data, engine='vectorized'),
+            normalize_dataframe(sample_csv_data, engine='python')
+        )
+
+    def test_missing_optional_columns(self):
+        df = pd.DataFrame({'Nombre completo': [' Ana ', None], 'Cargo / Rol': ['CTO', ' ']})
+        pd.testing.assert_frame_equal(
+            normalize_dataframe(df, engine='vectorized'),
+            normalize_dataframe(df, engine='python')
+        )
+
+    def test_all_missing_values(self):
+        df = random_frame(3, 0).iloc[:, :0].assign(**{
+            'LinkedIn': [None] * 3,
+            '¿Ha trabajado previamente con tecnologías cuánticas?': [np.nan] * 3,
+            'Interés principal en Computación Cuántica - (Seleccionar una o más)': [''] * 3,
+        })
+        pd.testing.assert_frame_equal(
+            normalize_dataframe(df, engine='vectorized'),
+            normalize_dataframe(df, engine='python')
+        )
+
+    def test_repetitive_string_frames(self):
+        """Test the dictionary-encoded path (string-only, repetitive columns)."""
+        df = random_frame(2000, 3).apply(
+            lambda col: col.map(lambda value: value if isinstance(value, str) else None)
+        )
+        vectorized = normalize_dataframe(df, engine='vectorized')
+        pd.testing.assert_frame_equal(vectorized, normalize_dataframe(df, engine='python'))
+
+        lists = vectorized['interests_list'].tolist()
+        assert len({id(values) for values in lists}) == len(lists)
+
+    def test_without_pyarrow(self, monkeypatch):
+        monkeypatch.setattr(vectorized_transform, 'pa', None)
+        monkeypatch.setattr(vectorized_transform, 'pc', None)
+        df = random_frame(300, 4)
+        pd.testing.assert_frame_equal(
+            normalize_dataframe(df, engine='vectorized'),
+            normalize_dataframe(df, engine='python')
+        )
+
+    def test_invalid_engine(self):
+        with pytest.raises(ValueError, match="transform engine"):
+            normalize_dataframe(random_frame(1, 0), engine='numba')
+
+
+class TestDictionaryEncoding:
+    """Test the helpers of the dictionary-encoded path."""
+
+    def test_encode_strings(self):
+        codes, distinct = _encode(pd.Series(['b', None, 'a', 'b', np.nan]))
+        assert list(distinct[codes]) == ['b', None, 'a', 'b', None]
+
+    def test_encode_rejects_mixed_values(self):
+        """Test that 1 and 1.0 are not merged (their str() differs)."""
+        assert _encode(pd.Series([1, 1.0, 'a'])) is None
+
+    def test_combine_codes(self):
+        first_column = _encode(pd.Series(['a', 'a', 'b', 'a']))
+        second_column = _encode(pd.Series(['x', 'y', 'x', 'x']))
+        combination, first = _combine_codes([first_column, second_column], 4)
+        assert list(combination) == [0, 1, 2, 0]
+        assert list(first) == [0, 1, 2]
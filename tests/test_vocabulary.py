@@ -0,0 +1,195 @@
+"""
+Unit tests for categorical and interned column representations.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipeline.etl_to_graph import (
+    build_load_records,
+    build_phase_frames,
+    partition_frame,
+    prepare_row_for_neo4j,
+)
+from src.pipeline.registrant_consolidation import consolidate_registrants
+from src.pipeline.vocabulary import (
+    CODE_COLUMNS,
+    Vocabulary,
+    compact_dataframe,
+    decode_dataframe,
+    flatten_code_lists,
+)
+
+
+def transformed_frame():
+    return pd.DataFrame({
+        'name': ['Ana', 'Luis', 'Eva'],
+        'email': ['ana@example.com', 'luis@example.com', 'eva@example.com'],
+        'organization': ['Tech Corp', None, 'Tech Corp'],
+        'industry_sector': ['Tecnología', None, 'Tecnología'],
+        'quantum_experience': ['active', 'academic', None],
+        # Equal names as distinct string objects, like parse_interests returns
+        'interests_list': [[''.join(['Fin', 'anzas'])], [], ['Finanzas', ' QML ']],
+        'problems_list': [['Falta de networking'], ['Falta de networking'], []],
+    })
+
+
+class TestVocabulary:
+    """Test cases for Vocabulary."""
+
+    def test_codes_are_stable(self):
+        vocabulary = Vocabulary()
+        assert [vocabulary.code(name) for name in ['b', 'a', 'b']] == [0, 1, 0]
+        assert vocabulary.decode([1, 0]) == ['a', 'b']
+        assert len(vocabulary) == 2
+
+    def test_intern_lists_shares_strings(self):
+        vocabulary = Vocabulary()
+        series = pd.Series([[''.join(['a', 'b'])], [''.join(['a', 'b']), 'c'], None], index=[5, 6, 7])
+
+        interned = vocabulary.intern_lists(series)
+
+        assert interned.tolist() == [['ab'], ['ab', 'c'], []]
+        assert interned.index.equals(series.index)
+        assert interned[5][0] is interned[6][0]
+        assert interned[5] is not series[5]
+
+    def test_encode_lists(self):
+        vocabulary = Vocabulary()
+        codes, positions = vocabulary.encode_lists(pd.Series([['x', 'y'], [], None, ['y']]))
+
+        assert codes.tolist() == [0, 1, 1]
+        assert positions.tolist() == [0, 0, 3]
+
+    def test_code_lists_round_trip(self):
+        vocabulary = Vocabulary()
+        series = pd.Series([['x', 'y'], [], None, ['y']], index=[3, 4, 5, 6])
+
+        codes = vocabulary.code_lists(series)
+
+        assert codes.tolist() == [[0, 1], [], [], [1]]
+        assert codes.index.equals(series.index)
+        assert vocabulary.decode_lists(codes).tolist() == [['x', 'y'], [], [], ['y']]
+        flat, positions = flatten_code_lists(codes)
+        assert flat.tolist() == [0, 1, 1]
+        assert positions.tolist() == [0, 0, 3]
+
+
+class TestCompactDataframe:
+    """Test cases for compact_dataframe function."""
+
+    def test_categoricals_and_code_lists(self):
+        df = compact_dataframe(transformed_frame(), Vocabulary())
+
+        for col in ['organization', 'industry_sector', 'quantum_experience']:
+            assert isinstance(df[col].dtype, pd.CategoricalDtype)
+        assert df['name'].dtype == object
+        # The codes replace the name lists (one representation)
+        assert 'interests_list' not in df.columns and 'problems_list' not in df.columns
+        assert df['interests_codes'].tolist() == [[0], [], [0, 1]]
+        assert df['problems_codes'].tolist() == [[2], [2], []]
+
+    def test_decode_dataframe(self):
+        vocabulary = Vocabulary()
+        df = compact_dataframe(transformed_frame(), vocabulary)
+
+        decoded = decode_dataframe(df, vocabulary)
+
+        assert decoded['interests_list'].tolist() == [['Finanzas'], [], ['Finanzas', ' QML ']]
+        assert decoded['interests_list'][0][0] is decoded['interests_list'][2][0]
+        assert not set(CODE_COLUMNS.values()) & set(decoded.columns)
+        assert 'interests_codes' in df.columns
+
+    def test_vocabulary_shared_across_frames(self):
+        vocabulary = Vocabulary()
+        first = compact_dataframe(transformed_frame(), vocabulary)
+        second = compact_dataframe(transformed_frame(), vocabulary)
+
+        assert first['problems_codes'][0] == second['problems_codes'][1] == [2]
+        assert len(vocabulary) == 3
+
+    def test_prepare_row_maps_missing_categories_to_none(self):
+        vocabulary = Vocabulary()
+        df = decode_dataframe(compact_dataframe(transformed_frame(), vocabulary), vocabulary)
+
+        row = prepare_row_for_neo4j(df.iloc[1])
+
+        assert row['organization'] is None
+        assert row['industry_sector'] is None
+        assert row['quantum_experience'] == 'academic'
+        assert row['interests'] == []
+
+    def test_load_frames_unchanged(self):
+        """Test that the load records and phase frames do not depend on the representation."""
+        vocabulary = Vocabulary()
+        plain = build_load_records(transformed_frame())
+        compact = build_load_records(compact_dataframe(transformed_frame(), vocabulary), vocabulary)
+
+        pd.testing.assert_frame_equal(compact.drop(columns=list(CODE_COLUMNS.values())), plain)
+        plain_frames = build_phase_frames(plain)
+        compact_frames = build_phase_frames(compact, vocabulary)
+        for phase, frame in plain_frames.items():
+            pd.testing.assert_frame_equal(compact_frames[phase], frame)
+
+    def test_phase_frames_use_stored_codes(self):
+        """Test that the phase frames decode the stored codes with the shared vocabulary."""
+        vocabulary = Vocabulary()
+        compact_dataframe(transformed_frame(), vocabulary)
+        records = build_load_records(
+            compact_dataframe(transformed_frame().iloc[2:], vocabulary), vocabulary
+        )
+        # The names are not read when the codes are there
+        records['interests'] = [[]]
+
+        frames = build_phase_frames(records, vocabulary)
+
+        assert frames['has_interest'].values.tolist() == [
+            ['eva@example.com', 'Finanzas'],
+            ['eva@example.com', 'QML'],
+        ]
+
+    def test_consolidation_merges_codes(self):
+        vocabulary = Vocabulary()
+        df = compact_dataframe(
+            transformed_frame().assign(email='ana@example.com', organization='Tech Corp'), vocabulary
+        )
+
+        consolidated, _ = consolidate_registrants(df)
+
+        assert consolidated['interests_codes'].tolist() == [[0, 1]]
+        assert consolidated['problems_codes'].tolist() == [[2]]
+        assert decode_dataframe(consolidated, vocabulary)['interests_list'].tolist() == [
+            ['Finanzas', ' QML ']
+        ]
+
+    def test_compacted_records_need_the_vocabulary(self):
+        with pytest.raises(ValueError, match='vocabulary'):
+            build_load_records(compact_dataframe(transformed_frame(), Vocabulary()))
+
+
+class TestCodeBasedGrouping:
+    """Test the load helpers that group on codes."""
+
+    def test_phase_frames_trim_and_drop_empty_names(self):
+        records = build_load_records(transformed_frame().assign(
+            interests_list=[[' Finanzas ', '', None], [np.nan], ['Finanzas', ' QML ']]
+        ))
+
+        frames = build_phase_frames(records)
+
+        assert frames['domains']['name'].tolist() == ['Finanzas', 'QML']
+        assert frames['has_interest'].values.tolist() == [
+            ['ana@example.com', 'Finanzas'],
+            ['eva@example.com', 'Finanzas'],
+            ['eva@example.com', 'QML'],
+        ]
+
+    def test_partition_frame_is_stable_with_missing_keys(self):
+        frame = pd.DataFrame({'key': ['a', None, 'b', 'a', np.nan]})
+
+        partitions = partition_frame(frame, 'key', 3)
+
+        assert sorted(index for part in partitions for index in part.index) == [0, 1, 2, 3, 4]
+        bucket_of = {index: bucket for bucket, part in enumerate(partitions) for index in part.index}
+        assert bucket_of[0] == bucket_of[3]